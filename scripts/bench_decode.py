@@ -0,0 +1,93 @@
+"""
+Telemetry decode benchmark.
+
+Usage:
+    python -m scripts.bench_decode [--artifact path/to/telemetry.json] [--rounds 24] [--repeat 5]
+
+Decodes one telemetry artifact (a synthetic 24-round match unless --artifact is given) with
+each available backend and reports the best-of-N decode time and the peak Python heap
+allocated while decoding, then the same for a full `MatchParser` parse in streaming and
+fast-decode mode.
+"""
+
+import argparse
+import gc
+import io
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from src.ingest.cache import open_artifact
+from src.ingest.replay import synthetic_telemetry
+from src.parsers.valorant.events_parser import stream_events
+from src.parsers.valorant.match_parser import MatchParser
+from src.parsers.valorant.utils import DECODER_BACKEND, decode_telemetry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional backend
+    orjson = None  # type: ignore[assignment]
+
+
+def _measure(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+        del result
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {"seconds": best, "peak_mb": peak / 1024**2}
+
+
+def run_benchmark(data: bytes, repeat: int) -> List[Dict[str, Any]]:
+    parser = MatchParser()
+    fast_parser = MatchParser(streaming=False)
+    cases: List[tuple] = [
+        ("decode: json.loads (dicts)", lambda: json.loads(data)),
+        ("decode: TelemetryStream (dicts)", lambda: list(stream_events(io.BytesIO(data)))),
+        (f"decode: {DECODER_BACKEND} (typed)", lambda: decode_telemetry(data)),
+        ("parse:  streaming", lambda: parser.parse_match_stream(io.BytesIO(data))),
+        ("parse:  fast decode", lambda: fast_parser.parse_match_bytes(data)),
+    ]
+    if orjson is not None:
+        cases.insert(1, ("decode: orjson.loads (dicts)", lambda: orjson.loads(data)))
+
+    rows = []
+    for name, fn in cases:
+        row = {"case": name, **_measure(fn, repeat)}
+        rows.append(row)
+        print(f"{name:<34} {row['seconds'] * 1000:9.1f} ms  peak {row['peak_mb']:8.1f} MB")
+    return rows
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--artifact", type=Path, default=None, help="telemetry file to decode")
+    parser.add_argument("--rounds", type=int, default=24, help="rounds in the synthetic match")
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    if args.artifact is not None:
+        with open_artifact(args.artifact) as fh:
+            data = fh.read()
+    else:
+        telemetry = synthetic_telemetry("bench", "Ascent", ("a", "b"), rounds=args.rounds)
+        data = json.dumps(telemetry).encode("utf-8")
+    print(f"artifact: {len(data) / 1024**2:.1f} MB, fast backend: {DECODER_BACKEND}")
+    run_benchmark(data, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
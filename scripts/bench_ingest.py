@@ -0,0 +1,144 @@
+"""
+Ingest throughput benchmark against a local GRID stand-in.
+
+Usage:
+    python -m scripts.bench_ingest record --team <team id> [--n 20] [--store data/replay]
+    python -m scripts.bench_ingest synth --team demo [--n 20] [--store data/replay]
+    python -m scripts.bench_ingest run --team <team id> [--concurrency 1 4 8 16]
+        [--latency 0.05] [--bandwidth 5e6] [--error-rate 0.02] [--rate 20]
+
+`record` captures real GRID responses once (needs GRID_API_KEY), `synth` generates a
+comparable store offline, and `run` replays the store through `ingest_team` once per
+concurrency setting, each in a fresh process with an empty database and cache, reporting
+matches/second, the peak RSS of that process and the largest peak RSS among its parse
+workers.
+"""
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from scripts.ingest_last_n import ingest_team
+from src.db.duckdb_client import DuckDBClient
+from src.ingest.cache import ArtifactCache
+from src.ingest.grid_client import GridClient
+from src.ingest.pipeline import IngestPipeline
+from src.ingest.rate_limiter import DEFAULT_MAX_RATE, AdaptiveRateLimiter
+from src.ingest.replay import (
+    DEFAULT_REPLAY_DIR,
+    ReplayStore,
+    StandInServer,
+    build_synthetic_store,
+    record_team,
+)
+
+
+def _peak_rss_mb(who: int = resource.RUSAGE_SELF) -> float:
+    """Peak RSS of this process, or with `RUSAGE_CHILDREN` of its largest reaped child."""
+    peak = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_once(
+    base_url: str, team_id: str, count: int, concurrency: int, rate: float, results: Any
+) -> None:
+    """Runs one ingest in a child process and reports its timings through `results`."""
+    with tempfile.TemporaryDirectory() as workdir:
+        db = DuckDBClient(str(Path(workdir) / "bench.db"))
+        cache = ArtifactCache(Path(workdir) / "cache")
+        with GridClient(
+            api_key="replay",
+            base_url=f"{base_url}/query",
+            max_concurrency=concurrency,
+            cache=cache,
+            rate_limiter=AdaptiveRateLimiter(rate=rate, max_rate=max(rate, DEFAULT_MAX_RATE)),
+        ) as client:
+            started = time.perf_counter()
+            pipeline = IngestPipeline(client, db)
+            loaded = ingest_team(client, db, pipeline, team_id, count, full=True)
+            elapsed = time.perf_counter() - started
+            stats = client.rate_limiter.stats
+        results.put(
+            {
+                "concurrency": concurrency,
+                "matches": loaded,
+                "seconds": elapsed,
+                "matches_per_second": loaded / elapsed if elapsed else 0.0,
+                "peak_rss_mb": _peak_rss_mb(),
+                # Parsing runs in a process pool whose workers have exited by now.
+                "worker_peak_rss_mb": _peak_rss_mb(resource.RUSAGE_CHILDREN),
+                "throttled": stats.throttled,
+                "retries": stats.retries,
+            }
+        )
+
+
+def run_benchmark(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    store = ReplayStore(args.store)
+    ctx = multiprocessing.get_context("spawn")
+    rows = []
+    with StandInServer(
+        store,
+        latency=args.latency,
+        bandwidth=args.bandwidth,
+        error_rate=args.error_rate,
+        seed=0,
+    ) as server:
+        for concurrency in args.concurrency:
+            results = ctx.Queue()
+            proc = ctx.Process(
+                target=_run_once,
+                args=(server.url, args.team, args.n, concurrency, args.rate, results),
+            )
+            proc.start()
+            row = results.get()
+            proc.join()
+            rows.append(row)
+            print(
+                f"concurrency={row['concurrency']:>3}  matches={row['matches']:>4}  "
+                f"{row['seconds']:7.2f}s  {row['matches_per_second']:7.2f} matches/s  "
+                f"peak RSS {row['peak_rss_mb']:7.1f} MB "
+                f"(workers {row['worker_peak_rss_mb']:7.1f} MB)  "
+                f"throttled={row['throttled']} retries={row['retries']}"
+            )
+    return rows
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("mode", choices=("record", "synth", "run"))
+    parser.add_argument("--team", required=True, help="GRID team ID")
+    parser.add_argument("--n", type=int, default=20, help="series to record / ingest")
+    parser.add_argument("--store", default=DEFAULT_REPLAY_DIR)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per request")
+    parser.add_argument("--bandwidth", type=float, default=None, help="bytes/second")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate", type=float, default=20.0, help="initial requests/second")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    load_dotenv()
+    args = parse_args(argv)
+    if args.mode == "record":
+        with GridClient() as client:
+            matches = record_team(client, ReplayStore(args.store), args.team, args.n)
+        print(f"Recorded {matches} matches for {args.team} into {args.store}")
+    elif args.mode == "synth":
+        matches = build_synthetic_store(ReplayStore(args.store), args.team, args.n)
+        print(f"Generated {matches} matches for {args.team} into {args.store}")
+    else:
+        run_benchmark(args)
+
+
+if __name__ == "__main__":
+    main()
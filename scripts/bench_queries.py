@@ -0,0 +1,106 @@
+"""
+Query result-path benchmark.
+
+Usage:
+    python -m scripts.bench_queries [--matches 50] [--repeat 5]
+
+Loads the position and kill events of synthetic matches (24 rounds each) into a DuckDB
+table and reports the best-of-N time of the same queries returned through `.df()`
+(pandas), `query_arrow` and `query_polars`, then of a small parameterized lookup run
+repeatedly with and without the statement cache.
+"""
+
+import argparse
+import io
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pyarrow as pa
+
+from src.db.duckdb_client import DuckDBClient
+from src.ingest.replay import synthetic_telemetry
+from src.parsers.valorant.match_parser import MatchParser
+
+QUERIES = {
+    "full scan": "SELECT * FROM positions",
+    "one team, one map": (
+        "SELECT match_id, round_number, tick, player_id, x, y FROM positions "
+        "WHERE map_name = 'Bind' AND player_id LIKE 'sen-%'"
+    ),
+}
+LOOKUP = "SELECT count(*) AS n, avg(x) AS x FROM positions WHERE match_id = ? AND round_number = ?"
+
+
+def _best(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def load_events(db: DuckDBClient, matches: int) -> int:
+    parser = MatchParser()
+    positions = []
+    for i in range(matches):
+        map_name = ("Bind", "Ascent", "Lotus")[i % 3]
+        telemetry = synthetic_telemetry(f"m{i}", map_name, ("sen", "fnc"), seed=i)
+        batches = parser.parse_match_batches(io.BytesIO(json.dumps(telemetry).encode()))["batches"]
+        batch = batches["positions"]
+        positions.append(
+            pa.Table.from_batches([batch]).append_column(
+                "map_name", pa.array([map_name] * batch.num_rows)
+            )
+        )
+    with db.arrow_views({"_positions": pa.concat_tables(positions)}):
+        db.execute("CREATE OR REPLACE TABLE positions AS SELECT * FROM _positions")
+    return db.execute("SELECT count(*) FROM positions").fetchone()[0]
+
+
+def run_benchmark(db: DuckDBClient, repeat: int) -> List[Dict[str, Any]]:
+    rows = []
+    for name, sql in QUERIES.items():
+        for path, fn in (
+            (".df()", lambda: db.query(sql)),
+            ("query_arrow", lambda: db.query_arrow(sql)),
+            ("query_polars", lambda: db.query_polars(sql)),
+        ):
+            rows.append({"case": f"{name}: {path}", "seconds": _best(fn, repeat)})
+
+    def lookups(cached: bool) -> None:
+        for i in range(200):
+            params = [f"m{i % 10}", i % 24 + 1]
+            if cached:
+                db.execute(LOOKUP, params).fetchall()
+            else:
+                db.conn.execute(LOOKUP, params).fetchall()
+
+    rows.append({"case": "200 lookups: uncached", "seconds": _best(lambda: lookups(False), repeat)})
+    rows.append({"case": "200 lookups: cached", "seconds": _best(lambda: lookups(True), repeat)})
+    for row in rows:
+        print(f"{row['case']:<36} {row['seconds'] * 1000:9.1f} ms")
+    return rows
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--matches", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory() as workdir:
+        db = DuckDBClient(str(Path(workdir) / "bench.db"))
+        rows = load_events(db, args.matches)
+        print(f"positions: {rows:,} rows from {args.matches} matches")
+        run_benchmark(db, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Ingests the most recent series for one or more teams into the local DuckDB database.
+
+Usage:
+    python -m scripts.ingest_last_n --team <team id> [--team <team id> ...] [--n 20]
+
+Each team keeps a watermark (start time and ID of the newest ingested series), so repeat runs
+only fetch series played since the last run; --n only bounds the first run for a team. The
+watermark stops short of the oldest series with a failed or skipped match, so the next run
+retries it.
+Pass --full to ignore the watermark. After the run the database is copied to --snapshot, which
+the app reads (DuckDB lets no other process open the database while ingest writes to it).
+"""
+
+import argparse
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from dotenv import load_dotenv
+
+from src.db.duckdb_client import DEFAULT_SNAPSHOT_PATH, DuckDBClient
+from src.db.repositories.events_repo import DEFAULT_EVENTS_DIR, EventsRepository
+from src.ingest.cache import DEFAULT_CACHE_DIR, ArtifactCache
+from src.ingest.grid_client import DEFAULT_MAX_CONCURRENCY, GridClient, parse_start_time
+from src.ingest.pipeline import IngestPipeline
+from src.parsers.valorant.parse_cache import DEFAULT_PARSE_CACHE_DIR
+
+
+def ingest_team(
+    client: GridClient,
+    db: DuckDBClient,
+    pipeline: IngestPipeline,
+    team_id: str,
+    count: int,
+    full: bool = False,
+) -> int:
+    """
+    Ingests new series for `team_id` and advances its watermark if every match loaded.
+    Returns the number of matches loaded.
+    """
+    watermark = None if full else db.get_watermark(team_id)
+    if watermark is None:
+        series = client.get_series_for_team(team_id, count=count)
+    else:
+        # Everything since the last run, however many pages that is, so no gap is left.
+        series = client.get_series_for_team(
+            team_id, count=None, since=watermark[0], since_id=watermark[1]
+        )
+    if not series:
+        print(f"[{team_id}] up to date")
+        return 0
+
+    matches = client.get_match_details_for_series(series)
+    result = pipeline.run(team_id, matches)
+    for match_id, error in result.failed:
+        print(f"[{team_id}] failed {match_id}: {error}")
+    for match_id, reason in result.skipped:
+        print(f"[{team_id}] skipped {match_id}: {reason}")
+    print(f"[{team_id}] {len(series)} new series, {result.loaded} matches loaded")
+    print(f"[{team_id}] {result.summary()}")
+
+    # A failed or skipped match (e.g. telemetry not published yet) would never be fetched
+    # again if the watermark moved past its series.
+    retry = {match_id for match_id, _ in result.failed + result.skipped}
+    watermark = watermark_before(series, retry)
+    if watermark is not None:
+        db.set_watermark(team_id, *watermark)
+    return result.loaded
+
+
+def watermark_before(
+    series: List[Dict[str, Any]], retry: Set[str]
+) -> Optional[Tuple[datetime, str]]:
+    """
+    (start time, ID) of the newest series older than every series containing a match in
+    `retry`, or None if there is no such series.
+    """
+    ordered = sorted(
+        (parse_start_time(node.get("startTime")), node["id"], node.get("matches") or [])
+        for node in series
+    )
+    watermark = None
+    for start_time, series_id, matches in ordered:
+        if any(match["id"] in retry for match in matches):
+            break
+        watermark = (start_time, series_id)
+    return watermark
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--team", action="append", required=True, help="GRID team ID")
+    parser.add_argument("--n", type=int, default=20, help="maximum series per team")
+    parser.add_argument("--db", default=os.getenv("DUCKDB_PATH", "data/scouting.db"))
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY)
+    parser.add_argument("--parse-workers", type=int, default=None, help="default: CPU count")
+    parser.add_argument(
+        "--parse-memory-mb", type=int, default=None, help="address-space cap per parse worker"
+    )
+    parser.add_argument(
+        "--parse-cache-dir",
+        default=DEFAULT_PARSE_CACHE_DIR,
+        help="reuse parse results of unchanged artifacts; pass '' to disable",
+    )
+    parser.add_argument(
+        "--events-dir",
+        default=DEFAULT_EVENTS_DIR,
+        help="Parquet event store to write event batches to; pass '' to disable",
+    )
+    parser.add_argument(
+        "--snapshot",
+        default=os.getenv("DUCKDB_SNAPSHOT_PATH", DEFAULT_SNAPSHOT_PATH),
+        help="read-only copy published for the app after the run; pass '' to disable",
+    )
+    parser.add_argument("--full", action="store_true", help="ignore stored watermarks")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    load_dotenv()
+    args = parse_args(argv)
+    db = DuckDBClient(args.db)
+    with GridClient(
+        max_concurrency=args.concurrency, cache=ArtifactCache(args.cache_dir)
+    ) as client:
+        pipeline = IngestPipeline(
+            client,
+            db,
+            parse_workers=args.parse_workers,
+            parse_memory_limit_mb=args.parse_memory_mb,
+            parse_cache_dir=args.parse_cache_dir or None,
+            events=EventsRepository(db, args.events_dir) if args.events_dir else None,
+        )
+        loaded = sum(
+            ingest_team(client, db, pipeline, team_id, args.n, full=args.full)
+            for team_id in args.team
+        )
+    if loaded:
+        # Batches are appended in order one by one; re-sort so zone maps span the whole table.
+        db.recluster()
+    if args.snapshot:
+        db.snapshot(args.snapshot)
+
+
+if __name__ == "__main__":
+    main()
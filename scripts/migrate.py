@@ -0,0 +1,52 @@
+"""
+Upgrades the local DuckDB database schema in place.
+
+Usage:
+    python -m scripts.migrate [--db data/scouting.db] [--to N] [--status] [--recluster]
+
+Applies the pending versions of `src/db/schema.sql` and `src/db/migrations/*.sql` (see
+`src.db.migrate`). --recluster re-sorts the tables by (team, map, start time) afterwards,
+which keeps zone maps effective as ingest appends rows out of order.
+"""
+
+import argparse
+import os
+from typing import List, Optional
+
+import duckdb
+from dotenv import load_dotenv
+
+from src.db.migrate import current_version, discover_migrations, migrate, recluster
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--db", default=os.getenv("DUCKDB_PATH", "data/scouting.db"))
+    parser.add_argument("--to", type=int, default=None, help="target version (default: latest)")
+    parser.add_argument("--status", action="store_true", help="show versions and exit")
+    parser.add_argument("--recluster", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    load_dotenv()
+    args = parse_args(argv)
+    os.makedirs(os.path.dirname(args.db) or ".", exist_ok=True)
+    conn = duckdb.connect(args.db)
+    migrations = discover_migrations()
+    if args.status:
+        version = current_version(conn)
+        for migration in migrations:
+            state = "applied" if migration.version <= version else "pending"
+            print(f"{migration.version:03d} {migration.name:<24} {state}")
+        return
+    applied = migrate(conn, target=args.to, migrations=migrations)
+    print(f"Applied {applied or 'nothing'}; now at version {current_version(conn)}")
+    # `migrate` already re-sorts after an upgrade that reaches the latest version.
+    if args.recluster and not (applied and applied[-1] == migrations[-1].version):
+        recluster(conn)
+        print("Re-sorted tables by team, map and start time")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Rebuilds the materialized report aggregates from the base tables.
+
+Usage:
+    python -m scripts.rebuild_aggregates [--db data/scouting.db]
+
+Ingest keeps `team_metrics` and `player_metrics` up to date incrementally; run this after
+changing their definitions or repairing base tables by hand.
+"""
+
+import argparse
+import os
+import time
+from typing import List, Optional
+
+from dotenv import load_dotenv
+
+from src.db.duckdb_client import DuckDBClient
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--db", default=os.getenv("DUCKDB_PATH", "data/scouting.db"))
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    load_dotenv()
+    args = parse_args(argv)
+    db = DuckDBClient(args.db)
+    started = time.perf_counter()
+    db.rebuild_aggregates()
+    counts = db.query(
+        "SELECT (SELECT count(*) FROM team_metrics) AS teams, "
+        "(SELECT count(*) FROM player_metrics) AS players"
+    ).iloc[0]
+    print(
+        f"Rebuilt {counts['teams']} team_metrics and {counts['players']} player_metrics rows "
+        f"in {time.perf_counter() - started:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Lists the slowest queries recorded by a DuckDB query log.
+
+Usage:
+    python -m scripts.slow_queries [--log-dir data/query_log] [--top 10] [--by-query]
+
+Queries are logged when a `DuckDBClient` is created with a `QueryLog` (see
+`src.db.query_log`). --by-query combines runs of the same SQL and ranks them by total time;
+the profile column points at the EXPLAIN ANALYZE output captured for slow runs.
+"""
+
+import argparse
+from typing import List, Optional
+
+from src.db.query_log import DEFAULT_QUERY_LOG_DIR, QueryLog
+
+SQL_WIDTH = 80
+
+
+def _shorten(sql: str) -> str:
+    return sql if len(sql) <= SQL_WIDTH else sql[: SQL_WIDTH - 3] + "..."
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--log-dir", default=DEFAULT_QUERY_LOG_DIR)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--by-query", action="store_true", help="combine runs of the same SQL")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    log = QueryLog(args.log_dir)
+    rows = log.top(args.top, by_query=args.by_query)
+    if not rows:
+        print(f"No queries logged in {log.path}")
+        return
+    for row in rows:
+        if args.by_query:
+            print(
+                f"{row['total_ms']:10.1f} ms total  {row['count']:5d} runs  "
+                f"{row['mean_ms']:8.1f} ms mean  {row['max_ms']:8.1f} ms max  "
+                f"{', '.join(row['callers'])}"
+            )
+        else:
+            print(f"{row['ms']:10.1f} ms  {row['rows']!s:>8} rows  {row['at']}  {row['caller']}")
+        print(f"    {_shorten(row['sql'])}")
+        if row.get("profile"):
+            print(f"    profile: {row['profile']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,8 +13,12 @@ def get_report_data():
         and st.session_state.report_data.get("status") == "completed"
     ):
         # In a real implementation, we would query DuckDB here
-        # db = DuckDBClient()
-        # team_stats = db.query(f"SELECT * FROM team_metrics WHERE team_name = '{st.session_state.report_data['team_name']}'")
+        # db = DuckDBClient(DEFAULT_SNAPSHOT_PATH, read_only=True)
+        # try:
+        #     team_id = st.session_state.report_data["team_id"]
+        #     team_stats = ReportsRepository(db).team_metrics(team_id)
+        # finally:
+        #     db.close()
 
         # For this demo/implementation step, we'll return data that reflects the requested team
         return {"team_name": st.session_state.report_data["team_name"], "is_real": True}
@@ -0,0 +1,167 @@
+"""
+Materialized aggregate tables read by the scouting reports.
+
+`team_metrics` holds one row per (team, map, side, month) and `player_metrics` one row per
+(player, agent). Both are maintained incrementally: after an ingest batch only the groups
+containing the touched matches are deleted and re-aggregated from `matches`, `rounds` and
+`player_stats`, so the cost of a refresh follows the size of the batch, not the history.
+`rebuild_aggregates` recomputes everything from scratch.
+"""
+
+from typing import Any, List, Sequence, Tuple
+
+import duckdb
+import pyarrow as pa
+
+# Each match counts for both of its teams.
+_TEAM_MATCHES = """
+    SELECT match_id, team_id, map_name, date_trunc('month', start_time)::DATE AS month
+    FROM matches WHERE team_id IS NOT NULL
+    UNION ALL
+    SELECT match_id, opponent_id, map_name, date_trunc('month', start_time)::DATE
+    FROM matches WHERE opponent_id IS NOT NULL
+"""
+
+# A team played a round on the winning side if it won the round, else on the other side.
+_TEAM_METRICS = f"""
+    SELECT
+        tm.team_id,
+        tm.map_name,
+        s.side,
+        tm.month,
+        count(DISTINCT tm.match_id) AS matches,
+        count(*) AS rounds_played,
+        count(*) FILTER (WHERE r.winning_team_id = tm.team_id) AS rounds_won,
+        rounds_won / rounds_played AS round_win_rate
+    FROM ({_TEAM_MATCHES}) tm
+    {{groups}}
+    JOIN rounds r ON r.match_id = tm.match_id
+    JOIN (VALUES ('attack'), ('defense')) s(side)
+        ON r.winning_side IN ('attack', 'defense')
+        AND (r.winning_team_id = tm.team_id) = (r.winning_side = s.side)
+    WHERE r.winning_team_id IS NOT NULL
+    GROUP BY tm.team_id, tm.map_name, s.side, tm.month
+"""
+
+_TEAM_GROUPS_JOIN = """
+    JOIN _touched_teams g
+        ON g.team_id = tm.team_id
+        AND g.map_name IS NOT DISTINCT FROM tm.map_name
+        AND g.month IS NOT DISTINCT FROM tm.month
+"""
+
+_PLAYER_METRICS = """
+    SELECT
+        p.player_id,
+        p.agent,
+        arg_max(p.team_id, m.start_time) AS team_id,
+        count(*) AS matches,
+        sum(p.kills) AS kills,
+        sum(p.deaths) AS deaths,
+        sum(p.assists) AS assists,
+        avg(p.adr) AS adr,
+        sum(p.kills) / greatest(sum(p.deaths), 1) AS kd_ratio
+    FROM player_stats p
+    {groups}
+    LEFT JOIN matches m ON m.match_id = p.match_id
+    GROUP BY p.player_id, p.agent
+"""
+
+_PLAYER_GROUPS_JOIN = """
+    JOIN _touched_players g
+        ON g.player_id = p.player_id AND g.agent IS NOT DISTINCT FROM p.agent
+"""
+
+TeamGroup = Tuple[Any, Any, Any]
+PlayerGroup = Tuple[Any, Any]
+
+
+def touched_groups(
+    conn: duckdb.DuckDBPyConnection, match_ids: Sequence[str]
+) -> Tuple[List[TeamGroup], List[PlayerGroup]]:
+    """The (team, map, month) and (player, agent) groups the given matches contribute to."""
+    ids = list(match_ids)
+    teams = conn.execute(
+        f"SELECT DISTINCT team_id, map_name, month FROM ({_TEAM_MATCHES}) "
+        "WHERE match_id IN (SELECT unnest(?::VARCHAR[]))",
+        [ids],
+    ).fetchall()
+    players = conn.execute(
+        "SELECT DISTINCT player_id, agent FROM player_stats "
+        "WHERE match_id IN (SELECT unnest(?::VARCHAR[]))",
+        [ids],
+    ).fetchall()
+    return teams, players
+
+
+def refresh_aggregates(
+    conn: duckdb.DuckDBPyConnection,
+    match_ids: Sequence[str],
+    stale: Tuple[List[TeamGroup], List[PlayerGroup]] = ([], []),
+) -> None:
+    """
+    Re-aggregates the groups touched by `match_ids`, plus the `stale` groups those matches
+    belonged to before they were replaced (see `touched_groups`). Run it in the transaction
+    that loaded the matches.
+    """
+    teams, players = touched_groups(conn, match_ids)
+    teams = list(set(teams) | set(stale[0]))
+    players = list(set(players) | set(stale[1]))
+    touched = {
+        "_touched_teams": pa.table(
+            {
+                "team_id": pa.array([g[0] for g in teams], pa.string()),
+                "map_name": pa.array([g[1] for g in teams], pa.string()),
+                "month": pa.array([g[2] for g in teams], pa.date32()),
+            }
+        ),
+        "_touched_players": pa.table(
+            {
+                "player_id": pa.array([g[0] for g in players], pa.string()),
+                "agent": pa.array([g[1] for g in players], pa.string()),
+            }
+        ),
+    }
+    for name, table in touched.items():
+        conn.register(name, table)
+    try:
+        conn.execute(
+            """
+            DELETE FROM team_metrics t USING _touched_teams g
+            WHERE t.team_id = g.team_id
+                AND t.map_name IS NOT DISTINCT FROM g.map_name
+                AND t.month IS NOT DISTINCT FROM g.month
+            """
+        )
+        conn.execute("INSERT INTO team_metrics " + _TEAM_METRICS.format(groups=_TEAM_GROUPS_JOIN))
+        conn.execute(
+            """
+            DELETE FROM player_metrics t USING _touched_players g
+            WHERE t.player_id = g.player_id AND t.agent IS NOT DISTINCT FROM g.agent
+            """
+        )
+        conn.execute(
+            "INSERT INTO player_metrics " + _PLAYER_METRICS.format(groups=_PLAYER_GROUPS_JOIN)
+        )
+    finally:
+        for name in touched:
+            conn.unregister(name)
+
+
+def compute_aggregates(conn: duckdb.DuckDBPyConnection) -> None:
+    """Recomputes every aggregate table from the base tables, in the caller's transaction."""
+    conn.execute("DELETE FROM team_metrics")
+    conn.execute("INSERT INTO team_metrics " + _TEAM_METRICS.format(groups=""))
+    conn.execute("DELETE FROM player_metrics")
+    conn.execute("INSERT INTO player_metrics " + _PLAYER_METRICS.format(groups=""))
+
+
+def rebuild_aggregates(conn: duckdb.DuckDBPyConnection) -> None:
+    """Recomputes every aggregate table from the base tables in one transaction."""
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        compute_aggregates(conn)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
@@ -0,0 +1,29 @@
+-- Rewrites the scouting tables in (team, map, start_time) order so DuckDB's per-row-group
+-- min/max zone maps let team/map/date filters skip most of each table. Rounds and player
+-- stats follow the order of their match. Idempotent; run inside a transaction.
+
+CREATE TEMP TABLE _sorted AS
+    SELECT * FROM matches ORDER BY team_id, map_name, start_time, match_id;
+DELETE FROM matches;
+INSERT INTO matches SELECT * FROM _sorted;
+DROP TABLE _sorted;
+
+CREATE TEMP TABLE _sorted AS
+    SELECT r.* FROM rounds r LEFT JOIN matches m ON m.match_id = r.match_id
+    ORDER BY m.team_id, m.map_name, m.start_time, r.match_id, r.round_number;
+DELETE FROM rounds;
+INSERT INTO rounds SELECT * FROM _sorted;
+DROP TABLE _sorted;
+
+CREATE TEMP TABLE _sorted AS
+    SELECT p.* FROM player_stats p LEFT JOIN matches m ON m.match_id = p.match_id
+    ORDER BY m.team_id, m.map_name, m.start_time, p.match_id, p.player_id;
+DELETE FROM player_stats;
+INSERT INTO player_stats SELECT * FROM _sorted;
+DROP TABLE _sorted;
+
+CREATE TEMP TABLE _sorted AS
+    SELECT * FROM team_metrics ORDER BY team_id, map_name, month, side;
+DELETE FROM team_metrics;
+INSERT INTO team_metrics SELECT * FROM _sorted;
+DROP TABLE _sorted;
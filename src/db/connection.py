@@ -0,0 +1,127 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict
+
+import duckdb
+
+DEFAULT_STATEMENT_CACHE_SIZE = 256
+
+
+class ConnectionManager:
+    """
+    Process-wide owner of one DuckDB database instance.
+
+    DuckDB runs queries from different connections to the same instance concurrently
+    (readers see a consistent snapshot while a writer commits), but a single connection
+    object serializes its callers. The manager therefore opens the database file once and
+    hands every thread its own cursor on that instance.
+
+    Across processes DuckDB allows either one read-write instance or any number of read-only
+    ones, never both, so a process that only reads while another writes (the app during an
+    ingest) must read a snapshot file instead (see `DuckDBClient.snapshot`). Within one
+    process, read-only clients simply share whatever instance is already open (see
+    `get_manager`).
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        read_only: bool = False,
+        statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+    ) -> None:
+        self.db_path = db_path
+        self.read_only = read_only
+        self.statement_cache_size = statement_cache_size
+        self._db = duckdb.connect(db_path, read_only=read_only)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._setup_done: Dict[str, bool] = {}
+        self._statements: "OrderedDict[str, Any]" = OrderedDict()
+
+    def cursor(self) -> duckdb.DuckDBPyConnection:
+        """The calling thread's cursor, created on first use."""
+        cursor = getattr(self._local, "cursor", None)
+        if cursor is None:
+            with self._lock:
+                cursor = self._db.cursor()
+            self._local.cursor = cursor
+        return cursor
+
+    def statement(self, sql: str) -> Any:
+        """
+        The parsed form of a single-statement query, cached by its text (LRU) and shared by
+        every thread's cursor; None for multi-statement SQL, which is executed as text.
+        """
+        with self._lock:
+            statement = self._statements.get(sql)
+            if statement is not None:
+                self._statements.move_to_end(sql)
+                return statement
+        statements = self._db.extract_statements(sql)
+        if len(statements) != 1:
+            return None
+        with self._lock:
+            self._statements[sql] = statements[0]
+            while len(self._statements) > self.statement_cache_size:
+                self._statements.popitem(last=False)
+        return statements[0]
+
+    def setup_once(self, name: str, setup: Callable[[duckdb.DuckDBPyConnection], object]) -> None:
+        """
+        Runs `setup` with a cursor the first time `name` is requested for this database; its
+        return value is ignored.
+        """
+        if self._setup_done.get(name):
+            return
+        with self._lock:
+            if self._setup_done.get(name):
+                return
+            cursor = self._db.cursor()
+            try:
+                setup(cursor)
+            finally:
+                cursor.close()
+            self._setup_done[name] = True
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+_managers: Dict[str, ConnectionManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_manager(db_path: str, read_only: bool = False) -> ConnectionManager:
+    """
+    The process's manager for `db_path`, opening the database on first use.
+
+    DuckDB cannot open one file twice in a process with different settings, so a read-only
+    request is served by an already open read-write instance, while a read-write request for
+    a file opened read-only raises.
+    """
+    key = os.path.abspath(db_path)
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = _managers[key] = ConnectionManager(db_path, read_only=read_only)
+        elif manager.read_only and not read_only:
+            raise ValueError(f"{db_path} is already open read-only in this process")
+        return manager
+
+
+def close_manager(db_path: str) -> None:
+    """Closes the process's manager for `db_path`, if it has one."""
+    with _managers_lock:
+        manager = _managers.pop(os.path.abspath(db_path), None)
+    if manager is not None:
+        manager.close()
+
+
+def close_all() -> None:
+    """Closes every database opened through `get_manager` (for tests and shutdown)."""
+    with _managers_lock:
+        for manager in _managers.values():
+            manager.close()
+        _managers.clear()
@@ -1,59 +1,332 @@
 import os
-from typing import Optional
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union, cast
 
 import duckdb
+import polars as pl
+import pyarrow as pa
+
+from src.db.aggregates import rebuild_aggregates, refresh_aggregates, touched_groups
+from src.db.connection import close_manager, get_manager
+from src.db.migrate import migrate, recluster
+from src.db.query_log import QueryLog, query_caller
+
+T = TypeVar("T")
+
+# Read-only copy of the database published by ingest for the app (see `DuckDBClient.snapshot`).
+DEFAULT_SNAPSHOT_PATH = "data/scouting.snapshot.db"
+
+# Columns bulk-loaded by `insert_matches`, per table, with the Arrow type staged for each.
+_LOAD_SCHEMAS: Dict[str, pa.Schema] = {
+    "matches": pa.schema(
+        [
+            ("match_id", pa.string()),
+            ("team_id", pa.string()),
+            ("opponent_id", pa.string()),
+            ("map_name", pa.string()),
+            ("score", pa.string()),
+            ("start_time", pa.timestamp("us")),
+        ]
+    ),
+    "rounds": pa.schema(
+        [
+            ("match_id", pa.string()),
+            ("round_number", pa.int32()),
+            ("winning_side", pa.string()),
+            ("win_type", pa.string()),
+            ("team_a_econ", pa.string()),
+            ("team_b_econ", pa.string()),
+            ("winning_team_id", pa.string()),
+        ]
+    ),
+    "player_stats": pa.schema(
+        [
+            ("match_id", pa.string()),
+            ("player_id", pa.string()),
+            ("team_id", pa.string()),
+            ("agent", pa.string()),
+            ("kills", pa.int32()),
+            ("deaths", pa.int32()),
+            ("assists", pa.int32()),
+            ("adr", pa.float32()),
+        ]
+    ),
+}
+
+
+# Statement types a `read_only` client runs; anything else, and multi-statement SQL, is refused.
+_READ_STATEMENTS = (duckdb.StatementType.SELECT, duckdb.StatementType.EXPLAIN)
+
+# Tie-breakers after the (team, map, start time, match) order of `src/db/cluster.sql`.
+_CLUSTER_ORDER = {"matches": "", "rounds": ", l.round_number", "player_stats": ", l.player_id"}
+
+# Tables holding several rows per match, replaced as a whole when a match is loaded again.
+_CHILD_TABLES = ("rounds", "player_stats")
+
+
+def _read_arrow(result: duckdb.DuckDBPyConnection) -> pa.Table:
+    table = result.arrow()
+    # DuckDB < 1.4 returns a Table here, newer releases a RecordBatchReader.
+    return table if isinstance(table, pa.Table) else table.read_all()
 
 
 class DuckDBClient:
-    """Client for managing DuckDB connection and local scouting data."""
+    """
+    Client for managing DuckDB connection and local scouting data.
 
-    def __init__(self, db_path: str = "data/scouting.db"):
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
-        self.conn = duckdb.connect(db_path)
-        self._init_schema()
+    Clients are cheap: every client for the same file shares one process-wide database
+    instance (see `src.db.connection`), and `conn` is the calling thread's own cursor on it,
+    so clients can be used from many threads at once. A `read_only` client refuses writes.
 
-    def _init_schema(self):
-        """Initializes the database schema if it doesn't exist."""
-        # This would typically read from src/db/schema.sql
-        self.conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS matches (
-                match_id VARCHAR PRIMARY KEY,
-                team_id VARCHAR,
-                opponent_id VARCHAR,
-                map_name VARCHAR,
-                score VARCHAR,
-                start_time TIMESTAMP
-            );
-
-            CREATE TABLE IF NOT EXISTS rounds (
-                match_id VARCHAR,
-                round_number INTEGER,
-                winning_side VARCHAR,
-                win_type VARCHAR,
-                team_a_econ VARCHAR,
-                team_b_econ VARCHAR,
-                PRIMARY KEY (match_id, round_number)
-            );
-
-            CREATE TABLE IF NOT EXISTS player_stats (
-                match_id VARCHAR,
-                player_id VARCHAR,
-                kills INTEGER,
-                deaths INTEGER,
-                assists INTEGER,
-                adr FLOAT,
-                PRIMARY KEY (match_id, player_id)
-            );
+    DuckDB locks the file for a read-write process, so other processes cannot open it, not
+    even read-only, while ingest runs. Ingest therefore publishes a copy with `snapshot`
+    after each run, and the app opens that copy read-only for each request and `close`s it
+    afterwards, so it never holds the file being written and picks up newer snapshots.
+
+    Passing a `QueryLog` records every query run through `execute`, `fetchall` and the
+    `query*` methods (see `src.db.query_log`).
+    """
+
+    def __init__(
+        self,
+        db_path: str = "data/scouting.db",
+        read_only: bool = False,
+        query_log: Optional[QueryLog] = None,
+    ):
+        if not read_only:
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.read_only = read_only
+        self.query_log = query_log
+        self.manager = get_manager(db_path, read_only=read_only)
+        if not self.manager.read_only:
+            self.manager.setup_once("schema", migrate)
+
+    @property
+    def conn(self) -> duckdb.DuckDBPyConnection:
+        """The calling thread's cursor on the shared database."""
+        return self.manager.cursor()
+
+    def _check_writable(self) -> None:
+        if self.read_only:
+            raise PermissionError(f"{self.manager.db_path} is opened read-only")
+
+    def close(self) -> None:
+        """Closes the database instance of this client's file for the whole process."""
+        close_manager(self.manager.db_path)
+
+    def snapshot(self, dest: Union[str, os.PathLike]) -> Path:
         """
-        )
+        Writes a consistent copy of the database to `dest` for readers in other processes.
+        The copy is built next to `dest` and renamed over it, so readers that open `dest`
+        see either the previous snapshot or the new one in full.
+        """
+        dest = Path(dest)
+        staging = dest.with_name(f".{dest.name}.tmp")
+        staging.unlink(missing_ok=True)
+        database = self.conn.execute("SELECT current_database()").fetchall()[0][0]
+        self.conn.execute(f"ATTACH '{staging.as_posix()}' AS snapshot")
+        try:
+            self.conn.execute(f'COPY FROM DATABASE "{database}" TO snapshot')
+        finally:
+            self.conn.execute("DETACH snapshot")
+        os.replace(staging, dest)
+        return dest
+
+    def execute(self, sql: str, params: Optional[list] = None) -> duckdb.DuckDBPyConnection:
+        """
+        Runs a query on the calling thread's cursor. Parameterized single statements reuse
+        their parsed form from the statement cache, since repositories run the same SQL text
+        over and over with different parameters.
+        """
+        return self._logged(sql, params, lambda result: result, lambda _: None)
+
+    def fetchall(self, sql: str, params: Optional[list] = None) -> List[Tuple[Any, ...]]:
+        """Executes a query and returns its rows as tuples."""
+        return self._logged(sql, params, lambda result: result.fetchall(), len)
 
-    def query(self, sql: str, params: Optional[list] = None):
-        """Executes a query and returns the results as a DataFrame."""
-        if params:
-            return self.conn.execute(sql, params).df()
-        return self.conn.execute(sql).df()
+    def query(self, sql: str, params: Optional[list] = None) -> Any:
+        """Executes a query and returns the results as a pandas DataFrame."""
+        return self._logged(sql, params, lambda result: result.df(), len)
 
-    def insert_match(self, match_data: dict):
-        # Implementation for inserting match data
-        pass
+    def query_arrow(self, sql: str, params: Optional[list] = None) -> pa.Table:
+        """
+        Executes a query and returns the results as an Arrow table. DuckDB hands over its
+        result vectors in Arrow layout, so unlike `query` nothing is converted per value.
+        """
+        return self._logged(sql, params, _read_arrow, lambda table: table.num_rows)
+
+    def query_polars(self, sql: str, params: Optional[list] = None) -> pl.DataFrame:
+        """Executes a query and returns a Polars frame over the Arrow result (no copy)."""
+        # from_arrow only returns a Series for Arrow arrays, never for a table.
+        return cast(pl.DataFrame, pl.from_arrow(self.query_arrow(sql, params)))
+
+    def _execute(self, sql: str, params: Optional[list]) -> duckdb.DuckDBPyConnection:
+        if self.read_only:
+            # A read-only client may share a read-write instance, so DuckDB won't refuse.
+            statement = self.manager.statement(sql)
+            if statement is None or statement.type not in _READ_STATEMENTS:
+                raise PermissionError(f"{self.manager.db_path} is opened read-only")
+        if not params:
+            return self.conn.execute(sql)
+        statement = self.manager.statement(sql)
+        return self.conn.execute(sql if statement is None else statement, params)
+
+    def _logged(
+        self,
+        sql: str,
+        params: Optional[list],
+        fetch: Callable[[duckdb.DuckDBPyConnection], T],
+        count: Callable[[T], Optional[int]],
+    ) -> T:
+        if self.query_log is None:
+            return fetch(self._execute(sql, params))
+        started = time.perf_counter()
+        result = fetch(self._execute(sql, params))
+        seconds = time.perf_counter() - started
+        profile = self._profile(sql, params) if self.query_log.is_slow(seconds) else None
+        self.query_log.record(sql, seconds, count(result), query_caller(), params, profile)
+        return result
+
+    def _profile(self, sql: str, params: Optional[list]) -> Optional[Path]:
+        """
+        Writes an EXPLAIN ANALYZE profile of a slow SELECT to the query log. The profile runs
+        on a cursor of its own, since `execute` callers have not fetched their result yet.
+        """
+        assert self.query_log is not None
+        try:
+            statement = self.manager.statement(sql)
+            # Re-running anything but a SELECT would repeat its side effects.
+            if statement is None or statement.type != duckdb.StatementType.SELECT:
+                return None
+            with self.conn.cursor() as cursor:
+                rows = cursor.execute(f"EXPLAIN ANALYZE {sql}", params or None).fetchall()
+        except duckdb.Error:
+            return None
+        return self.query_log.write_profile(sql, "\n".join(row[-1] for row in rows))
+
+    @contextmanager
+    def arrow_views(self, tables: Dict[str, Any]) -> Iterator[None]:
+        """
+        Exposes Arrow tables or record batches as named views for the duration of the block.
+        DuckDB scans the Arrow buffers in place, so nothing is copied into the database.
+        """
+        for name, data in tables.items():
+            if isinstance(data, pa.RecordBatch):
+                data = pa.Table.from_batches([data])
+            self.conn.register(name, data)
+        try:
+            yield
+        finally:
+            for name in tables:
+                self.conn.unregister(name)
+
+    def insert_match(self, match_data: Dict[str, Any]) -> None:
+        """Upserts one parsed match together with its rounds and player stats."""
+        self.insert_matches([match_data])
+
+    def insert_matches(
+        self,
+        matches: List[Dict[str, Any]],
+        before_commit: Optional[Callable[[List[Dict[str, Any]]], Any]] = None,
+    ) -> None:
+        """
+        Upserts a batch of parsed matches in a single transaction.
+
+        Rows are collected into one Arrow table per target table and loaded with a single
+        `INSERT OR REPLACE ... SELECT` each, so the cost is per table rather than per row.
+        Each batch is appended in `recluster` order; only the order across batches decays.
+        Later rows win over earlier ones with the same key, in the batch and in the database;
+        a loaded match's rounds and player stats replace all of its previously stored ones.
+        The aggregate tables are refreshed for the loaded matches in the same transaction.
+        `before_commit` is called with `matches` once everything is loaded; if it raises,
+        the transaction is rolled back (used to write the Parquet event store in step).
+        """
+        rows: Dict[str, Dict[Tuple[Any, ...], Dict[str, Any]]] = {t: {} for t in _LOAD_SCHEMAS}
+        for match_data in matches:
+            match_id = match_data["match_id"]
+            rows["matches"][(match_id,)] = match_data
+            for r in match_data.get("rounds", []):
+                rows["rounds"][(match_id, r.get("round_number"))] = {**r, "match_id": match_id}
+            for p in match_data.get("players", []):
+                rows["player_stats"][(match_id, p.get("player_id"))] = {**p, "match_id": match_id}
+        if not rows["matches"]:
+            return
+        self._check_writable()
+
+        tables = {
+            f"_load_{table}": pa.Table.from_pylist(
+                [{name: row.get(name) for name in schema.names} for row in rows[table].values()],
+                schema=schema,
+            )
+            for table, schema in _LOAD_SCHEMAS.items()
+        }
+        match_ids = [key[0] for key in rows["matches"]]
+        with self.arrow_views(tables):
+            self.conn.execute("BEGIN TRANSACTION")
+            try:
+                # Groups the matches counted towards before this load, in case they moved.
+                stale = touched_groups(self.conn, match_ids)
+                # A re-parse may yield fewer rounds or players than the rows already stored.
+                for table in _CHILD_TABLES:
+                    self.conn.execute(
+                        f"DELETE FROM {table} WHERE match_id IN (SELECT match_id FROM _load_matches)"
+                    )
+                for table, schema in _LOAD_SCHEMAS.items():
+                    if rows[table]:
+                        columns = ", ".join(schema.names)
+                        selected = ", ".join(f"l.{name}" for name in schema.names)
+                        # In cluster.sql order, so a batch's rows share tight zone maps.
+                        self.conn.execute(
+                            f"INSERT OR REPLACE INTO {table} ({columns}) "
+                            f"SELECT {selected} FROM _load_{table} l "
+                            "JOIN _load_matches m ON m.match_id = l.match_id "
+                            "ORDER BY m.team_id, m.map_name, m.start_time, l.match_id"
+                            f"{_CLUSTER_ORDER[table]}"
+                        )
+                refresh_aggregates(self.conn, match_ids, stale)
+                if before_commit is not None:
+                    before_commit(matches)
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def rebuild_aggregates(self) -> None:
+        """Recomputes `team_metrics` and `player_metrics` from the base tables."""
+        self._check_writable()
+        rebuild_aggregates(self.conn)
+
+    def recluster(self) -> None:
+        """Re-sorts the tables by (team, map, start time); see `src/db/cluster.sql`."""
+        self._check_writable()
+        recluster(self.conn)
+
+    def get_watermark(self, team_id: str) -> Optional[Tuple[datetime, str]]:
+        """Returns (start time, series ID) of the newest series ingested for a team."""
+        row = self.execute(
+            "SELECT last_start_time, last_series_id FROM ingest_watermarks WHERE team_id = ?",
+            [team_id],
+        ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return row[0].replace(tzinfo=timezone.utc), row[1]
+
+    def set_watermark(self, team_id: str, start_time: datetime, series_id: str) -> None:
+        """Advances a team's ingest watermark; older values never overwrite newer ones."""
+        self._check_writable()
+        start_time = start_time.astimezone(timezone.utc).replace(tzinfo=None)
+        self.execute(
+            """
+            INSERT INTO ingest_watermarks VALUES (?, ?, ?, now()::TIMESTAMP)
+            ON CONFLICT (team_id) DO UPDATE SET
+                last_start_time = excluded.last_start_time,
+                last_series_id = excluded.last_series_id,
+                updated_at = excluded.updated_at
+            WHERE (excluded.last_start_time, excluded.last_series_id)
+                > (ingest_watermarks.last_start_time, ingest_watermarks.last_series_id)
+            """,
+            [team_id, start_time, series_id],
+        )
@@ -0,0 +1,117 @@
+"""
+Versioned schema migrations.
+
+Version 1 is `src/db/schema.sql`; every later version is a file
+`src/db/migrations/NNN_<name>.sql`, numbered from 002. `migrate` applies the versions a
+database has not seen yet, each in its own transaction, and records them in
+`schema_version`, so existing databases are upgraded in place. After an upgrade the
+tables are re-sorted by `src/db/cluster.sql` once the database is at the latest version;
+ingest keeps that order up (`DuckDBClient.insert_matches` loads each batch sorted and
+`scripts/ingest_last_n.py` reclusters after every run that loaded matches).
+
+Databases created before `schema_version` existed are at an unknown version; the early
+migrations are idempotent (`IF NOT EXISTS` throughout), so they are simply replayed.
+Data a version needs that plain SQL cannot produce (the aggregate tables of 002, computed by
+`src.db.aggregates`) is filled in by a `data_step` run in the same transaction.
+"""
+
+import re
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import duckdb
+
+from src.db.aggregates import compute_aggregates
+
+DB_DIR = Path(__file__).resolve().parent
+BASELINE = DB_DIR / "schema.sql"
+MIGRATIONS_DIR = DB_DIR / "migrations"
+CLUSTER_SQL = DB_DIR / "cluster.sql"
+
+_MIGRATION_NAME = re.compile(r"^(\d{3})_(\w+)\.sql$")
+
+_DATA_STEPS: Dict[int, Callable[[duckdb.DuckDBPyConnection], None]] = {
+    # Upgraded databases already hold matches the new aggregate tables must cover.
+    2: compute_aggregates,
+}
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    path: Path
+    # Fills in data the version's SQL cannot produce, in the same transaction.
+    data_step: Optional[Callable[[duckdb.DuckDBPyConnection], None]] = None
+
+
+def discover_migrations(directory: Path = MIGRATIONS_DIR) -> List[Migration]:
+    """The baseline plus every numbered migration file, in version order."""
+    migrations = [Migration(1, "baseline", BASELINE)]
+    for path in sorted(directory.glob("*.sql")):
+        match = _MIGRATION_NAME.match(path.name)
+        if match is None:
+            raise ValueError(f"Migration file names must look like 002_name.sql: {path.name}")
+        version = int(match.group(1))
+        migrations.append(Migration(version, match.group(2), path, _DATA_STEPS.get(version)))
+    versions = [m.version for m in migrations]
+    if versions != list(range(1, len(versions) + 1)):
+        raise ValueError(f"Migration versions must be consecutive from 1, got {versions}")
+    return migrations
+
+
+def current_version(conn: duckdb.DuckDBPyConnection) -> int:
+    """The newest version applied to the database (0 for a new or unversioned one)."""
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            name VARCHAR,
+            applied_at TIMESTAMP
+        )
+        """
+    )
+    row = conn.execute("SELECT coalesce(max(version), 0) FROM schema_version").fetchone()
+    return int(row[0]) if row is not None else 0
+
+
+def migrate(
+    conn: duckdb.DuckDBPyConnection,
+    target: Optional[int] = None,
+    migrations: Optional[List[Migration]] = None,
+) -> List[int]:
+    """Upgrades the database to `target` (default: the newest version); returns the versions run."""
+    migrations = migrations if migrations is not None else discover_migrations()
+    version = current_version(conn)
+    applied = []
+    for migration in migrations:
+        if migration.version <= version or (target is not None and migration.version > target):
+            continue
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            conn.execute(migration.path.read_text())
+            if migration.data_step is not None:
+                migration.data_step(conn)
+            conn.execute(
+                "INSERT INTO schema_version VALUES (?, ?, now()::TIMESTAMP)",
+                [migration.version, migration.name],
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        applied.append(migration.version)
+    # cluster.sql targets the latest schema.
+    if applied and applied[-1] == migrations[-1].version:
+        recluster(conn)
+    return applied
+
+
+def recluster(conn: duckdb.DuckDBPyConnection) -> None:
+    """Rewrites the tables in scouting-query order (see `src/db/cluster.sql`)."""
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        conn.execute(CLUSTER_SQL.read_text())
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
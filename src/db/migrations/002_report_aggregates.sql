@@ -0,0 +1,29 @@
+-- Round winners and player rosters for side attribution, plus the materialized report
+-- aggregates maintained by src/db/aggregates.py.
+
+ALTER TABLE rounds ADD COLUMN IF NOT EXISTS winning_team_id VARCHAR;
+ALTER TABLE player_stats ADD COLUMN IF NOT EXISTS team_id VARCHAR;
+ALTER TABLE player_stats ADD COLUMN IF NOT EXISTS agent VARCHAR;
+
+CREATE TABLE IF NOT EXISTS team_metrics (
+    team_id VARCHAR,
+    map_name VARCHAR,
+    side VARCHAR,
+    month DATE,
+    matches INTEGER,
+    rounds_played INTEGER,
+    rounds_won INTEGER,
+    round_win_rate DOUBLE
+);
+
+CREATE TABLE IF NOT EXISTS player_metrics (
+    player_id VARCHAR,
+    agent VARCHAR,
+    team_id VARCHAR,
+    matches INTEGER,
+    kills INTEGER,
+    deaths INTEGER,
+    assists INTEGER,
+    adr DOUBLE,
+    kd_ratio DOUBLE
+);
@@ -0,0 +1,8 @@
+-- ART indexes for the lookups the reports and repositories run by team, map and player.
+-- Row order is handled by src/db/cluster.sql, which runs after every upgrade.
+
+CREATE INDEX IF NOT EXISTS matches_team_map_time ON matches (team_id, map_name, start_time);
+CREATE INDEX IF NOT EXISTS matches_opponent ON matches (opponent_id);
+CREATE INDEX IF NOT EXISTS player_stats_player ON player_stats (player_id);
+CREATE INDEX IF NOT EXISTS team_metrics_team_map ON team_metrics (team_id, map_name);
+CREATE INDEX IF NOT EXISTS player_metrics_team ON player_metrics (team_id);
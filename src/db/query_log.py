@@ -0,0 +1,124 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from types import FrameType
+from typing import Any, Dict, List, Optional, Union
+
+DEFAULT_QUERY_LOG_DIR = "data/query_log"
+DEFAULT_SLOW_QUERY_MS = 250.0
+LOG_FILE = "queries.jsonl"
+PROFILES_DIR = "profiles"
+
+# Modules whose frames are skipped when attributing a query to its caller.
+_CLIENT_MODULES = ("src.db.duckdb_client", "src.db.query_log")
+
+
+def query_caller() -> str:
+    """
+    The function that issued the current query, as `module:qualname`. The first repository
+    method on the stack wins; otherwise the nearest frame outside the database client.
+    """
+    frame: Optional[FrameType] = sys._getframe(1)
+    fallback: Optional[str] = None
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("src.db.repositories."):
+            return f"{module.rsplit('.', 1)[-1]}:{frame.f_code.co_qualname}"
+        if fallback is None and module not in _CLIENT_MODULES:
+            fallback = f"{module}:{frame.f_code.co_qualname}"
+        frame = frame.f_back
+    return fallback or "unknown"
+
+
+class QueryLog:
+    """
+    Opt-in record of the queries a `DuckDBClient` runs.
+
+    Every query is appended to `<root>/queries.jsonl` with its wall time, the number of rows
+    it returned and the repository method that issued it. Queries slower than `slow_ms` also
+    get an `EXPLAIN ANALYZE` profile written under `<root>/profiles/`, named by the hash of
+    the SQL text, so repeated slow runs of one query keep its latest profile.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, os.PathLike] = DEFAULT_QUERY_LOG_DIR,
+        slow_ms: float = DEFAULT_SLOW_QUERY_MS,
+    ):
+        self.root = Path(root)
+        self.slow_ms = slow_ms
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self.root / LOG_FILE
+
+    def is_slow(self, seconds: float) -> bool:
+        return seconds * 1000 >= self.slow_ms
+
+    def write_profile(self, sql: str, profile: str) -> Path:
+        digest = hashlib.sha256(sql.encode("utf-8")).hexdigest()[:16]
+        path = self.root / PROFILES_DIR / f"{digest}.txt"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"{sql.strip()}\n\n{profile}\n")
+        return path
+
+    def record(
+        self,
+        sql: str,
+        seconds: float,
+        rows: Optional[int],
+        caller: str,
+        params: Optional[list] = None,
+        profile_path: Optional[Path] = None,
+    ) -> None:
+        entry = {
+            "at": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "ms": round(seconds * 1000, 3),
+            "rows": rows,
+            "caller": caller,
+            "sql": " ".join(sql.split()),
+            "params": [repr(p) for p in params or []],
+            "thread": threading.current_thread().name,
+            "profile": str(profile_path) if profile_path else None,
+        }
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as fh:
+                fh.write(line)
+
+    def entries(self) -> List[Dict[str, Any]]:
+        if not self.path.exists():
+            return []
+        with open(self.path, encoding="utf-8") as fh:
+            return [json.loads(line) for line in fh if line.strip()]
+
+    def top(self, n: int = 10, by_query: bool = False) -> List[Dict[str, Any]]:
+        """
+        The `n` slowest queries. With `by_query`, runs of the same SQL text are combined into
+        one row (count, total and max time, latest profile), ranked by total time.
+        """
+        entries = self.entries()
+        if not by_query:
+            return sorted(entries, key=lambda e: e["ms"], reverse=True)[:n]
+        groups: Dict[str, Dict[str, Any]] = {}
+        for entry in entries:
+            group = groups.setdefault(
+                entry["sql"],
+                {"sql": entry["sql"], "callers": set(), "count": 0, "total_ms": 0.0, "max_ms": 0.0},
+            )
+            group["callers"].add(entry["caller"])
+            group["count"] += 1
+            group["total_ms"] += entry["ms"]
+            group["max_ms"] = max(group["max_ms"], entry["ms"])
+            group["profile"] = entry["profile"] or group.get("profile")
+        ranked = sorted(groups.values(), key=lambda g: g["total_ms"], reverse=True)[:n]
+        for group in ranked:
+            group["callers"] = sorted(group["callers"])
+            group["mean_ms"] = group["total_ms"] / group["count"]
+        return ranked
@@ -0,0 +1,220 @@
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.db.duckdb_client import DuckDBClient
+
+DEFAULT_EVENTS_DIR = "data/events"
+EVENT_TABLES = ("kills", "damage", "plants", "defuses", "ability_casts", "positions")
+PARTITION_KEYS = ("map", "team", "month")
+UNKNOWN_PARTITION = "unknown"
+
+
+def _partition_value(value: Any) -> str:
+    if value is None or value == "":
+        return UNKNOWN_PARTITION
+    text = str(value)
+    if "/" in text or "=" in text:
+        raise ValueError(f"Invalid partition value: {text!r}")
+    return text
+
+
+def partition_month(start_time: Optional[datetime]) -> str:
+    """Month partition (`YYYY-MM`) of a match start time."""
+    return start_time.strftime("%Y-%m") if start_time is not None else UNKNOWN_PARTITION
+
+
+class EventsRepository:
+    """
+    Event-level telemetry stored as Hive-partitioned Parquet and queried through DuckDB.
+
+    Each event table (kills, damage, ..., positions) lives under
+    `<root>/<table>/map=<map>/team=<team>/month=<YYYY-MM>/<match_id>.parquet`, with one copy of
+    a match under each team that played it. Queries first narrow the file list to the
+    partitions (and matches) they filter on, so only those directories are listed and only
+    those files are opened; the remaining filters are pushed down into the Parquet row-group
+    statistics.
+    """
+
+    def __init__(self, db: DuckDBClient, root: Union[str, os.PathLike] = DEFAULT_EVENTS_DIR):
+        self.db = db
+        self.root = Path(root)
+
+    def partition_dir(
+        self, table: str, map_name: Optional[str], team_id: Optional[str], month: str
+    ) -> Path:
+        return (
+            self.root
+            / table
+            / f"map={_partition_value(map_name)}"
+            / f"team={_partition_value(team_id)}"
+            / f"month={_partition_value(month)}"
+        )
+
+    def write_match(self, match_data: Dict[str, Any]) -> List[Path]:
+        """
+        Writes a parsed match's event batches (`batches`, as produced by
+        `MatchParser.parse_match_batches` or read from the parse cache) into the partitions of
+        its map and month, once for each of `team_id` and `opponent_id`. Files are named by
+        match, so writing a match again replaces its previous files.
+        """
+        batches = match_data.get("batches") or {}
+        start_time = match_data.get("start_time")
+        month = partition_month(start_time)
+        sides = (match_data.get("team_id"), match_data.get("opponent_id"))
+        teams = [team for team in dict.fromkeys(sides) if team] or [None]
+        written = []
+        for table in EVENT_TABLES:
+            batch = batches.get(table)
+            if batch is None or batch.num_rows == 0:
+                continue
+            data = batch if isinstance(batch, pa.Table) else pa.Table.from_batches([batch])
+            # Constant per file, so it costs next to nothing but lets queries order matches.
+            data = data.append_column(
+                "start_time", pa.array([start_time] * data.num_rows, pa.timestamp("us"))
+            )
+            paths = [
+                self.partition_dir(table, match_data.get("map_name"), team, month)
+                / f"{match_data['match_id']}.parquet"
+                for team in teams
+            ]
+            for i, path in enumerate(paths):
+                path.parent.mkdir(parents=True, exist_ok=True)
+                staging = path.with_name(f".{path.name}.tmp")
+                if i == 0:
+                    pq.write_table(data, staging)
+                else:
+                    shutil.copyfile(paths[0], staging)
+                os.replace(staging, path)
+            # Copies left under a team that no longer plays this match (e.g. a late opponent).
+            map_dir = paths[0].parents[2]
+            for stale in map_dir.glob(f"team=*/{paths[0].parent.name}/{paths[0].name}"):
+                if stale not in paths:
+                    stale.unlink()
+            written.extend(paths)
+        return written
+
+    def write_matches(self, matches: Sequence[Dict[str, Any]]) -> List[Path]:
+        written = []
+        for match_data in matches:
+            written.extend(self.write_match(match_data))
+        return written
+
+    def files(
+        self,
+        table: str,
+        map_name: Optional[str] = None,
+        team_id: Optional[str] = None,
+        months: Optional[Sequence[str]] = None,
+    ) -> List[Path]:
+        """Files of an event table, listing only the partitions matching the given filters."""
+        map_part = f"map={_partition_value(map_name)}" if map_name is not None else "map=*"
+        team_part = f"team={_partition_value(team_id)}" if team_id is not None else "team=*"
+        month_parts = (
+            [f"month={_partition_value(month)}" for month in months]
+            if months is not None
+            else ["month=*"]
+        )
+        paths: List[Path] = []
+        for month_part in month_parts:
+            paths.extend((self.root / table).glob(f"{map_part}/{team_part}/{month_part}/*.parquet"))
+        return sorted(paths)
+
+    def scan(self, table: str) -> str:
+        """
+        SQL table expression reading every partition of an event table. A match appears once
+        per team that played it, so filter on `team` (or use `query`) to count events.
+        """
+        if table not in EVENT_TABLES:
+            raise ValueError(f"Unknown event table: {table}")
+        pattern = (self.root / table / "*" / "*" / "*" / "*.parquet").as_posix()
+        return self._read_parquet(f"'{pattern}'")
+
+    def query(
+        self,
+        table: str,
+        map_name: Optional[str] = None,
+        team_id: Optional[str] = None,
+        months: Optional[Sequence[str]] = None,
+        match_ids: Optional[Sequence[str]] = None,
+        columns: str = "*",
+    ) -> pa.Table:
+        """Events of one table, filtered by partition (map, team, months) and match."""
+        paths = self._match_files(table, map_name, team_id, months, match_ids)
+        if not paths:
+            return pa.table({})
+        return self.db.query_arrow(f"SELECT {columns} FROM {self._read_files()}", [paths])
+
+    def recent_match_ids(
+        self, team_id: str, map_name: Optional[str] = None, limit: int = 10
+    ) -> List[Tuple[str, str]]:
+        """The team's most recent matches with event data (newest first), with their month."""
+        # Kills exist in every played match and are far smaller than positions.
+        paths = self._match_files("kills", map_name, team_id)
+        if not paths:
+            return []
+        sql = (
+            f"SELECT DISTINCT match_id, month, start_time FROM {self._read_files()} "
+            f"ORDER BY start_time DESC, match_id LIMIT {int(limit)}"
+        )
+        return [(match_id, month) for match_id, month, _ in self.db.fetchall(sql, [paths])]
+
+    def team_events(
+        self,
+        table: str,
+        team_id: str,
+        map_name: Optional[str] = None,
+        last_n: int = 10,
+        columns: str = "*",
+    ) -> pa.Table:
+        """
+        Events of a team's last `last_n` matches (optionally on one map). Only the files of
+        those matches are read for the event table itself.
+        """
+        recent = self.recent_match_ids(team_id, map_name, last_n)
+        if not recent:
+            return pa.table({})
+        return self.query(
+            table,
+            map_name=map_name,
+            team_id=team_id,
+            months=sorted({month for _, month in recent}),
+            match_ids=[match_id for match_id, _ in recent],
+            columns=columns,
+        )
+
+    def _match_files(
+        self,
+        table: str,
+        map_name: Optional[str] = None,
+        team_id: Optional[str] = None,
+        months: Optional[Sequence[str]] = None,
+        match_ids: Optional[Sequence[str]] = None,
+    ) -> List[str]:
+        if table not in EVENT_TABLES:
+            raise ValueError(f"Unknown event table: {table}")
+        paths = self.files(table, map_name, team_id, months)
+        if team_id is None:
+            # Without a team, read one of the copies each match has per team.
+            paths = list({path.name: path for path in paths}.values())
+        if match_ids is not None:
+            wanted = set(match_ids)
+            paths = [path for path in paths if path.stem in wanted]
+        return [path.as_posix() for path in paths]
+
+    def _read_files(self) -> str:
+        """Like `scan`, but reading the file list bound to the query's first parameter."""
+        return self._read_parquet("?::VARCHAR[]")
+
+    @staticmethod
+    def _read_parquet(source: str) -> str:
+        types = ", ".join(f"'{key}': 'VARCHAR'" for key in PARTITION_KEYS)
+        return (
+            f"read_parquet({source}, hive_partitioning = true, "
+            f"hive_types = {{{types}}}, union_by_name = true)"
+        )
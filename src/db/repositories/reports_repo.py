@@ -0,0 +1,54 @@
+from datetime import date
+from typing import Optional
+
+import polars as pl
+
+from src.db.duckdb_client import DuckDBClient
+
+
+class ReportsRepository:
+    """Report queries; they read the pre-aggregated tables in `src.db.aggregates` only."""
+
+    def __init__(self, db: DuckDBClient):
+        self.db = db
+
+    def team_metrics(
+        self, team_id: str, map_name: Optional[str] = None, since: Optional[date] = None
+    ) -> pl.DataFrame:
+        """Round win rates per map and side for a team, summed over the months since `since`."""
+        filters = ["team_id = ?"]
+        params: list = [team_id]
+        if map_name is not None:
+            filters.append("map_name = ?")
+            params.append(map_name)
+        if since is not None:
+            filters.append("month >= date_trunc('month', ?::DATE)")
+            params.append(since)
+        return self.db.query_polars(
+            f"""
+            SELECT
+                map_name,
+                side,
+                sum(matches) AS matches,
+                sum(rounds_played) AS rounds_played,
+                sum(rounds_won) AS rounds_won,
+                sum(rounds_won) / sum(rounds_played) AS round_win_rate
+            FROM team_metrics
+            WHERE {' AND '.join(filters)}
+            GROUP BY map_name, side
+            ORDER BY map_name, side
+            """,
+            params,
+        )
+
+    def player_metrics(self, team_id: str) -> pl.DataFrame:
+        """Career lines per player and agent for the players last seen on a team."""
+        return self.db.query_polars(
+            """
+            SELECT player_id, agent, matches, kills, deaths, assists, adr, kd_ratio
+            FROM player_metrics
+            WHERE team_id = ?
+            ORDER BY player_id, matches DESC
+            """,
+            [team_id],
+        )
@@ -0,0 +1,38 @@
+-- Version 1: baseline schema. Later versions live in src/db/migrations/NNN_<name>.sql and are
+-- applied in order by src/db/migrate.py; never edit a migration once it has shipped.
+
+CREATE TABLE IF NOT EXISTS matches (
+    match_id VARCHAR PRIMARY KEY,
+    team_id VARCHAR,
+    opponent_id VARCHAR,
+    map_name VARCHAR,
+    score VARCHAR,
+    start_time TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS rounds (
+    match_id VARCHAR,
+    round_number INTEGER,
+    winning_side VARCHAR,
+    win_type VARCHAR,
+    team_a_econ VARCHAR,
+    team_b_econ VARCHAR,
+    PRIMARY KEY (match_id, round_number)
+);
+
+CREATE TABLE IF NOT EXISTS player_stats (
+    match_id VARCHAR,
+    player_id VARCHAR,
+    kills INTEGER,
+    deaths INTEGER,
+    assists INTEGER,
+    adr FLOAT,
+    PRIMARY KEY (match_id, player_id)
+);
+
+CREATE TABLE IF NOT EXISTS ingest_watermarks (
+    team_id VARCHAR PRIMARY KEY,
+    last_start_time TIMESTAMP,
+    last_series_id VARCHAR,
+    updated_at TIMESTAMP
+);
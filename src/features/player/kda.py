@@ -0,0 +1,74 @@
+import polars as pl
+
+from src.features.utils.columnar import ArrowData, to_polars
+from src.parsers.valorant.extractors import average_damage_per_round
+
+
+def player_kda(kills: ArrowData, damage: ArrowData) -> pl.DataFrame:
+    """
+    Per-player kills, deaths, headshot rate and average damage per round, computed from the
+    columnar `kills` and `damage` event batches.
+    """
+    kills_df = to_polars(kills)
+    damage_df = to_polars(damage)
+    # ADR follows `average_damage_per_round`: rounds are counted per match a player appears
+    # in, so it is not diluted by matches (in concatenated batches) the player did not play.
+    match_rounds = (
+        pl.concat(
+            [
+                kills_df.select(_match_id(), "round_number"),
+                damage_df.select(_match_id(), "round_number"),
+            ]
+        )
+        .unique()
+        .group_by("match_id")
+        .agg(pl.len().alias("rounds"))
+    )
+    appearances = pl.concat(
+        [
+            frame.select(pl.col(column).cast(pl.String).alias("player_id"), _match_id())
+            for frame, column in (
+                (kills_df, "killer_id"),
+                (kills_df, "victim_id"),
+                (damage_df, "attacker_id"),
+                (damage_df, "victim_id"),
+            )
+        ]
+    ).unique()
+    rounds_played = (
+        appearances.join(match_rounds, on="match_id")
+        .group_by("player_id")
+        .agg(pl.col("rounds").sum().alias("rounds_played"))
+    )
+
+    offense = per_player(
+        kills_df, "killer_id", pl.len().alias("kills"), pl.col("headshot").mean()
+    ).rename({"headshot": "headshot_rate"})
+    deaths = per_player(kills_df, "victim_id", pl.len().alias("deaths"))
+    dealt = per_player(damage_df, "attacker_id", pl.col("amount").sum().alias("damage"))
+
+    players = pl.concat([f.select("player_id") for f in (offense, deaths, dealt)]).unique()
+    for frame in (offense, deaths, dealt, rounds_played):
+        players = players.join(frame, on="player_id", how="left")
+    players = players.with_columns(
+        pl.col("kills", "deaths", "rounds_played").fill_null(0),
+        pl.col("damage").fill_null(0.0),
+    )
+    adr = [
+        average_damage_per_round(damage, rounds)
+        for damage, rounds in zip(players["damage"], players["rounds_played"])
+    ]
+    return (
+        players.with_columns(pl.Series("adr", adr, dtype=pl.Float64))
+        .drop("damage", "rounds_played")
+        .sort("player_id")
+    )
+
+
+def per_player(frame: pl.DataFrame, column: str, *aggs: pl.Expr) -> pl.DataFrame:
+    """Groups event rows by a dictionary-encoded player column, keyed as `player_id`."""
+    return frame.group_by(pl.col(column).cast(pl.String).alias("player_id")).agg(*aggs)
+
+
+def _match_id() -> pl.Expr:
+    return pl.col("match_id").cast(pl.String)
@@ -0,0 +1,16 @@
+import polars as pl
+
+from src.features.player.kda import per_player
+from src.features.utils.columnar import ArrowData, to_polars
+
+
+def opening_duels(kills: ArrowData) -> pl.DataFrame:
+    """Per-player first kills and first deaths of each round, from the `kills` batch."""
+    openers = to_polars(kills).sort("tick").group_by("match_id", "round_number").first()
+    won = per_player(openers, "killer_id", pl.len().alias("first_kills"))
+    lost = per_player(openers, "victim_id", pl.len().alias("first_deaths"))
+    return (
+        won.join(lost, on="player_id", how="full", coalesce=True)
+        .with_columns(pl.col("first_kills", "first_deaths").fill_null(0))
+        .sort("player_id")
+    )
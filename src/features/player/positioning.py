@@ -0,0 +1,29 @@
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+from src.parsers.valorant.positions_parser import Trajectory
+
+Extent = Tuple[Tuple[float, float], Tuple[float, float]]
+
+
+def position_heatmap(
+    trajectories: Iterable[Trajectory],
+    bins: int = 64,
+    extent: Optional[Extent] = None,
+    interval: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    2D histogram of where players stood, as returned by `np.histogram2d`. Passing
+    `interval` resamples each path to a fixed tick rate first, so cells are weighted by time
+    spent there rather than by how often the telemetry happened to sample a player.
+    """
+    xs, ys = [], []
+    for trajectory in trajectories:
+        if interval:
+            trajectory = trajectory.resample(interval)
+        xs.append(trajectory.x)
+        ys.append(trajectory.y)
+    x = np.concatenate(xs) if xs else np.empty(0, dtype=np.float32)
+    y = np.concatenate(ys) if ys else np.empty(0, dtype=np.float32)
+    return np.histogram2d(x, y, bins=bins, range=extent)
@@ -0,0 +1,25 @@
+from typing import Dict, Iterable, Union
+
+import polars as pl
+import pyarrow as pa
+
+ArrowData = Union[pa.RecordBatch, pa.Table]
+
+
+def to_polars(data: ArrowData) -> pl.DataFrame:
+    """Wraps parser output in a Polars frame; numeric columns share the Arrow buffers."""
+    if isinstance(data, pa.RecordBatch):
+        data = pa.Table.from_batches([data])
+    frame = pl.from_arrow(data)
+    assert isinstance(frame, pl.DataFrame)
+    return frame
+
+
+def concat_batches(matches: Iterable[Dict[str, ArrowData]], name: str) -> pa.Table:
+    """Stacks one event table (e.g. `kills`) across several parsed matches."""
+    tables = []
+    for batches in matches:
+        data = batches[name]
+        tables.append(pa.Table.from_batches([data]) if isinstance(data, pa.RecordBatch) else data)
+    # Each match has its own string dictionaries; unify them so the result is one table.
+    return pa.concat_tables(tables, promote_options="permissive").unify_dictionaries()
@@ -0,0 +1,347 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Union
+
+from src.ingest.downloader import ArtifactDownloader
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    import zstandard as zstd
+except ImportError:  # pragma: no cover - compression is optional
+    zstd = None  # type: ignore[assignment]
+
+DEFAULT_CACHE_DIR = "data/cache/artifacts"
+DEFAULT_MAX_BYTES = 20 * 1024**3
+DEFAULT_COMPRESSION_LEVEL = 9
+DEFAULT_DICT_SIZE = 112 * 1024
+# Train a dictionary automatically once this many artifacts have been cached.
+DEFAULT_TRAIN_AFTER = 16
+ZSTD_SUFFIX = ".zst"
+
+# Telemetry documents are split into slices of this size to give the trainer many samples.
+_SAMPLE_CHUNK = 16 * 1024
+_MAX_SAMPLE_BYTES = 32 * 1024**2
+_CURRENT_DICT = "CURRENT"
+# Upper bound on a zstd frame header (ZSTD_FRAMEHEADERSIZE_MAX).
+_FRAME_HEADER_MAX = 18
+
+
+def open_artifact(path: Union[str, os.PathLike]) -> BinaryIO:
+    """
+    Opens a cached artifact for reading. Compressed blobs are decompressed as a stream with
+    the dictionary recorded in their frame header, so they can be fed straight to a parser.
+    """
+    path = Path(path)
+    if path.suffix != ZSTD_SUFFIX:
+        return open(path, "rb")
+    if zstd is None:
+        raise RuntimeError(f"{path} is zstd-compressed but the zstandard package is missing.")
+    fh = open(path, "rb")
+    try:
+        params = zstd.get_frame_parameters(fh.read(_FRAME_HEADER_MAX))
+        fh.seek(0)
+        dict_data = None
+        if params.dict_id:
+            # objects/<xx>/<sha>.zst -> dicts/<dict id>.zdict
+            dict_path = path.parents[2] / "dicts" / f"{params.dict_id}.zdict"
+            dict_data = zstd.ZstdCompressionDict(dict_path.read_bytes())
+        return zstd.ZstdDecompressor(dict_data=dict_data).stream_reader(fh, closefd=True)
+    except BaseException:
+        fh.close()
+        raise
+
+
+@dataclass
+class CacheEntry:
+    """Index record mapping an artifact ID to its content-addressed blob."""
+
+    artifact_id: str
+    sha256: str
+    size: int
+    url: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how fetches were served."""
+
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class ArtifactCache:
+    """
+    On-disk, size-bounded cache of telemetry artifacts.
+
+    Blobs live under `objects/` named by their sha256, so identical content is stored once.
+    `index/` maps artifact IDs to blobs together with the ETag/Last-Modified validators used
+    to turn repeat fetches into conditional requests. Every file is written to a temporary
+    name and moved into place with `os.replace`, so concurrent ingest processes sharing the
+    directory never observe a half-written entry. Blob mtimes double as LRU timestamps.
+
+    When zstandard is installed, blobs are stored zstd-compressed. Telemetry repeats the same
+    keys, agent and weapon names in every event, so once enough artifacts are cached a shared
+    dictionary is trained from them (kept in `dicts/`). Use `open_artifact` to read a blob.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, os.PathLike] = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        compress: bool = True,
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+        train_after: Optional[int] = DEFAULT_TRAIN_AFTER,
+    ) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.compress = compress and zstd is not None
+        self.compression_level = compression_level
+        self.train_after = train_after
+        self.objects_dir = self.root / "objects"
+        self.index_dir = self.root / "index"
+        self.tmp_dir = self.root / "tmp"
+        self.dicts_dir = self.root / "dicts"
+        for directory in (self.objects_dir, self.index_dir, self.tmp_dir, self.dicts_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+        self.stats = CacheStats()
+        self._dict_cache: Dict[int, "zstd.ZstdCompressionDict"] = {}
+
+    def _key(self, artifact_id: str) -> str:
+        return hashlib.sha1(artifact_id.encode("utf-8")).hexdigest()
+
+    def _index_path(self, artifact_id: str) -> Path:
+        return self.index_dir / f"{self._key(artifact_id)}.json"
+
+    def blob_path(self, sha256: str) -> Path:
+        """Returns where the blob with the given content hash is (or would be) stored."""
+        plain = self.objects_dir / sha256[:2] / sha256
+        compressed = plain.with_name(plain.name + ZSTD_SUFFIX)
+        if compressed.exists() or (self.compress and not plain.exists()):
+            return compressed
+        return plain
+
+    def get(self, artifact_id: str) -> Optional[CacheEntry]:
+        """Returns the index entry for `artifact_id` if its blob is present."""
+        try:
+            with open(self._index_path(artifact_id), encoding="utf-8") as fh:
+                entry = CacheEntry(**json.load(fh))
+        except (FileNotFoundError, json.JSONDecodeError, TypeError):
+            return None
+        blob = self.blob_path(entry.sha256)
+        if not blob.exists():
+            return None
+        self._touch(blob)
+        return entry
+
+    def put(
+        self,
+        artifact_id: str,
+        src: Union[str, os.PathLike],
+        sha256: str,
+        url: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> CacheEntry:
+        """Moves the file at `src` into the cache under its content hash and indexes it."""
+        size = os.path.getsize(src)
+        blob = self.blob_path(sha256)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        if blob.exists():
+            # Same content already stored (possibly under another artifact ID).
+            os.unlink(src)
+            self._touch(blob)
+        elif blob.suffix == ZSTD_SUFFIX:
+            self._compress_into(Path(src), blob)
+            os.unlink(src)
+        else:
+            os.replace(src, blob)
+        entry = CacheEntry(
+            artifact_id=artifact_id,
+            sha256=sha256,
+            size=size,
+            url=url,
+            etag=etag,
+            last_modified=last_modified,
+        )
+        self._write_index(entry)
+        self.evict()
+        if self.compress and self.train_after and self._current_dict_id() is None:
+            blobs = list(self._blobs())
+            if len(blobs) >= self.train_after:
+                self.train_dictionary(blobs)
+        return entry
+
+    def train_dictionary(
+        self,
+        samples: Optional[Iterable[Union[str, os.PathLike]]] = None,
+        dict_size: int = DEFAULT_DICT_SIZE,
+    ) -> Optional[int]:
+        """
+        Trains a zstd dictionary from sample artifacts (default: everything cached) and makes
+        it the one used for new blobs. Returns its ID, or None if training wasn't possible.
+        Blobs written earlier keep decompressing with the dictionary they were written with.
+        """
+        if zstd is None:
+            return None
+        # Typed as train_dictionary declares it; lists are invariant in their element type.
+        chunks: List[Union[bytes, bytearray, memoryview]] = []
+        total = 0
+        for sample in samples if samples is not None else self._blobs():
+            with open_artifact(sample) as fh:
+                while total < _MAX_SAMPLE_BYTES:
+                    chunk = fh.read(_SAMPLE_CHUNK)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                    total += len(chunk)
+            if total >= _MAX_SAMPLE_BYTES:
+                break
+        try:
+            dictionary = zstd.train_dictionary(dict_size, chunks)
+        except zstd.ZstdError:
+            # Too few or too uniform samples to build a useful dictionary.
+            return None
+
+        dict_id = dictionary.dict_id()
+        self._atomic_write(self.dicts_dir / f"{dict_id}.zdict", dictionary.as_bytes())
+        self._atomic_write(self.dicts_dir / _CURRENT_DICT, str(dict_id).encode("ascii"))
+        return dict_id
+
+    def fetch(
+        self,
+        artifact_id: str,
+        url: str,
+        downloader: ArtifactDownloader,
+        revalidate: bool = True,
+    ) -> Path:
+        """
+        Returns a local path to the artifact, downloading it only when needed. A cached entry
+        is revalidated with If-None-Match/If-Modified-Since unless `revalidate` is False.
+        """
+        with self._lock(artifact_id):
+            entry = self.get(artifact_id)
+            if entry is not None and not revalidate:
+                self.stats.hits += 1
+                return self.blob_path(entry.sha256)
+
+            headers: Dict[str, str] = {}
+            if entry is not None:
+                if entry.etag:
+                    headers["If-None-Match"] = entry.etag
+                if entry.last_modified:
+                    headers["If-Modified-Since"] = entry.last_modified
+
+            # Keyed by artifact so an interrupted download resumes on the next run.
+            tmp = self.tmp_dir / f"{self._key(artifact_id)}.download"
+            result = downloader.download(url, tmp, headers=headers)
+            if entry is not None and result.not_modified:
+                self.stats.revalidated += 1
+                return self.blob_path(entry.sha256)
+
+            self.stats.misses += 1
+            entry = self.put(
+                artifact_id,
+                result.path,
+                result.sha256,
+                url=url,
+                etag=result.etag,
+                last_modified=result.last_modified,
+            )
+            return self.blob_path(entry.sha256)
+
+    def total_size(self) -> int:
+        """Returns the combined size of all stored blobs in bytes."""
+        return sum(blob.stat().st_size for blob in self._blobs())
+
+    def evict(self) -> List[str]:
+        """Deletes least recently used blobs until the cache fits in `max_bytes`."""
+        blobs = []
+        for blob in self._blobs():
+            try:
+                stat = blob.stat()
+            except FileNotFoundError:
+                continue
+            blobs.append((stat.st_mtime, stat.st_size, blob))
+        total = sum(size for _, size, _ in blobs)
+        evicted = []
+        for _, size, blob in sorted(blobs, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            blob.unlink(missing_ok=True)
+            total -= size
+            evicted.append(blob.name)
+        self.stats.evictions += len(evicted)
+        # Index entries pointing at evicted blobs are ignored by `get` and pruned lazily.
+        return evicted
+
+    def _blobs(self) -> Iterator[Path]:
+        return (path for path in self.objects_dir.glob("*/*") if path.is_file())
+
+    def _touch(self, blob: Path) -> None:
+        try:
+            now = time.time()
+            os.utime(blob, (now, now))
+        except FileNotFoundError:
+            pass
+
+    def _write_index(self, entry: CacheEntry) -> None:
+        data = json.dumps(asdict(entry)).encode("utf-8")
+        self._atomic_write(self._index_path(entry.artifact_id), data)
+
+    def _atomic_write(self, dest: Path, data: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.tmp_dir)
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, dest)
+
+    def _current_dict_id(self) -> Optional[int]:
+        try:
+            return int((self.dicts_dir / _CURRENT_DICT).read_text(encoding="ascii"))
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _current_dict(self) -> Optional["zstd.ZstdCompressionDict"]:
+        dict_id = self._current_dict_id()
+        if dict_id is None:
+            return None
+        if dict_id not in self._dict_cache:
+            data = (self.dicts_dir / f"{dict_id}.zdict").read_bytes()
+            self._dict_cache[dict_id] = zstd.ZstdCompressionDict(data)
+        return self._dict_cache[dict_id]
+
+    def _compress_into(self, src: Path, dest: Path) -> None:
+        """Stream-compresses `src` into `dest` with the current dictionary, atomically."""
+        compressor = zstd.ZstdCompressor(
+            level=self.compression_level, dict_data=self._current_dict()
+        )
+        fd, tmp = tempfile.mkstemp(dir=self.tmp_dir, suffix=ZSTD_SUFFIX)
+        with open(src, "rb") as ifh, os.fdopen(fd, "wb") as ofh:
+            compressor.copy_stream(ifh, ofh, size=src.stat().st_size)
+        os.replace(tmp, dest)
+
+    @contextmanager
+    def _lock(self, artifact_id: str) -> Iterator[None]:
+        """Serialises fetches of one artifact across threads and processes."""
+        if fcntl is None:
+            yield
+            return
+        with open(self.tmp_dir / f"{self._key(artifact_id)}.lock", "w") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
@@ -0,0 +1,239 @@
+import hashlib
+import json
+import os
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import requests
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+from src.ingest.rate_limiter import AdaptiveRateLimiter
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_TIMEOUT = 60.0
+
+PathLike = Union[str, os.PathLike]
+
+# Errors after which the partial file is kept and the transfer resumed with a Range request.
+_RESUMABLE_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    # Reading `response.raw` directly surfaces urllib3's errors rather than requests' wrappers.
+    ProtocolError,
+    ReadTimeoutError,
+)
+
+# What `<dest>.part.json` records about the body being transferred to `<dest>.part`.
+_EMPTY_PART_INFO: Dict[str, Optional[str]] = {"etag": None, "last_modified": None, "encoding": None}
+
+
+class DownloadError(Exception):
+    """Raised when an artifact cannot be downloaded or fails verification."""
+
+
+@dataclass
+class DownloadResult:
+    """
+    Outcome of a streamed artifact download. When a conditional request was answered with
+    304 Not Modified, `not_modified` is set and nothing was written to `path`.
+    """
+
+    path: Path
+    size: int
+    sha256: str
+    resumed: bool = False
+    attempts: int = 1
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified: bool = False
+
+
+class ArtifactDownloader:
+    """
+    Streams telemetry artifacts straight to disk in fixed-size chunks.
+
+    Bytes are written to `<dest>.part` exactly as they arrive on the wire, so an interrupted
+    transfer can be resumed with an HTTP Range request. The first response's validator
+    (ETag or Last-Modified) and encoding are kept in `<dest>.part.json`, so a later process
+    resumes with `If-Range`; a `.part` without one is discarded. A gzip `Content-Encoding`
+    is decoded in a second streaming pass once the transfer is complete. Peak memory is one
+    chunk, regardless of artifact size.
+    """
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        timeout: float = DEFAULT_TIMEOUT,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+    ) -> None:
+        self.session = session or requests.Session()
+        self.rate_limiter = rate_limiter
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.timeout = timeout
+
+    def download(
+        self,
+        url: str,
+        dest: PathLike,
+        expected_size: Optional[int] = None,
+        expected_sha256: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> DownloadResult:
+        """
+        Downloads `url` to `dest`, resuming a previous partial transfer if one exists.
+        `expected_size` and `expected_sha256` are checked against the decoded content.
+        """
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        part = dest.with_name(dest.name + ".part")
+        # Validators and encoding of the partially transferred body: If-Range when resuming,
+        # and how to decode the body even if the final response (a 416) doesn't say.
+        resume = _read_part_info(part)
+        if part.exists() and not (resume["etag"] or resume["last_modified"]):
+            # Left by an earlier process without a validator: its bytes may be stale.
+            part.unlink()
+        resumed = part.exists() and part.stat().st_size > 0
+
+        info: Optional[Dict[str, Optional[str]]] = None
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                info = self._fetch_to_part(url, part, headers or {}, resume)
+                break
+            except _RESUMABLE_ERRORS as exc:
+                if attempts > self.max_retries:
+                    raise DownloadError(f"Giving up on {url} after {attempts} attempts") from exc
+                resumed = resumed or part.exists()
+
+        if info is None:
+            return DownloadResult(
+                path=dest, size=0, sha256="", attempts=attempts, not_modified=True
+            )
+
+        size, digest = self._finalize(part, dest, (info["encoding"] or "").lower())
+        _part_info_path(part).unlink(missing_ok=True)
+
+        if expected_size is not None and size != expected_size:
+            dest.unlink(missing_ok=True)
+            raise DownloadError(f"Size mismatch for {url}: expected {expected_size}, got {size}")
+        if expected_sha256 is not None and digest != expected_sha256.lower():
+            dest.unlink(missing_ok=True)
+            raise DownloadError(f"Checksum mismatch for {url}")
+
+        return DownloadResult(
+            path=dest,
+            size=size,
+            sha256=digest,
+            resumed=resumed,
+            attempts=attempts,
+            etag=info["etag"],
+            last_modified=info["last_modified"],
+        )
+
+    def _fetch_to_part(
+        self, url: str, part: Path, headers: Dict[str, str], resume: Dict[str, Optional[str]]
+    ) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Appends the remaining bytes of `url` to `part` and returns `resume` as updated for
+        the complete body, or None if a conditional request came back 304 Not Modified.
+        """
+        offset = part.stat().st_size if part.exists() else 0
+        request_headers = {"Accept-Encoding": "gzip", **headers}
+        if offset:
+            request_headers["Range"] = f"bytes={offset}-"
+            # Revalidation headers make no sense when resuming a body we already started.
+            request_headers.pop("If-None-Match", None)
+            request_headers.pop("If-Modified-Since", None)
+            validator = resume["etag"] or resume["last_modified"]
+            if validator:
+                # Only honour the range if the artifact hasn't changed since the first attempt.
+                request_headers["If-Range"] = validator
+
+        def send() -> requests.Response:
+            return self.session.get(url, headers=request_headers, stream=True, timeout=self.timeout)
+
+        response = self.rate_limiter.call(send) if self.rate_limiter else send()
+        with response:
+            if response.status_code == 304:
+                return None
+            if response.status_code == 416 and offset:
+                total = _content_range_total(response.headers.get("Content-Range"))
+                if total == offset:
+                    return resume
+                part.unlink()
+                resume.update(_EMPTY_PART_INFO)
+                return self._fetch_to_part(url, part, headers, resume)
+            response.raise_for_status()
+
+            if offset and response.status_code != 206:
+                # Server ignored the range (or the artifact changed): start over.
+                offset = 0
+            if not offset:
+                resume.update(
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    encoding=response.headers.get("Content-Encoding"),
+                )
+                _part_info_path(part).write_text(json.dumps(resume))
+            with open(part, "ab" if offset else "wb") as fh:
+                fh.writelines(response.raw.stream(self.chunk_size, decode_content=False))
+            return resume
+
+    def _finalize(self, part: Path, dest: Path, encoding: str) -> Tuple[int, str]:
+        """Decodes `part` into `dest` if needed and returns (size, sha256) of the content."""
+        hasher = hashlib.sha256()
+        size = 0
+        if encoding in ("gzip", "x-gzip"):
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            tmp = dest.with_name(dest.name + ".tmp")
+            with open(part, "rb") as src, open(tmp, "wb") as out:
+                for chunk in iter(lambda: src.read(self.chunk_size), b""):
+                    data = decompressor.decompress(chunk)
+                    hasher.update(data)
+                    size += len(data)
+                    out.write(data)
+                data = decompressor.flush()
+                hasher.update(data)
+                size += len(data)
+                out.write(data)
+            os.replace(tmp, dest)
+            part.unlink()
+        else:
+            with open(part, "rb") as src:
+                for chunk in iter(lambda: src.read(self.chunk_size), b""):
+                    hasher.update(chunk)
+                    size += len(chunk)
+            os.replace(part, dest)
+        return size, hasher.hexdigest()
+
+
+def _part_info_path(part: Path) -> Path:
+    return part.with_name(part.name + ".json")
+
+
+def _read_part_info(part: Path) -> Dict[str, Optional[str]]:
+    """The validators and encoding recorded next to `part` when its transfer started."""
+    info = dict(_EMPTY_PART_INFO)
+    path = _part_info_path(part)
+    if part.exists() and path.exists():
+        try:
+            info.update(json.loads(path.read_text()))
+        except ValueError:
+            pass
+    return info
+
+
+def _content_range_total(header: Optional[str]) -> Optional[int]:
+    """Parses the total length out of a `Content-Range: bytes */N` header."""
+    if not header or "/" not in header:
+        return None
+    total = header.rsplit("/", 1)[1].strip()
+    return int(total) if total.isdigit() else None
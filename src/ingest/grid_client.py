@@ -1,48 +1,293 @@
 import os
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, TypeVar
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from src.ingest.queries import GET_MATCH_DETAILS, GET_SERIES_FOR_TEAM
+from src.ingest.cache import ArtifactCache
+from src.ingest.downloader import ArtifactDownloader, DownloadResult, PathLike
+from src.ingest.queries import (
+    GET_MATCH_DETAILS,
+    GET_SERIES_FOR_TEAM,
+    build_batched_match_details_query,
+    match_alias,
+)
+from src.ingest.rate_limiter import AdaptiveRateLimiter
+from src.ingest.response_cache import ResponseCache, shared_response_cache
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_BASE_URL = "https://api.grid.gg/query"
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_BATCH_SIZE = 10
+DEFAULT_PAGE_SIZE = 50
+
+
+def parse_start_time(value: Optional[str]) -> datetime:
+    """Parses a GRID ISO-8601 timestamp into an aware UTC datetime (epoch if missing)."""
+    if not value:
+        return datetime.fromtimestamp(0, tz=timezone.utc)
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _is_document_error(response: Optional[requests.Response]) -> bool:
+    """True for a client error (other than throttling) returned for the GraphQL document."""
+    if response is None:
+        return False
+    return 400 <= response.status_code < 500 and response.status_code != 429
 
 
 class GridClient:
     """Client for interacting with the GRID Esports Data API."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float = DEFAULT_TIMEOUT,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        cache: Optional[ArtifactCache] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        base_url: Optional[str] = None,
+        response_cache: Optional[ResponseCache] = None,
+    ) -> None:
         self.api_key = api_key or os.getenv("GRID_API_KEY")
-        self.base_url = "https://api.grid.gg/query"
+        self.base_url: str = base_url or os.getenv("GRID_API_URL") or DEFAULT_BASE_URL
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.batch_size = max(1, batch_size)
+        self.cache = cache
+        self.response_cache = response_cache or shared_response_cache
+        # Shared by every worker thread, so the whole client stays within one quota.
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
+
+        # One pooled session keeps TCP+TLS connections alive between calls. The pool is
+        # sized to the fan-out limit so parallel fetches never wait on a free connection.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.max_concurrency, pool_maxsize=self.max_concurrency
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.downloader = ArtifactDownloader(session=self.session, rate_limiter=self.rate_limiter)
+
+    def __enter__(self) -> "GridClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the pooled HTTP session."""
+        self.session.close()
 
     def _execute_query(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
         if not self.api_key:
             raise ValueError("GRID_API_KEY not found in environment or provided to client.")
 
-        response = requests.post(
-            self.base_url,
-            json={"query": query, "variables": variables},
-            headers=self.headers,
+        response = self.rate_limiter.call(
+            lambda: self.session.post(
+                self.base_url,
+                json={"query": query, "variables": variables},
+                headers=self.headers,
+                timeout=self.timeout,
+            )
         )
         response.raise_for_status()
         return response.json()
 
-    def get_series_for_team(self, team_id: str, count: int = 10) -> List[Dict[str, Any]]:
-        """Fetches recent series for a specific team."""
-        variables = {"teamId": team_id, "first": count}
-        result = self._execute_query(GET_SERIES_FOR_TEAM, variables)
-        return result.get("data", {}).get("series", {}).get("nodes", [])
+    def _map_concurrent(
+        self, fn: Callable[[T], R], items: Iterable[T], max_concurrency: Optional[int] = None
+    ) -> List[R]:
+        """Applies `fn` to every item on a bounded thread pool, preserving input order."""
+        items = list(items)
+        if not items:
+            return []
+        workers = min(max_concurrency or self.max_concurrency, len(items))
+        if workers == 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="grid") as executor:
+            return list(executor.map(fn, items))
+
+    def get_series_for_team(
+        self,
+        team_id: str,
+        count: Optional[int] = 10,
+        since: Optional[datetime] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        since_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetches up to `count` recent series for a specific team, newest first. With `since`,
+        only series that started after it are returned and paging stops at the first older
+        one, so an incremental refresh costs requests in proportion to the new series.
+        Passing the watermark's series ID as `since_id` also returns series that started at
+        exactly `since` and sort after it by ID.
+        A `count` of None pages through everything newer than `since`.
+        Results are cached briefly and identical concurrent calls share one fetch.
+        """
+        key = ("series", self.base_url, team_id, count, since, since_id, page_size)
+        return self.response_cache.get_or_fetch(
+            key, lambda: self._fetch_series_for_team(team_id, count, since, since_id, page_size)
+        )
+
+    def _fetch_series_for_team(
+        self,
+        team_id: str,
+        count: Optional[int],
+        since: Optional[datetime],
+        since_id: Optional[str],
+        page_size: int,
+    ) -> List[Dict[str, Any]]:
+        series: List[Dict[str, Any]] = []
+        cursor: Optional[str] = None
+        while count is None or len(series) < count:
+            remaining = page_size if count is None else count - len(series)
+            variables: Dict[str, Any] = {"teamId": team_id, "first": min(page_size, remaining)}
+            if cursor:
+                variables["after"] = cursor
+            result = self._execute_query(GET_SERIES_FOR_TEAM, variables)
+            page = result.get("data", {}).get("series", {})
+            for node in page.get("nodes", []):
+                if since is not None:
+                    started = parse_start_time(node.get("startTime"))
+                    if started < since:
+                        return series
+                    # Series sharing the watermark's start time are ordered by ID.
+                    if started == since and (since_id is None or node.get("id", "") <= since_id):
+                        continue
+                series.append(node)
+            page_info = page.get("pageInfo") or {}
+            cursor = page_info.get("endCursor")
+            if not page_info.get("hasNextPage") or not cursor:
+                break
+        return series
+
+    def _match_key(self, match_id: str) -> Tuple[str, str, str]:
+        return ("match", self.base_url, match_id)
 
     def get_match_details(self, match_id: str) -> Dict[str, Any]:
         """Fetches detailed information for a specific match, including artifact URLs."""
+        return self.response_cache.get_or_fetch(
+            self._match_key(match_id), lambda: self._fetch_match_details(match_id)
+        )
+
+    def _fetch_match_details(self, match_id: str) -> Dict[str, Any]:
         variables = {"matchId": match_id}
         result = self._execute_query(GET_MATCH_DETAILS, variables)
         return result.get("data", {}).get("match", {})
 
+    def get_match_details_batch(self, match_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetches several matches in one aliased GraphQL request, in the order given.
+        Matches the batch could not resolve, or all of them if the server rejects the
+        document, are retried one by one; throttling, server and network errors propagate.
+        Cached matches are not requested, and matches another caller is already fetching
+        (alone or in a batch) are waited for rather than requested again.
+        """
+        ids: Dict[Hashable, str] = {self._match_key(match_id): match_id for match_id in match_ids}
+        return self.response_cache.get_or_fetch_many(
+            [self._match_key(match_id) for match_id in match_ids],
+            lambda keys: self._fetch_match_details_batch([ids[key] for key in keys]),
+        )
+
+    def _fetch_match_details_batch(self, match_ids: List[str]) -> List[Dict[str, Any]]:
+        # Runs while this caller owns the flight of every ID, so retries must bypass the
+        # response cache (waiting on those flights would wait on ourselves).
+        if len(match_ids) == 1:
+            return [self._fetch_match_details(match_ids[0])]
+
+        query = build_batched_match_details_query(len(match_ids))
+        variables = {match_alias(i): match_id for i, match_id in enumerate(match_ids)}
+        try:
+            result = self._execute_query(query, variables)
+        except requests.HTTPError as exc:
+            # A rejected document may be down to one bad ID, so isolate the culprit. Throttling
+            # and server errors would just fail N more times.
+            if not _is_document_error(exc.response):
+                raise
+            return [self._fetch_match_details(match_id) for match_id in match_ids]
+
+        data = result.get("data") or {}
+        failed_aliases = {
+            error["path"][0] for error in result.get("errors") or [] if error.get("path")
+        }
+        details = []
+        for i, match_id in enumerate(match_ids):
+            alias = match_alias(i)
+            match = data.get(alias)
+            if match is None or alias in failed_aliases:
+                match = self._fetch_match_details(match_id)
+            details.append(match)
+        return details
+
+    def get_match_details_many(
+        self, match_ids: Iterable[str], max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetches details for many matches in parallel batches, in the order given.
+        Only matches missing from the response cache are requested.
+        """
+        match_ids = list(match_ids)
+        found = {
+            match_id: self.response_cache.peek(self._match_key(match_id)) for match_id in match_ids
+        }
+        missing = list(dict.fromkeys(m for m in match_ids if found[m] is None))
+        batches = [
+            missing[i : i + self.batch_size] for i in range(0, len(missing), self.batch_size)
+        ]
+        results = self._map_concurrent(self.get_match_details_batch, batches, max_concurrency)
+        for batch, details in zip(batches, results):
+            found.update(zip(batch, details))
+        return [found[match_id] for match_id in match_ids]
+
+    def get_match_details_for_series(
+        self, series: Iterable[Dict[str, Any]], max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetches details for every match of the given series nodes in parallel."""
+        match_ids = [match["id"] for node in series for match in node.get("matches") or []]
+        return self.get_match_details_many(match_ids, max_concurrency)
+
     def download_artifact(self, url: str) -> Dict[str, Any]:
         """Downloads a telemetry artifact (JSON) from the provided URL."""
-        response = requests.get(url)
+        response = self.rate_limiter.call(lambda: self.session.get(url, timeout=self.timeout))
         response.raise_for_status()
         return response.json()
+
+    def download_artifact_to(self, url: str, dest: PathLike) -> DownloadResult:
+        """Streams a telemetry artifact to `dest` without holding it in memory."""
+        return self.downloader.download(url, dest)
+
+    def download_artifacts(
+        self,
+        artifacts: Iterable[Dict[str, Any]],
+        dest_dir: Optional[PathLike] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[Path]:
+        """
+        Fetches several artifacts (nodes with `id` and `url`) in parallel and returns their
+        local paths in the order given. With a cache configured, artifacts are served from
+        and stored in it; otherwise each is streamed to `dest_dir/<artifact id>.json`.
+        """
+
+        def fetch(artifact: Dict[str, Any]) -> Path:
+            if self.cache is not None:
+                return self.cache.fetch(artifact["id"], artifact["url"], self.downloader)
+            if dest_dir is None:
+                raise ValueError("dest_dir is required when the client has no artifact cache.")
+            dest = Path(dest_dir) / f"{artifact['id']}.json"
+            return self.download_artifact_to(artifact["url"], dest).path
+
+        return self._map_concurrent(fetch, artifacts, max_concurrency)
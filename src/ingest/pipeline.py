@@ -0,0 +1,258 @@
+import itertools
+import os
+import queue
+import threading
+import time
+from contextlib import closing
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.db.duckdb_client import DuckDBClient
+from src.db.repositories.events_repo import EventsRepository
+from src.ingest.cache import open_artifact
+from src.ingest.grid_client import GridClient, parse_start_time
+from src.parsers.valorant.batch_parser import parse_many
+
+DEFAULT_QUEUE_SIZE = 16
+DEFAULT_LOAD_BATCH_SIZE = 8
+
+# Marks the end of a stage's output on the queue feeding the next stage.
+_DONE = object()
+
+
+def select_telemetry_artifact(match: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Picks the telemetry artifact of a match, if GRID published one."""
+    artifacts: List[Dict[str, Any]] = [a for a in match.get("artifacts") or [] if a.get("url")]
+    for artifact in artifacts:
+        if "telemetry" in (artifact.get("type") or "").lower():
+            return artifact
+    return artifacts[0] if artifacts else None
+
+
+def build_match_record(
+    team_id: str, match: Dict[str, Any], parsed: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Combines GRID match metadata with parsed telemetry into a row for `insert_matches`."""
+    opponents = [t["id"] for t in match.get("teams") or [] if t.get("id") != team_id]
+    return {
+        **parsed,
+        "match_id": match["id"],
+        "team_id": team_id,
+        "opponent_id": opponents[0] if opponents else None,
+        "map_name": (match.get("map") or {}).get("name") or parsed.get("map_name"),
+        "start_time": parse_start_time(match.get("startTime")).replace(tzinfo=None),
+    }
+
+
+@dataclass
+class StageStats:
+    """Throughput and busy time of one pipeline stage."""
+
+    name: str
+    workers: int
+    items: int = 0
+    failures: int = 0
+    busy_seconds: float = 0.0
+    wall_seconds: float = 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the stage's worker capacity spent doing work rather than waiting."""
+        capacity = self.wall_seconds * self.workers
+        return self.busy_seconds / capacity if capacity else 0.0
+
+
+@dataclass
+class PipelineResult:
+    """Outcome of an ingest pipeline run."""
+
+    loaded: int = 0
+    failed: List[Tuple[str, str]] = field(default_factory=list)
+    # Matches that were not attempted, with the reason (e.g. no telemetry published yet).
+    skipped: List[Tuple[str, str]] = field(default_factory=list)
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+
+    def summary(self) -> str:
+        return "  ".join(
+            f"{s.name}: {s.items} items, {s.utilization:.0%} busy" for s in self.stages.values()
+        )
+
+
+class IngestPipeline:
+    """
+    Overlapped download -> parse -> load ingest.
+
+    Downloads run on a thread pool, CPU-bound parsing in a process pool (`parse_many`, so a
+    crashed worker fails only its own match) and DB loading on a single thread that commits
+    in batches. Stages are joined by bounded queues, so a slow
+    stage blocks its producers instead of letting downloaded or parsed matches pile up in
+    memory, while the network, CPU and disk all stay busy during a large backfill.
+    """
+
+    def __init__(
+        self,
+        client: GridClient,
+        db: DuckDBClient,
+        download_workers: Optional[int] = None,
+        parse_workers: Optional[int] = None,
+        load_batch_size: int = DEFAULT_LOAD_BATCH_SIZE,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        parse_memory_limit_mb: Optional[int] = None,
+        parse_cache_dir: Optional[str] = None,
+        events: Optional[EventsRepository] = None,
+    ) -> None:
+        self.client = client
+        self.db = db
+        self.download_workers = download_workers or client.max_concurrency
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.load_batch_size = load_batch_size
+        self.queue_size = queue_size
+        self.parse_memory_limit_mb = parse_memory_limit_mb
+        self.parse_cache_dir = parse_cache_dir
+        # When set, parsed event batches are also written to the Parquet event store.
+        self.events = events
+
+    def run(self, team_id: str, matches: List[Dict[str, Any]]) -> PipelineResult:
+        """Downloads, parses and loads `matches` (GRID match details) for `team_id`."""
+        result = PipelineResult(
+            stages={
+                "download": StageStats("download", self.download_workers),
+                "parse": StageStats("parse", self.parse_workers),
+                "load": StageStats("load", 1),
+            }
+        )
+        lock = threading.Lock()
+        download_q: "queue.Queue[Any]" = queue.Queue()
+        parse_q: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        load_q: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+
+        for match in matches:
+            artifact = select_telemetry_artifact(match)
+            if artifact is None:
+                result.skipped.append((match["id"], "no telemetry artifact"))
+            else:
+                download_q.put((match, artifact))
+
+        def fail(stage: str, match: Dict[str, Any], exc: BaseException) -> None:
+            with lock:
+                result.stages[stage].failures += 1
+                result.failed.append((match["id"], f"{stage}: {exc}"))
+
+        def download_worker() -> None:
+            stats = result.stages["download"]
+            while True:
+                try:
+                    match, artifact = download_q.get_nowait()
+                except queue.Empty:
+                    return
+                started = time.perf_counter()
+                try:
+                    (path,) = self.client.download_artifacts([artifact], max_concurrency=1)
+                except Exception as exc:
+                    fail("download", match, exc)
+                    continue
+                with lock:
+                    stats.items += 1
+                    stats.busy_seconds += time.perf_counter() - started
+                parse_q.put((match, str(path)))
+
+        def parse_stage() -> None:
+            stats = result.stages["parse"]
+            submitted: Dict[int, Dict[str, Any]] = {}
+            inputs_done = False
+
+            def paths() -> Iterator[str]:
+                nonlocal inputs_done
+                for index in itertools.count():
+                    item = parse_q.get()
+                    if item is _DONE:
+                        inputs_done = True
+                        return
+                    match, path = item
+                    submitted[index] = match
+                    yield path
+
+            # parse_many pins a dead worker on its artifact and carries on in a new pool.
+            outcomes = parse_many(
+                paths(),
+                max_workers=self.parse_workers,
+                ordered=False,
+                columnar=self.events is not None,
+                opener=open_artifact,
+                cache_dir=self.parse_cache_dir,
+                memory_limit_mb=self.parse_memory_limit_mb,
+            )
+            try:
+                # Closing stops parse_many reading `paths()`, so only this thread drains parse_q.
+                with closing(outcomes):
+                    for outcome in outcomes:
+                        match = submitted.pop(outcome.index)
+                        try:
+                            if outcome.parsed is None:
+                                raise RuntimeError(outcome.error)
+                            record = build_match_record(team_id, match, outcome.parsed)
+                        except Exception as exc:
+                            fail("parse", match, exc)
+                            continue
+                        with lock:
+                            stats.items += 1
+                            stats.busy_seconds += outcome.seconds
+                        load_q.put(record)
+            except Exception as exc:
+                # The pool itself failed: fail what it held and what is still queued for it.
+                for match in submitted.values():
+                    fail("parse", match, exc)
+                while not inputs_done:
+                    item = parse_q.get()
+                    inputs_done = item is _DONE
+                    if not inputs_done:
+                        fail("parse", item[0], exc)
+            finally:
+                load_q.put(_DONE)
+
+        # Event files are written inside the load transaction, so they commit with the rows.
+        write_events = self.events.write_matches if self.events is not None else None
+
+        def loader() -> None:
+            stats = result.stages["load"]
+            batch: List[Dict[str, Any]] = []
+            done = False
+            while not done:
+                item = load_q.get()
+                if item is _DONE:
+                    done = True
+                else:
+                    batch.append(item)
+                if batch and (done or len(batch) >= self.load_batch_size):
+                    started = time.perf_counter()
+                    try:
+                        self.db.insert_matches(batch, before_commit=write_events)
+                    except Exception as exc:
+                        for record in batch:
+                            fail("load", {"id": record["match_id"]}, exc)
+                    else:
+                        with lock:
+                            stats.items += len(batch)
+                            result.loaded += len(batch)
+                    stats.busy_seconds += time.perf_counter() - started
+                    batch = []
+
+        started = time.perf_counter()
+        downloaders = [
+            threading.Thread(target=download_worker, name=f"ingest-download-{i}")
+            for i in range(self.download_workers)
+        ]
+        parser = threading.Thread(target=parse_stage, name="ingest-parse")
+        load_thread = threading.Thread(target=loader, name="ingest-load")
+        for thread in [*downloaders, parser, load_thread]:
+            thread.start()
+        for thread in downloaders:
+            thread.join()
+        parse_q.put(_DONE)
+        parser.join()
+        load_thread.join()
+
+        elapsed = time.perf_counter() - started
+        for stats in result.stages.values():
+            stats.wall_seconds = elapsed
+        return result
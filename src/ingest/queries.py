@@ -1,6 +1,17 @@
+from typing import List
+
 GET_SERIES_FOR_TEAM = """
-query GetSeriesForTeam($teamId: ID!, $first: Int) {
-  series(filter: {teamIds: [$teamId]}, first: $first, orderBy: {direction: DESC, field: START_TIME}) {
+query GetSeriesForTeam($teamId: ID!, $first: Int, $after: Cursor) {
+  series(
+    filter: {teamIds: [$teamId]}
+    first: $first
+    after: $after
+    orderBy: {direction: DESC, field: START_TIME}
+  ) {
+    pageInfo {
+      hasNextPage
+      endCursor
+    }
     nodes {
       id
       startTime
@@ -19,9 +30,7 @@ query GetSeriesForTeam($teamId: ID!, $first: Int) {
 }
 """
 
-GET_MATCH_DETAILS = """
-query GetMatchDetails($matchId: ID!) {
-  match(id: $matchId) {
+MATCH_DETAILS_FIELDS = """
     id
     startTime
     map {
@@ -37,6 +46,30 @@ query GetMatchDetails($matchId: ID!) {
       type
       url
     }
-  }
-}
 """
+
+GET_MATCH_DETAILS = f"""
+query GetMatchDetails($matchId: ID!) {{
+  match(id: $matchId) {{{MATCH_DETAILS_FIELDS}  }}
+}}
+"""
+
+
+def match_alias(index: int) -> str:
+    """Returns the field alias used for the `index`-th match of a batched query."""
+    return f"m{index}"
+
+
+def build_batched_match_details_query(count: int) -> str:
+    """
+    Builds one GraphQL document fetching `count` matches under aliases m0..m{count-1}.
+    Match IDs are passed as variables named after the aliases.
+    """
+    if count < 1:
+        raise ValueError("A batched match query needs at least one match.")
+    aliases: List[str] = [match_alias(i) for i in range(count)]
+    params = ", ".join(f"${alias}: ID!" for alias in aliases)
+    fields = "".join(
+        f"  {alias}: match(id: ${alias}) {{{MATCH_DETAILS_FIELDS}  }}\n" for alias in aliases
+    )
+    return f"query GetMatchDetailsBatch({params}) {{\n{fields}}}\n"
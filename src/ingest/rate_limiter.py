@@ -0,0 +1,183 @@
+import random
+import threading
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Mapping, Optional
+
+import requests
+
+DEFAULT_RATE = 5.0
+DEFAULT_MIN_RATE = 0.2
+DEFAULT_MAX_RATE = 50.0
+DEFAULT_MAX_RETRIES = 5
+
+# Statuses that mean "slow down": they shrink the request rate as well as being retried.
+THROTTLE_STATUSES = frozenset({429, 503})
+# Transient upstream failures that are retried with backoff but don't affect the rate.
+RETRY_STATUSES = THROTTLE_STATUSES | {502, 504}
+
+
+@dataclass
+class RateLimiterStats:
+    """Counters for sizing ingest workers against the GRID quota."""
+
+    requests: int = 0
+    throttled: int = 0
+    retries: int = 0
+    wait_seconds: float = 0.0
+    current_rate: float = 0.0
+
+
+class AdaptiveRateLimiter:
+    """
+    Token-bucket rate limiter shared by every thread of a GridClient.
+
+    The refill rate adapts AIMD-style: each successful response nudges it up additively,
+    each 429/503 halves it. `Retry-After` and `X-RateLimit-Remaining`/`X-RateLimit-Reset`
+    headers take precedence over the estimate, and a throttle pauses all callers until the
+    server's deadline so parallel workers don't keep hammering a closed window.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: Optional[float] = None,
+        min_rate: float = DEFAULT_MIN_RATE,
+        max_rate: float = DEFAULT_MAX_RATE,
+        increase: float = 1.0,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = min(max(rate, min_rate), max_rate)
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._last_refill = clock()
+        self._blocked_until = 0.0
+        self._stats = RateLimiterStats(current_rate=rate)
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        """Returns a consistent snapshot of the counters."""
+        with self._lock:
+            return replace(self._stats, current_rate=self.rate)
+
+    def acquire(self) -> float:
+        """Blocks until a request may be sent; returns the time spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                delay = self._blocked_until - now
+                if delay <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        self._stats.requests += 1
+                        self._stats.wait_seconds += waited
+                        return waited
+                    delay = (1 - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+    def on_success(self, headers: Optional[Mapping[str, str]] = None) -> None:
+        """Grows the rate after a successful response, within the server's advertised budget."""
+        with self._lock:
+            # `rate` successes take about a second, so this adds ~`increase` req/s per second.
+            self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+            budget = _advertised_rate(headers or {})
+            if budget is not None:
+                self.rate = max(self.min_rate, min(self.rate, budget))
+
+    def on_throttle(self, headers: Optional[Mapping[str, str]] = None, attempt: int = 0) -> float:
+        """Shrinks the rate after a throttling response and returns how long to back off."""
+        retry_after = parse_retry_after((headers or {}).get("Retry-After"))
+        backoff = min(self.max_backoff, self.base_backoff * 2**attempt)
+        # Full jitter keeps workers that were throttled together from retrying together.
+        delay = retry_after if retry_after is not None else random.uniform(0, backoff)
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            self._blocked_until = max(self._blocked_until, self._clock() + delay)
+            self._stats.throttled += 1
+        return delay
+
+    def call(self, send: Callable[[], requests.Response]) -> requests.Response:
+        """
+        Sends a request through the limiter, retrying throttled and transient failures.
+        The final response is returned as-is, so callers still `raise_for_status()`.
+        """
+        attempt = 0
+        while True:
+            self.acquire()
+            response = send()
+            if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                if response.status_code < 400:
+                    self.on_success(response.headers)
+                return response
+
+            if response.status_code in THROTTLE_STATUSES:
+                delay = self.on_throttle(response.headers, attempt)
+            else:
+                delay = random.uniform(0, min(self.max_backoff, self.base_backoff * 2**attempt))
+            response.close()
+            with self._lock:
+                self._stats.retries += 1
+                self._stats.wait_seconds += delay
+            self._sleep(delay)
+            attempt += 1
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header given either as seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        deadline = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if deadline.tzinfo is None:
+        deadline = deadline.replace(tzinfo=timezone.utc)
+    return max(0.0, (deadline - datetime.now(timezone.utc)).total_seconds())
+
+
+def _advertised_rate(headers: Mapping[str, str]) -> Optional[float]:
+    """Derives the sustainable rate from X-RateLimit-Remaining / X-RateLimit-Reset headers."""
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is None or reset is None:
+        return None
+    try:
+        remaining_count = float(remaining)
+        reset_seconds = float(reset)
+    except ValueError:
+        return None
+    # Some servers send an epoch timestamp rather than a delta.
+    if reset_seconds > time.time() / 2:
+        reset_seconds -= time.time()
+    if reset_seconds <= 0:
+        return None
+    return remaining_count / reset_seconds
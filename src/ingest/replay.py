@@ -0,0 +1,408 @@
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+from urllib.parse import quote, unquote
+
+from src.ingest.grid_client import GridClient
+
+DEFAULT_REPLAY_DIR = "data/replay"
+
+_BATCH_ALIAS = re.compile(r"^m\d+$")
+
+
+class ReplayStore:
+    """
+    Recorded GRID responses on disk.
+
+    Data is stored by entity rather than by raw request, so the stand-in server can answer
+    any page size, cursor or batch size the client under test chooses:
+
+        series/<team id>.json     all recorded series nodes, newest first
+        matches/<match id>.json   match details, artifact URLs as originally served
+        artifacts/<artifact id>   raw artifact bytes
+    """
+
+    def __init__(self, root: Union[str, os.PathLike] = DEFAULT_REPLAY_DIR) -> None:
+        self.root = Path(root)
+        for sub in ("series", "matches", "artifacts"):
+            (self.root / sub).mkdir(parents=True, exist_ok=True)
+
+    def _path(self, kind: str, key: str) -> Path:
+        return self.root / kind / quote(key, safe="")
+
+    def save_series(self, team_id: str, series: List[Dict[str, Any]]) -> None:
+        self._path("series", team_id).write_text(json.dumps(series), encoding="utf-8")
+
+    def load_series(self, team_id: str) -> List[Dict[str, Any]]:
+        path = self._path("series", team_id)
+        return json.loads(path.read_text(encoding="utf-8")) if path.exists() else []
+
+    def save_match(self, match: Dict[str, Any]) -> None:
+        self._path("matches", match["id"]).write_text(json.dumps(match), encoding="utf-8")
+
+    def load_match(self, match_id: str) -> Optional[Dict[str, Any]]:
+        path = self._path("matches", match_id)
+        return json.loads(path.read_text(encoding="utf-8")) if path.exists() else None
+
+    def artifact_path(self, artifact_id: str) -> Path:
+        return self._path("artifacts", artifact_id)
+
+    def teams(self) -> List[str]:
+        return [unquote(path.name) for path in (self.root / "series").iterdir()]
+
+
+def record_team(client: GridClient, store: ReplayStore, team_id: str, count: int) -> int:
+    """Captures a team's recent series, their match details and artifacts into `store`."""
+    series = client.get_series_for_team(team_id, count=count)
+    store.save_series(team_id, series)
+    matches = client.get_match_details_for_series(series)
+    artifacts: List[Dict[str, Any]] = []
+    for match in matches:
+        store.save_match(match)
+        artifacts.extend(a for a in match.get("artifacts") or [] if a.get("url"))
+    for artifact in artifacts:
+        client.download_artifact_to(artifact["url"], store.artifact_path(artifact["id"]))
+    return len(matches)
+
+
+SYNTHETIC_MAPS = ("Ascent", "Bind", "Haven", "Lotus", "Sunset", "Split", "Icebox")
+SYNTHETIC_AGENTS = ("Jett", "Sova", "Omen", "Killjoy", "Skye", "Raze", "Viper", "Cypher")
+SYNTHETIC_WEAPONS = ("Vandal", "Phantom", "Operator", "Sheriff")
+SYNTHETIC_ABILITY_SLOTS = ("C", "Q", "E", "X")
+
+
+def synthetic_telemetry(
+    match_id: str, map_name: str, team_ids: Sequence[str], rounds: int = 24, seed: int = 0
+) -> Dict[str, Any]:
+    """Builds a telemetry document with realistic shape and volume for load testing."""
+    rng = random.Random(seed)
+    players = [
+        {
+            "id": f"{team_id}-p{i}",
+            "name": f"{team_id} player {i}",
+            "teamId": team_id,
+            "agent": rng.choice(SYNTHETIC_AGENTS),
+        }
+        for team_id in team_ids
+        for i in range(5)
+    ]
+    events: List[Dict[str, Any]] = []
+    for round_number in range(1, rounds + 1):
+        tick = round_number * 10_000
+        events.append({"type": "round_start", "round": round_number, "tick": tick})
+        for step in range(0, 100, 4):
+            for player in players:
+                events.append(
+                    {
+                        "type": "position",
+                        "round": round_number,
+                        "tick": tick + step * 10,
+                        "playerId": player["id"],
+                        "x": rng.uniform(-5000, 5000),
+                        "y": rng.uniform(-5000, 5000),
+                        "z": 0.0,
+                    }
+                )
+        for player in rng.sample(players, 4):
+            events.append(
+                {
+                    "type": "ability_cast",
+                    "round": round_number,
+                    "tick": tick + rng.randint(0, 1000),
+                    "playerId": player["id"],
+                    "ability": rng.choice(SYNTHETIC_ABILITY_SLOTS),
+                }
+            )
+        for _ in range(rng.randint(3, 9)):
+            killer, victim, assistant = rng.sample(players, 3)
+            kill_tick = tick + rng.randint(0, 1000)
+            weapon = rng.choice(SYNTHETIC_WEAPONS)
+            events.append(
+                {
+                    "type": "damage",
+                    "round": round_number,
+                    "tick": kill_tick,
+                    "attackerId": killer["id"],
+                    "victimId": victim["id"],
+                    "weapon": weapon,
+                    "amount": float(rng.choice((100, 150))),
+                }
+            )
+            events.append(
+                {
+                    "type": "kill",
+                    "round": round_number,
+                    "tick": kill_tick,
+                    "killerId": killer["id"],
+                    "victimId": victim["id"],
+                    "assistantIds": [assistant["id"]] if rng.random() < 0.4 else [],
+                    "weapon": weapon,
+                    "headshot": rng.random() < 0.3,
+                }
+            )
+        win_type = rng.choice(("elimination", "detonate", "defuse", "time"))
+        if win_type in ("detonate", "defuse"):
+            site = rng.choice(("A", "B"))
+            planter, defuser = rng.choice(players), rng.choice(players)
+            events.append(
+                {
+                    "type": "plant",
+                    "round": round_number,
+                    "tick": tick + 600,
+                    "playerId": planter["id"],
+                    "site": site,
+                }
+            )
+            if win_type == "defuse":
+                events.append(
+                    {
+                        "type": "defuse",
+                        "round": round_number,
+                        "tick": tick + 900,
+                        "playerId": defuser["id"],
+                        "site": site,
+                    }
+                )
+        events.append(
+            {
+                "type": "round_end",
+                "round": round_number,
+                "tick": tick + 1000,
+                "winningTeamId": rng.choice(list(team_ids)),
+                "winningSide": rng.choice(("attack", "defense")),
+                "winType": win_type,
+            }
+        )
+    return {
+        "matchId": match_id,
+        "mapName": map_name,
+        "teams": [{"id": team_id, "name": team_id} for team_id in team_ids],
+        "players": players,
+        "events": events,
+    }
+
+
+def build_synthetic_store(
+    store: ReplayStore, team_id: str, series_count: int = 20, maps_per_series: int = 2
+) -> int:
+    """Fills `store` with generated series, matches and telemetry for `team_id`."""
+    series: List[Dict[str, Any]] = []
+    for s in range(series_count):
+        opponent = f"opponent-{s}"
+        start_time = f"2024-{1 + s // 28:02d}-{1 + s % 28:02d}T18:00:00Z"
+        matches: List[Dict[str, Any]] = []
+        for m in range(maps_per_series):
+            match_id = f"{team_id}-s{s}-m{m}"
+            map_name = SYNTHETIC_MAPS[(s + m) % len(SYNTHETIC_MAPS)]
+            artifact_id = f"{match_id}-telemetry"
+            telemetry = synthetic_telemetry(
+                match_id, map_name, (team_id, opponent), seed=s * 10 + m
+            )
+            store.artifact_path(artifact_id).write_text(json.dumps(telemetry), encoding="utf-8")
+            store.save_match(
+                {
+                    "id": match_id,
+                    "startTime": start_time,
+                    "map": {"name": map_name},
+                    "teams": [{"id": team_id, "name": team_id}, {"id": opponent, "name": opponent}],
+                    "artifacts": [{"id": artifact_id, "type": "telemetry", "url": ""}],
+                }
+            )
+            matches.append({"id": match_id, "map": {"name": map_name}})
+        series.append(
+            {
+                "id": f"{team_id}-s{s}",
+                "startTime": start_time,
+                "teams": [{"id": team_id, "name": team_id}, {"id": opponent, "name": opponent}],
+                "matches": matches,
+            }
+        )
+    series.sort(key=lambda node: node["startTime"], reverse=True)
+    store.save_series(team_id, series)
+    return series_count * maps_per_series
+
+
+class StandInServer:
+    """
+    Local HTTP stand-in for the GRID API that serves a ReplayStore.
+
+    It answers the client's series, match and batched-match GraphQL queries and serves
+    artifacts with ETag and Range support. Network conditions can be shaped with a fixed
+    per-request `latency` (seconds), a per-connection `bandwidth` cap (bytes/second) and an
+    `error_rate` of injected failures drawn from `error_statuses`.
+    """
+
+    def __init__(
+        self,
+        store: ReplayStore,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        error_rate: float = 0.0,
+        error_statuses: Sequence[int] = (429, 503),
+        retry_after: float = 0.5,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.store = store
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.retry_after = retry_after
+        self.requests_served = 0
+        self.errors_injected = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_port}"
+
+    @property
+    def graphql_url(self) -> str:
+        return f"{self.url}/query"
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _should_fail(self) -> Optional[int]:
+        with self._lock:
+            self.requests_served += 1
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.errors_injected += 1
+                return self._random.choice(self.error_statuses)
+        return None
+
+    def _rewrite_match(self, match: Dict[str, Any]) -> Dict[str, Any]:
+        artifacts = [
+            {**a, "url": f"{self.url}/artifacts/{quote(a['id'], safe='')}"}
+            for a in match.get("artifacts") or []
+        ]
+        return {**match, "artifacts": artifacts}
+
+    def _answer_query(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        if "GetSeriesForTeam" in query:
+            nodes = self.store.load_series(variables["teamId"])
+            offset = int(variables.get("after") or 0)
+            end = offset + int(variables.get("first") or len(nodes))
+            return {
+                "data": {
+                    "series": {
+                        "pageInfo": {"hasNextPage": end < len(nodes), "endCursor": str(end)},
+                        "nodes": nodes[offset:end],
+                    }
+                }
+            }
+        if "GetMatchDetailsBatch" in query:
+            data: Dict[str, Any] = {}
+            errors = []
+            for alias, match_id in variables.items():
+                if not _BATCH_ALIAS.match(alias):
+                    continue
+                match = self.store.load_match(match_id)
+                data[alias] = self._rewrite_match(match) if match else None
+                if match is None:
+                    errors.append({"message": f"match {match_id} not found", "path": [alias]})
+            return {"data": data, "errors": errors} if errors else {"data": data}
+        if "GetMatchDetails" in query:
+            match = self.store.load_match(variables["matchId"])
+            return {"data": {"match": self._rewrite_match(match) if match else None}}
+        return {"errors": [{"message": "unsupported query"}]}
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def _begin(self) -> bool:
+                if server.latency:
+                    time.sleep(server.latency)
+                status = server._should_fail()
+                if status is None:
+                    return True
+                self.send_response(status)
+                self.send_header("Retry-After", str(server.retry_after))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return False
+
+            def _write(self, body: bytes) -> None:
+                if not server.bandwidth:
+                    self.wfile.write(body)
+                    return
+                chunk = max(1024, int(server.bandwidth / 20))
+                for start in range(0, len(body), chunk):
+                    self.wfile.write(body[start : start + chunk])
+                    time.sleep(chunk / server.bandwidth)
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                if not self._begin():
+                    return
+                body = json.dumps(
+                    server._answer_query(payload.get("query", ""), payload.get("variables", {}))
+                ).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self._write(body)
+
+            def do_GET(self) -> None:
+                if not self._begin():
+                    return
+                artifact_id = unquote(self.path.rsplit("/", 1)[-1])
+                path = server.store.artifact_path(artifact_id)
+                if not self.path.startswith("/artifacts/") or not path.exists():
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body = path.read_bytes()
+                etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                start = 0
+                range_header = self.headers.get("Range", "")
+                if range_header.startswith("bytes="):
+                    start = int(range_header[len("bytes=") :].split("-")[0] or 0)
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+                else:
+                    self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body) - start))
+                self.end_headers()
+                self._write(body[start:])
+
+        return Handler
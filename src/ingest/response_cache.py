@@ -0,0 +1,173 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, TypeVar, cast
+
+T = TypeVar("T")
+
+DEFAULT_TTL = 300.0
+DEFAULT_MAX_ENTRIES = 4096
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe in-memory cache whose entries expire `ttl` seconds after being stored."""
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drops one entry, or everything when no key is given."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key: the first caller runs the function and
+    every caller that arrives while it is in flight receives the same result (or error).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # Futures of different calls hold different result types.
+        self._calls: Dict[Hashable, "Future[Any]"] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        assert future is not None
+        if not leader:
+            return cast(T, future.result())
+
+        try:
+            future.set_result(fn())
+        except BaseException as exc:
+            future.set_exception(exc)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        return cast(T, future.result())
+
+    def do_many(self, keys: Sequence[Hashable], fn: Callable[[List[Hashable]], List[T]]) -> List[T]:
+        """
+        Like `do` for several keys at once: keys already in flight wait for their call, and
+        `fn` runs once with the remaining keys, returning one result per key in that order.
+        """
+        with self._lock:
+            futures: Dict[Hashable, "Future[Any]"] = {}
+            led: List[Hashable] = []
+            for key in keys:
+                if key in futures:
+                    continue
+                future = self._calls.get(key)
+                if future is None:
+                    future = self._calls[key] = Future()
+                    led.append(key)
+                futures[key] = future
+        if led:
+            try:
+                for key, value in zip(led, fn(led), strict=True):
+                    futures[key].set_result(value)
+            except BaseException as exc:
+                for key in led:
+                    if not futures[key].done():
+                        futures[key].set_exception(exc)
+            finally:
+                with self._lock:
+                    for key in led:
+                        del self._calls[key]
+        return [cast(T, futures[key].result()) for key in keys]
+
+
+class ResponseCache:
+    """TTL cache in front of a SingleFlight group; values are copied out to callers."""
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.entries = TTLCache(ttl=ttl, max_entries=max_entries)
+        self.flights = SingleFlight()
+
+    def peek(self, key: Hashable) -> Any:
+        """Returns a copy of the cached value for `key`, or None."""
+        value = self.entries.get(key, _MISSING)
+        return None if value is _MISSING else copy.deepcopy(value)
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], T]) -> T:
+        """Returns the cached value for `key`, fetching it once across concurrent callers."""
+        value = self.entries.get(key, _MISSING)
+        if value is not _MISSING:
+            # Only `fetch` results for this key are stored under it.
+            return cast(T, copy.deepcopy(value))
+
+        def load() -> T:
+            result = fetch()
+            self.entries.set(key, result)
+            return result
+
+        return copy.deepcopy(self.flights.do(key, load))
+
+    def get_or_fetch_many(
+        self, keys: Sequence[Hashable], fetch: Callable[[List[Hashable]], List[T]]
+    ) -> List[T]:
+        """
+        `get_or_fetch` for several keys: the keys neither cached nor already being fetched by
+        another caller are fetched with one call to `fetch`, which returns their values in
+        the order of the keys it is given.
+        """
+        values = {key: self.entries.get(key, _MISSING) for key in keys}
+        missing = [key for key, value in values.items() if value is _MISSING]
+
+        def load(pending: List[Hashable]) -> List[T]:
+            results = fetch(pending)
+            for key, result in zip(pending, results):
+                self.entries.set(key, result)
+            return results
+
+        if missing:
+            values.update(zip(missing, self.flights.do_many(missing, load)))
+        return [cast(T, copy.deepcopy(values[key])) for key in keys]
+
+
+# Shared by every GridClient in the process, so concurrent Streamlit sessions and ingest
+# workers asking for the same opponent share one request.
+shared_response_cache = ResponseCache()
@@ -0,0 +1,277 @@
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Optional, Tuple, Union
+
+from src.parsers.valorant.match_parser import MatchParser, Opener, open_binary
+from src.parsers.valorant.parse_cache import ParseCache
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+DEFAULT_MAX_TASKS_PER_CHILD = 32
+
+# How often `parse_many` checks for new input while it waits on parses in flight.
+_INPUT_POLL_SECONDS = 0.05
+_END_OF_INPUT = object()
+
+_worker_parsers: Dict[Tuple[Optional[str], bool], MatchParser] = {}
+
+
+@dataclass
+class ParseOutcome:
+    """Result of parsing one artifact: either `parsed` or `error` is set."""
+
+    index: int
+    path: str
+    parsed: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+    peak_rss_mb: float = 0.0
+    # Served from the parse cache without going through a worker.
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def limit_worker_memory(memory_limit_mb: Optional[int]) -> None:
+    """
+    Process-pool initializer capping the worker's address space, so a runaway parse fails
+    with MemoryError in that worker instead of pushing the whole machine into swap.
+    """
+    if memory_limit_mb is None or resource is None:
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    # ru_maxrss is reported in kilobytes on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def parse_file(
+    path: str,
+    columnar: bool = False,
+    opener: Opener = open_binary,
+    cache_dir: Optional[str] = None,
+    streaming: bool = True,
+) -> Tuple[Dict[str, Any], float, float]:
+    """Parses one telemetry file; returns (parsed match, seconds spent, worker peak RSS)."""
+    parser = _worker_parsers.get((cache_dir, streaming))
+    if parser is None:
+        cache = ParseCache(cache_dir) if cache_dir else None
+        parser = MatchParser(cache=cache, streaming=streaming)
+        _worker_parsers[(cache_dir, streaming)] = parser
+    started = time.perf_counter()
+    parsed = parser.parse_file(path, opener=opener, with_batches=columnar)
+    return parsed, time.perf_counter() - started, _peak_rss_mb()
+
+
+def parse_many(
+    paths: Iterable[PathLike],
+    max_workers: Optional[int] = None,
+    ordered: bool = True,
+    columnar: bool = False,
+    opener: Opener = open_binary,
+    cache_dir: Optional[str] = None,
+    streaming: bool = True,
+    memory_limit_mb: Optional[int] = None,
+    max_tasks_per_child: Optional[int] = DEFAULT_MAX_TASKS_PER_CHILD,
+) -> Generator[ParseOutcome, None, None]:
+    """
+    Parses many telemetry artifacts across a process pool.
+
+    Outcomes are yielded in input order when `ordered` is set, otherwise as they complete.
+    A failing artifact yields an outcome with `error` set instead of aborting the batch. If a
+    worker dies outright (e.g. killed by the OOM killer), the artifacts that were in flight
+    are retried one at a time in a fresh single-worker pool so only the culprit is reported
+    as failed, and the rest of the batch continues in a new pool.
+
+    `paths` is consumed lazily, a few artifacts ahead of the workers, so it can be fed by a
+    producer while parsing runs (the ingest pipeline passes its download queue). It is read
+    on a separate thread, so finished parses are yielded while the producer is still busy;
+    closing the generator stops that thread once it has read at most one more item.
+    `cache_dir` points at a `ParseCache`: hits are served in this process without a worker,
+    and workers store what they parse, so unchanged artifacts are not re-parsed.
+    `streaming=False` decodes each file whole with the fast typed decoder instead.
+    `memory_limit_mb` caps each worker's address space; `max_tasks_per_child` recycles
+    workers so memory fragmented by large matches is returned to the OS.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    window = max_workers * 2
+    # Read by a feeder thread, so a slow producer never holds back finished parses.
+    pending: "queue.Queue[Any]" = queue.Queue(maxsize=window)
+    feed_error: List[BaseException] = []
+    stop = threading.Event()
+
+    def offer(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                pending.put(item, timeout=_INPUT_POLL_SECONDS)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def feed() -> None:
+        try:
+            for item in enumerate(os.fspath(path) for path in paths):
+                if not offer(item):
+                    return
+        except BaseException as exc:
+            feed_error.append(exc)
+        offer(_END_OF_INPUT)
+
+    # Hits are read here: pickling a worker's memory-mapped batches back would copy them.
+    cache_parser = MatchParser(ParseCache(cache_dir), streaming=streaming) if cache_dir else None
+    feeder = threading.Thread(target=feed, name="parse-many-feed", daemon=True)
+    feeder.start()
+    exhausted = False
+    done: Dict[int, ParseOutcome] = {}
+    next_to_yield = 0
+
+    def flush() -> Iterator[ParseOutcome]:
+        nonlocal next_to_yield
+        while next_to_yield in done:
+            yield done.pop(next_to_yield)
+            next_to_yield += 1
+
+    def record(outcome: ParseOutcome) -> Iterator[ParseOutcome]:
+        if ordered:
+            done[outcome.index] = outcome
+            yield from flush()
+        else:
+            yield outcome
+
+    try:
+        while not exhausted:
+            suspects: List[Tuple[int, str]] = []
+            with _make_pool(max_workers, memory_limit_mb, max_tasks_per_child) as pool:
+                in_flight: Dict[Future, Tuple[int, str]] = {}
+                while True:
+                    while not exhausted and len(in_flight) < window and not suspects:
+                        try:
+                            # Only block for input when there is nothing to collect meanwhile.
+                            item = pending.get(block=not in_flight)
+                        except queue.Empty:
+                            break
+                        if item is _END_OF_INPUT:
+                            exhausted = True
+                            if feed_error:
+                                raise feed_error[0]
+                            break
+                        hit = _cached(cache_parser, item[0], item[1], columnar)
+                        if hit is not None:
+                            yield from record(hit)
+                            continue
+                        try:
+                            future = pool.submit(
+                                parse_file, item[1], columnar, opener, cache_dir, streaming
+                            )
+                        except BrokenProcessPool:
+                            suspects.append(item)
+                            break
+                        in_flight[future] = item
+                    if not in_flight:
+                        break
+                    # With room for more work, look for new input again now and then.
+                    idle = not (exhausted or suspects or len(in_flight) >= window)
+                    finished, _ = wait(
+                        in_flight,
+                        timeout=_INPUT_POLL_SECONDS if idle else None,
+                        return_when=FIRST_COMPLETED,
+                    )
+                    for future in finished:
+                        index, path = in_flight.pop(future)
+                        outcome = _outcome(index, path, future)
+                        if outcome is None:
+                            suspects.append((index, path))
+                        else:
+                            yield from record(outcome)
+            for index, path in sorted(suspects):
+                yield from record(
+                    _isolated(index, path, columnar, opener, cache_dir, streaming, memory_limit_mb)
+                )
+    finally:
+        # Hands `paths` back to the caller; the feeder reads at most one more item from it.
+        stop.set()
+        feeder.join()
+
+
+def _cached(
+    parser: Optional[MatchParser], index: int, path: str, columnar: bool
+) -> Optional[ParseOutcome]:
+    if parser is None:
+        return None
+    started = time.perf_counter()
+    try:
+        parsed = parser.cached(path, with_batches=columnar)
+    except Exception:
+        # Unreadable here means unreadable in a worker too; let it report the error.
+        return None
+    if parsed is None:
+        return None
+    return ParseOutcome(
+        index, path, parsed=parsed, seconds=time.perf_counter() - started, cached=True
+    )
+
+
+def _make_pool(
+    max_workers: int, memory_limit_mb: Optional[int], max_tasks_per_child: Optional[int]
+) -> ProcessPoolExecutor:
+    # Recycling workers needs a start method other than fork.
+    context = multiprocessing.get_context("spawn" if max_tasks_per_child else None)
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=context,
+        initializer=limit_worker_memory,
+        initargs=(memory_limit_mb,),
+        max_tasks_per_child=max_tasks_per_child,
+    )
+
+
+def _outcome(index: int, path: str, future: Future) -> Optional[ParseOutcome]:
+    """Turns a finished future into an outcome; None means its worker process died."""
+    try:
+        parsed, seconds, peak_rss_mb = future.result()
+    except BrokenProcessPool:
+        return None
+    except Exception as exc:
+        return ParseOutcome(index, path, error=f"{type(exc).__name__}: {exc}")
+    return ParseOutcome(index, path, parsed=parsed, seconds=seconds, peak_rss_mb=peak_rss_mb)
+
+
+def _isolated(
+    index: int,
+    path: str,
+    columnar: bool,
+    opener: Opener,
+    cache_dir: Optional[str],
+    streaming: bool,
+    memory_limit_mb: Optional[int],
+) -> ParseOutcome:
+    """Re-runs one artifact alone so a worker crash can be pinned on it."""
+    with _make_pool(1, memory_limit_mb, None) as pool:
+        outcome = _outcome(
+            index, path, pool.submit(parse_file, path, columnar, opener, cache_dir, streaming)
+        )
+    if outcome is None:
+        return ParseOutcome(index, path, error="worker process died while parsing")
+    return outcome
@@ -0,0 +1,275 @@
+import io
+import json
+from typing import IO, Any, Dict, Generator, Iterable, Iterator, List, Optional, Tuple, Union, cast
+
+import pyarrow as pa
+
+from src.parsers.valorant.positions_parser import PositionBatchBuilder
+from src.parsers.valorant.utils import RecordBatchBuilder
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+EVENTS_KEY = "events"
+
+_WHITESPACE = " \t\r\n"
+_DELIMITERS = _WHITESPACE + ",]}:"
+_CONTAINER_STARTS = '{["'
+
+
+class TelemetryStream:
+    """
+    Incremental reader for VALORANT telemetry documents.
+
+    Events are decoded one at a time from a small sliding text buffer, so memory use is
+    bounded by the largest single event rather than by the file. Three layouts are accepted:
+
+    - an object whose `events` key holds the event array (other top-level keys such as
+      `matchId` or `players` are collected into `metadata` as they are passed),
+    - a bare array of events,
+    - JSON Lines, one event per line.
+
+    Metadata keys that appear after the event array are only available once `events()` has
+    been exhausted.
+    """
+
+    def __init__(
+        self,
+        source: Union[IO[str], IO[bytes]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        events_key: str = EVENTS_KEY,
+    ) -> None:
+        if isinstance(source, io.TextIOBase):
+            self._fh: IO[str] = source
+        else:
+            self._fh = io.TextIOWrapper(cast(IO[bytes], source), encoding="utf-8")
+        self.chunk_size = chunk_size
+        self.events_key = events_key
+        self.metadata: Dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def events(self) -> Iterator[Dict[str, Any]]:
+        """Yields telemetry events in file order."""
+        first = self._peek()
+        if first == "{":
+            saw_events = yield from self._object_events()
+            # A first object without an event array followed by more values is JSON Lines.
+            if not saw_events and self._peek():
+                yield dict(self.metadata)
+                self.metadata.clear()
+                yield from self._json_lines()
+        elif first == "[":
+            yield from self._array_values()
+        elif first:
+            yield from self._json_lines()
+
+    def _fill(self) -> bool:
+        """Reads another chunk into the buffer; returns False at end of input."""
+        if self._eof:
+            return False
+        chunk = self._fh.read(self.chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        # Drop what has already been consumed so the buffer doesn't grow with the file.
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Skips whitespace and returns the next character without consuming it."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Malformed telemetry: expected {char!r}, found {found!r}")
+        self._pos += 1
+
+    def _decode(self) -> Any:
+        """Decodes the next complete JSON value, reading more input as needed."""
+        if self._peek() not in _CONTAINER_STARTS:
+            # A bare number or literal has no closing character, so make sure the buffer holds
+            # the delimiter after it; otherwise "1.5e3" split as "1.5e" would decode as 1.5.
+            while not self._has_delimiter() and self._fill():
+                pass
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            self._pos = end
+            return value
+
+    def _has_delimiter(self) -> bool:
+        return any(c in _DELIMITERS for c in self._buf[self._pos :])
+
+    def _array_values(self) -> Iterator[Dict[str, Any]]:
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._decode()
+            separator = self._peek()
+            self._pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Malformed telemetry: unexpected {separator!r} in events")
+
+    def _object_events(self) -> Generator[Dict[str, Any], None, bool]:
+        """Streams the event array of a top-level object; returns whether one was found."""
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return False
+        saw_events = False
+        while True:
+            key = self._decode()
+            self._expect(":")
+            if key == self.events_key and self._peek() == "[":
+                saw_events = True
+                yield from self._array_values()
+            else:
+                self.metadata[key] = self._decode()
+            separator = self._peek()
+            self._pos += 1
+            if separator == "}":
+                return saw_events
+            if separator != ",":
+                raise ValueError(f"Malformed telemetry: unexpected {separator!r} in document")
+
+    def _json_lines(self) -> Iterator[Dict[str, Any]]:
+        while self._peek():
+            yield self._decode()
+
+
+def stream_events(
+    source: Union[IO[str], IO[bytes]], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """Yields the events of a telemetry file without loading the whole document."""
+    yield from TelemetryStream(source, chunk_size=chunk_size).events()
+
+
+def iter_rounds(
+    events: Iterable[Dict[str, Any]],
+) -> Iterator[Tuple[Optional[int], List[Dict[str, Any]]]]:
+    """Groups consecutive events by round number, holding one round in memory at a time."""
+    current: Optional[int] = None
+    batch: List[Dict[str, Any]] = []
+    for event in events:
+        round_number = event.get("round")
+        if batch and round_number != current:
+            yield current, batch
+            batch = []
+        current = round_number
+        batch.append(event)
+    if batch:
+        yield current, batch
+
+
+EVENT_COLUMNS: Dict[str, List[Tuple[str, str]]] = {
+    "kills": [
+        ("match_id", "category"),
+        ("round_number", "int16"),
+        ("tick", "int32"),
+        ("killer_id", "category"),
+        ("victim_id", "category"),
+        ("weapon", "category"),
+        ("headshot", "bool"),
+        ("assists", "int16"),
+    ],
+    "damage": [
+        ("match_id", "category"),
+        ("round_number", "int16"),
+        ("tick", "int32"),
+        ("attacker_id", "category"),
+        ("victim_id", "category"),
+        ("weapon", "category"),
+        ("amount", "float32"),
+    ],
+    "plants": [
+        ("match_id", "category"),
+        ("round_number", "int16"),
+        ("tick", "int32"),
+        ("player_id", "category"),
+        ("site", "category"),
+    ],
+    "defuses": [
+        ("match_id", "category"),
+        ("round_number", "int16"),
+        ("tick", "int32"),
+        ("player_id", "category"),
+        ("site", "category"),
+    ],
+    "ability_casts": [
+        ("match_id", "category"),
+        ("round_number", "int16"),
+        ("tick", "int32"),
+        ("player_id", "category"),
+        ("ability", "category"),
+    ],
+}
+
+
+class EventBatchBuilder:
+    """
+    Builds typed, dictionary-encoded Arrow batches straight from the event stream, one batch
+    per event kind (see `EVENT_COLUMNS`) plus `positions`, without materialising row dicts.
+    """
+
+    def __init__(self, match_id: Optional[str]) -> None:
+        self.match_id = match_id
+        self._tables = {name: RecordBatchBuilder(cols) for name, cols in EVENT_COLUMNS.items()}
+        self._positions = PositionBatchBuilder(match_id)
+
+    def add(self, event: Dict[str, Any]) -> None:
+        event_type = event.get("type")
+        round_number = event.get("round")
+        tick = event.get("tick")
+        if event_type == "position":
+            self._positions.add(event)
+        elif event_type == "kill":
+            self._tables["kills"].append(
+                self.match_id,
+                round_number,
+                tick,
+                event.get("killerId"),
+                event.get("victimId"),
+                event.get("weapon"),
+                event.get("headshot"),
+                len(event.get("assistantIds") or []),
+            )
+        elif event_type == "damage":
+            self._tables["damage"].append(
+                self.match_id,
+                round_number,
+                tick,
+                event.get("attackerId"),
+                event.get("victimId"),
+                event.get("weapon"),
+                event.get("amount"),
+            )
+        elif event_type in ("plant", "defuse"):
+            self._tables[f"{event_type}s"].append(
+                self.match_id, round_number, tick, event.get("playerId"), event.get("site")
+            )
+        elif event_type == "ability_cast":
+            self._tables["ability_casts"].append(
+                self.match_id, round_number, tick, event.get("playerId"), event.get("ability")
+            )
+
+    def finish(self) -> Dict[str, pa.RecordBatch]:
+        batches = {name: builder.finish() for name, builder in self._tables.items()}
+        batches["positions"] = self._positions.finish()
+        return batches
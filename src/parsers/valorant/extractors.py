@@ -0,0 +1,188 @@
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple, Type
+
+from src.parsers.valorant.events_parser import EventBatchBuilder
+
+# Extractors that `MatchParser` runs unless told otherwise.
+DEFAULT_EXTRACTORS = ("rounds", "players")
+
+EXTRACTORS: Dict[str, Type["EventExtractor"]] = {}
+
+# Events whose round numbers make up the rounds a match counts towards ADR.
+ADR_ROUND_EVENTS = ("kill", "damage")
+
+
+def average_damage_per_round(damage: float, rounds_played: int) -> float:
+    """
+    ADR, as `PlayersExtractor` and `src.features.player.kda.player_kda` both report it:
+    damage over the rounds of the matches the player appeared in, where a match's rounds are
+    the distinct round numbers of its `ADR_ROUND_EVENTS`.
+    """
+    return damage / max(rounds_played, 1)
+
+
+def register_extractor(cls: Type["EventExtractor"]) -> Type["EventExtractor"]:
+    """Class decorator making an extractor available to `MatchParser` under `cls.name`."""
+    if not cls.name:
+        raise ValueError(f"{cls.__name__} must define a name")
+    EXTRACTORS[cls.name] = cls
+    return cls
+
+
+class EventExtractor:
+    """
+    Base class for single-pass telemetry extractors.
+
+    Subclasses list the event types they handle in `event_types` (empty means every event)
+    and are driven by an `EventDispatcher`: `start` once the top-level metadata seen so far is
+    known, `on_event` for each matching event, then `finish`, whose return value is stored in
+    the parse result under `name`.
+    """
+
+    name: str = ""
+    event_types: Tuple[str, ...] = ()
+
+    def start(self, metadata: Dict[str, Any]) -> None:
+        pass
+
+    def on_event(self, event: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def finish(self, metadata: Dict[str, Any]) -> Any:
+        raise NotImplementedError
+
+
+class EventDispatcher:
+    """Routes each event only to the extractors registered for its type."""
+
+    def __init__(self, extractors: Iterable[EventExtractor]) -> None:
+        self.extractors = list(extractors)
+        self._wildcard: List[Callable[[Dict[str, Any]], None]] = []
+        self._handlers: Dict[str, List[Callable[[Dict[str, Any]], None]]] = {}
+        for extractor in self.extractors:
+            if not extractor.event_types:
+                self._wildcard.append(extractor.on_event)
+            for event_type in extractor.event_types:
+                self._handlers.setdefault(event_type, []).append(extractor.on_event)
+        self._started = False
+
+    def dispatch(self, event: Dict[str, Any], metadata: Dict[str, Any]) -> None:
+        if not self._started:
+            self.start(metadata)
+        for handler in self._handlers.get(event.get("type") or "", ()):
+            handler(event)
+        for handler in self._wildcard:
+            handler(event)
+
+    def start(self, metadata: Dict[str, Any]) -> None:
+        self._started = True
+        for extractor in self.extractors:
+            extractor.start(metadata)
+
+    def finish(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        if not self._started:
+            self.start(metadata)
+        return {extractor.name: extractor.finish(metadata) for extractor in self.extractors}
+
+
+def build_extractors(names: Sequence[str]) -> List[EventExtractor]:
+    """Instantiates registered extractors by name."""
+    unknown = [name for name in names if name not in EXTRACTORS]
+    if unknown:
+        raise ValueError(f"Unknown extractors: {', '.join(unknown)}")
+    return [EXTRACTORS[name]() for name in names]
+
+
+@register_extractor
+class RoundsExtractor(EventExtractor):
+    """One summary row per `round_end` event."""
+
+    name = "rounds"
+    event_types = ("round_end",)
+
+    def __init__(self) -> None:
+        self._rounds: List[Dict[str, Any]] = []
+
+    def on_event(self, event: Dict[str, Any]) -> None:
+        self._rounds.append(
+            {
+                "round_number": event.get("round"),
+                "winning_side": event.get("winningSide"),
+                "winning_team_id": event.get("winningTeamId"),
+                "win_type": event.get("winType"),
+                "team_a_econ": event.get("teamAEcon"),
+                "team_b_econ": event.get("teamBEcon"),
+            }
+        )
+
+    def finish(self, metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return self._rounds
+
+
+@register_extractor
+class PlayersExtractor(EventExtractor):
+    """Kills, deaths, assists and average damage per round for every player."""
+
+    name = "players"
+    event_types = ADR_ROUND_EVENTS
+
+    def __init__(self) -> None:
+        self._players: Dict[str, Dict[str, Any]] = {}
+        self._round_numbers: set = set()
+
+    def _player(self, player_id: str) -> Dict[str, Any]:
+        if player_id not in self._players:
+            self._players[player_id] = {"kills": 0, "deaths": 0, "assists": 0, "damage": 0.0}
+        return self._players[player_id]
+
+    def on_event(self, event: Dict[str, Any]) -> None:
+        if event.get("round") is not None:
+            self._round_numbers.add(event["round"])
+        event_type = event.get("type")
+        if event_type == "kill":
+            if event.get("killerId"):
+                self._player(event["killerId"])["kills"] += 1
+            if event.get("victimId"):
+                self._player(event["victimId"])["deaths"] += 1
+            for assistant in event.get("assistantIds") or []:
+                self._player(assistant)["assists"] += 1
+        elif event_type == "damage" and event.get("attackerId"):
+            self._player(event["attackerId"])["damage"] += event.get("amount") or 0
+
+    def finish(self, metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+        # The roster gives players without any events a stat line too.
+        roster = {p["id"]: p for p in metadata.get("players") or [] if p.get("id")}
+        for player_id in roster:
+            self._player(player_id)
+        rounds_played = len(self._round_numbers)
+        return [
+            {
+                "player_id": player_id,
+                "team_id": roster.get(player_id, {}).get("teamId"),
+                "agent": roster.get(player_id, {}).get("agent"),
+                "kills": stats["kills"],
+                "deaths": stats["deaths"],
+                "assists": stats["assists"],
+                "adr": average_damage_per_round(stats["damage"], rounds_played),
+            }
+            for player_id, stats in self._players.items()
+        ]
+
+
+@register_extractor
+class BatchesExtractor(EventExtractor):
+    """Columnar Arrow batches of every event kind; see `EventBatchBuilder`."""
+
+    name = "batches"
+    event_types = ("kill", "damage", "plant", "defuse", "ability_cast", "position")
+
+    def __init__(self) -> None:
+        self._builder = EventBatchBuilder(None)
+
+    def start(self, metadata: Dict[str, Any]) -> None:
+        self._builder = EventBatchBuilder(metadata.get("matchId"))
+
+    def on_event(self, event: Dict[str, Any]) -> None:
+        self._builder.add(event)
+
+    def finish(self, metadata: Dict[str, Any]) -> Any:
+        return self._builder.finish()
@@ -1,33 +1,164 @@
-from typing import Any, Dict, List
+import os
+from typing import IO, Any, Callable, Dict, Iterable, Optional, Sequence, Union
+
+from src.parsers.valorant.events_parser import DEFAULT_CHUNK_SIZE, TelemetryStream
+from src.parsers.valorant.extractors import DEFAULT_EXTRACTORS, EventDispatcher, build_extractors
+from src.parsers.valorant.match_view import DEFAULT_ROUND_CACHE_SIZE, MatchView
+from src.parsers.valorant.parse_cache import ParseCache, content_hash
+from src.parsers.valorant.utils import decode_telemetry, telemetry_metadata
+
+Opener = Callable[[str], IO[bytes]]
+
+
+def open_binary(path: str) -> IO[bytes]:
+    return open(path, "rb")
 
 
 class MatchParser:
-    """Parses VALORANT telemetry data from GRID artifacts."""
+    """
+    Parses VALORANT telemetry data from GRID artifacts.
+
+    Parsing is a single pass over the events: each one is dispatched to the registered
+    extractors (see `src.parsers.valorant.extractors`) that declared interest in its type, and
+    each extractor's result lands in the parsed match under its name.
+    """
+
+    # Bump whenever the parsed output changes, so results cached by older code are ignored.
+    VERSION = 5
+
+    def __init__(
+        self,
+        cache: Optional[ParseCache] = None,
+        extractors: Sequence[str] = DEFAULT_EXTRACTORS,
+        streaming: bool = True,
+    ):
+        self.cache = cache
+        self.extractors = tuple(extractors)
+        # Files are streamed (bounded memory) by default; otherwise they are read whole and
+        # decoded with the fast typed decoder, trading memory for decode speed.
+        self.streaming = streaming
+        build_extractors(self.extractors)  # fail fast on unknown names
 
-    def __init__(self):
-        pass
+    def parse_file(
+        self,
+        path: Union[str, os.PathLike],
+        opener: Opener = open_binary,
+        with_batches: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Parses a telemetry file, consulting the parse cache first when one is configured.
+        Cache hits return event batches memory-mapped from disk; misses are parsed and
+        stored under the artifact's content hash and the current `VERSION`.
+        """
+        path = os.fspath(path)
+        if self.cache is None:
+            return self._parse_path(path, opener, with_batches)
+
+        sha256 = content_hash(path)
+        variant = self._cache_variant()
+        cached = self.cache.get(sha256, self.VERSION, batches=with_batches, variant=variant)
+        if cached is not None:
+            return cached
+        parsed = self._parse_path(path, opener, with_batches=True)
+        self.cache.put(sha256, self.VERSION, parsed, variant=variant)
+        if not with_batches:
+            del parsed["batches"]
+        return parsed
+
+    def cached(
+        self, path: Union[str, os.PathLike], with_batches: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """The parse cache's result for a telemetry file, or None on a miss or without a cache."""
+        if self.cache is None:
+            return None
+        return self.cache.get(
+            content_hash(path), self.VERSION, batches=with_batches, variant=self._cache_variant()
+        )
 
     def parse_match_telemetry(self, telemetry: Dict[str, Any]) -> Dict[str, Any]:
         """
         Parses raw telemetry JSON into structured match data.
         This is a high-level parser that identifies key events.
         """
-        # In a real implementation, this would iterate through frames/events
-        # and extract kills, plants, defuses, eco states, etc.
+        return self._run(telemetry.get("events") or [], telemetry, with_batches=False)
 
-        # Example structure of what we'd extract:
-        match_summary = {
-            "match_id": telemetry.get("matchId"),
-            "map_name": telemetry.get("mapName"),
-            "rounds": self._extract_rounds(telemetry),
-            "players": self._extract_players(telemetry),
-        }
-        return match_summary
+    def parse_match_stream(
+        self, source: Union[IO[str], IO[bytes]], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Parses a telemetry file event by event, producing the same structure as
+        `parse_match_telemetry` without holding the decoded document in memory.
+        """
+        return self._parse_stream(source, chunk_size, with_batches=False)
 
-    def _extract_rounds(self, telemetry: Dict[str, Any]) -> List[Dict[str, Any]]:
-        # Placeholder for round extraction logic
-        return []
+    def parse_match_batches(
+        self, source: Union[IO[str], IO[bytes]], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Like `parse_match_stream`, but also returns the match's events as columnar Arrow
+        batches under `batches` (kills, damage, plants, defuses, ability_casts, positions),
+        ready to be scanned by DuckDB or wrapped by Polars without conversion.
+        """
+        return self._parse_stream(source, chunk_size, with_batches=True)
+
+    def parse_match_bytes(self, data: bytes, with_batches: bool = False) -> Dict[str, Any]:
+        """
+        Parses a whole telemetry document held in memory, decoding it into typed event
+        structs with the fastest available backend (see `utils.DECODER_BACKEND`).
+        """
+        telemetry = decode_telemetry(data)
+        return self._run(telemetry.events, telemetry_metadata(telemetry), with_batches)
+
+    def open_match(
+        self,
+        path: Union[str, os.PathLike],
+        opener: Opener = open_binary,
+        cache_size: int = DEFAULT_ROUND_CACHE_SIZE,
+    ) -> MatchView:
+        """
+        Returns a lazy `MatchView` over a telemetry file: rounds are indexed on first access
+        and each round's events are decoded only when that round is requested.
+        """
+        with opener(os.fspath(path)) as fh:
+            return MatchView(fh.read(), self, cache_size)
+
+    def view_match_bytes(
+        self, data: bytes, cache_size: int = DEFAULT_ROUND_CACHE_SIZE
+    ) -> MatchView:
+        """Like `open_match`, for a telemetry document already held in memory."""
+        return MatchView(data, self, cache_size)
+
+    def _parse_path(self, path: str, opener: Opener, with_batches: bool) -> Dict[str, Any]:
+        with opener(path) as fh:
+            if self.streaming:
+                return self._parse_stream(fh, DEFAULT_CHUNK_SIZE, with_batches)
+            return self.parse_match_bytes(fh.read(), with_batches)
+
+    def _parse_stream(
+        self, source: Union[IO[str], IO[bytes]], chunk_size: int, with_batches: bool
+    ) -> Dict[str, Any]:
+        stream = TelemetryStream(source, chunk_size=chunk_size)
+        # The stream fills in `metadata` as it goes; in the usual layout the keys ahead of
+        # the event array are known by the time the first event is dispatched.
+        return self._run(stream.events(), stream.metadata, with_batches)
+
+    def _run(
+        self, events: Iterable[Any], metadata: Dict[str, Any], with_batches: bool
+    ) -> Dict[str, Any]:
+        names = self.extractors
+        if with_batches and "batches" not in names:
+            names += ("batches",)
+        dispatcher = EventDispatcher(build_extractors(names))
+        for event in events:
+            dispatcher.dispatch(event, metadata)
+        return {
+            "match_id": metadata.get("matchId"),
+            "map_name": metadata.get("mapName"),
+            **dispatcher.finish(metadata),
+        }
 
-    def _extract_players(self, telemetry: Dict[str, Any]) -> List[Dict[str, Any]]:
-        # Placeholder for player extraction logic
-        return []
+    def _cache_variant(self) -> str:
+        """Distinguishes cache entries produced with a non-default extractor set."""
+        if self.extractors == DEFAULT_EXTRACTORS:
+            return ""
+        return "-".join(sorted(self.extractors))
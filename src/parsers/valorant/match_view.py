@@ -0,0 +1,148 @@
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.parsers.valorant.utils import _ATTR_BY_KEY, TelemetryEvent
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - fast decoding is optional
+    msgspec = None  # type: ignore[assignment]
+
+DEFAULT_ROUND_CACHE_SIZE = 4
+
+if msgspec is not None:
+
+    class _Index(msgspec.Struct, rename="camel", gc=False):
+        # Events stay undecoded: each Raw is a view of that event's bytes in the document.
+        match_id: Optional[str] = None
+        map_name: Optional[str] = None
+        teams: List[Dict[str, Any]] = []
+        players: List[Dict[str, Any]] = []
+        events: List[msgspec.Raw] = []
+
+    class _RoundProbe(msgspec.Struct, gc=False):
+        round: Optional[int] = None
+
+    _index_decoder = msgspec.json.Decoder(_Index)
+    _raw_events_decoder = msgspec.json.Decoder(List[msgspec.Raw])
+    _probe_decoder = msgspec.json.Decoder(_RoundProbe)
+    _event_decoder = msgspec.json.Decoder(TelemetryEvent)
+
+
+class MatchView:
+    """
+    Lazy view of one telemetry document.
+
+    The first access scans the document once to read the top-level metadata and record which
+    events belong to which round, without decoding the events themselves (with msgspec each
+    event is kept as a raw byte slice; otherwise as the dict the stdlib decoder produced).
+    A round's events are decoded into `TelemetryEvent`s only when it is requested, and the
+    most recently used rounds are kept in a small LRU cache.
+    """
+
+    def __init__(
+        self, data: bytes, parser: Any = None, cache_size: int = DEFAULT_ROUND_CACHE_SIZE
+    ) -> None:
+        self._data = data
+        self._parser = parser
+        self.cache_size = cache_size
+        self._metadata: Optional[Dict[str, Any]] = None
+        self._items: List[Any] = []
+        self._spans: Dict[Optional[int], List[Tuple[int, int]]] = {}
+        self._rounds: "OrderedDict[Optional[int], List[TelemetryEvent]]" = OrderedDict()
+        self.decoded_rounds = 0
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Top-level document fields (matchId, mapName, teams, players)."""
+        self._ensure_index()
+        assert self._metadata is not None
+        return self._metadata
+
+    @property
+    def match_id(self) -> Optional[str]:
+        return self.metadata.get("matchId")
+
+    @property
+    def map_name(self) -> Optional[str]:
+        return self.metadata.get("mapName")
+
+    @property
+    def round_numbers(self) -> List[int]:
+        """Rounds present in the telemetry, in order of first appearance."""
+        self._ensure_index()
+        return [number for number in self._spans if number is not None]
+
+    def __len__(self) -> int:
+        return len(self.round_numbers)
+
+    def round(self, number: Optional[int]) -> List[TelemetryEvent]:
+        """Decoded events of one round (None selects events without a round number)."""
+        self._ensure_index()
+        if number in self._rounds:
+            self._rounds.move_to_end(number)
+            return self._rounds[number]
+        if number not in self._spans:
+            raise KeyError(f"No round {number} in match {self.match_id}")
+        events = [
+            self._decode(item)
+            for start, stop in self._spans[number]
+            for item in self._items[start:stop]
+        ]
+        self.decoded_rounds += 1
+        self._rounds[number] = events
+        while len(self._rounds) > self.cache_size:
+            self._rounds.popitem(last=False)
+        return events
+
+    def events(self) -> Iterator[TelemetryEvent]:
+        """Every event in document order, decoded one at a time and not cached."""
+        self._ensure_index()
+        for item in self._items:
+            yield self._decode(item)
+
+    def summary(self) -> Dict[str, Any]:
+        """The full parse (as `MatchParser.parse_match_telemetry` returns it)."""
+        if self._parser is None:
+            raise ValueError("MatchView was created without a parser")
+        summary: Dict[str, Any] = self._parser._run(
+            self.events(), self.metadata, with_batches=False
+        )
+        return summary
+
+    def _ensure_index(self) -> None:
+        if self._metadata is not None:
+            return
+        if msgspec is not None:
+            if self._data.lstrip()[:1] == b"[":
+                index = _Index(events=_raw_events_decoder.decode(self._data))
+            else:
+                index = _index_decoder.decode(self._data)
+            self._items = index.events
+            rounds = [_probe_decoder.decode(raw).round for raw in self._items]
+            self._metadata = {
+                "matchId": index.match_id,
+                "mapName": index.map_name,
+                "teams": index.teams,
+                "players": index.players,
+            }
+        else:
+            document = json.loads(self._data)
+            if isinstance(document, list):
+                document = {"events": document}
+            self._items = document.pop("events", None) or []
+            rounds = [item.get("round") for item in self._items]
+            self._metadata = document
+        # Consecutive events of the same round form one span; a round may have several.
+        start = 0
+        for i in range(1, len(rounds) + 1):
+            if i == len(rounds) or rounds[i] != rounds[start]:
+                self._spans.setdefault(rounds[start], []).append((start, i))
+                start = i
+
+    @staticmethod
+    def _decode(item: Any) -> TelemetryEvent:
+        if msgspec is not None:
+            return _event_decoder.decode(item)
+        return TelemetryEvent(**{_ATTR_BY_KEY[k]: v for k, v in item.items() if k in _ATTR_BY_KEY})
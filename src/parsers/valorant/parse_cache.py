@@ -0,0 +1,113 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import pyarrow as pa
+
+DEFAULT_PARSE_CACHE_DIR = "data/cache/parsed"
+
+_SUMMARY_FILE = "summary.json"
+_BATCH_SUFFIX = ".arrow"
+_SHA256 = re.compile(r"^[0-9a-f]{64}$")
+_HASH_CHUNK = 1024 * 1024
+
+
+def content_hash(path: Union[str, os.PathLike]) -> str:
+    """
+    Returns the sha256 of an artifact. Blobs from the artifact cache are already named by the
+    hash of their (uncompressed) content, so for those the name is used instead of re-reading.
+    """
+    path = Path(path)
+    name = path.name.split(".", 1)[0]
+    if _SHA256.match(name):
+        return name
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """
+    On-disk cache of parser output keyed by artifact content hash and parser version.
+
+    Each entry is a directory `<sha[:2]>/<sha>/v<version>[-<variant>]/` holding the
+    round/player summary as JSON and every event batch as an uncompressed Arrow IPC file. Hits
+    are read through a memory map, so loading a cached match maps its columns instead of
+    copying them, and come back as `pa.RecordBatch`es just like a fresh parse. Entries
+    written by another parser version are simply never looked up; `prune` deletes them.
+    The variant distinguishes parsers run with different extractors.
+    """
+
+    def __init__(self, root: Union[str, os.PathLike] = DEFAULT_PARSE_CACHE_DIR) -> None:
+        self.root = Path(root)
+        self.tmp_dir = self.root / "tmp"
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+
+    def entry_dir(self, sha256: str, version: int, variant: str = "") -> Path:
+        name = f"v{version}-{variant}" if variant else f"v{version}"
+        return self.root / sha256[:2] / sha256 / name
+
+    def get(
+        self, sha256: str, version: int, batches: bool = True, variant: str = ""
+    ) -> Optional[Dict[str, Any]]:
+        """Returns the cached parse of an artifact, or None on a miss."""
+        entry = self.entry_dir(sha256, version, variant)
+        try:
+            parsed: Dict[str, Any] = json.loads((entry / _SUMMARY_FILE).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        if batches:
+            parsed["batches"] = {
+                path.name[: -len(_BATCH_SUFFIX)]: _read_mapped(path)
+                for path in sorted(entry.glob(f"*{_BATCH_SUFFIX}"))
+            }
+        return parsed
+
+    def put(self, sha256: str, version: int, parsed: Dict[str, Any], variant: str = "") -> None:
+        """Stores a parse result; concurrent writers of the same entry are harmless."""
+        entry = self.entry_dir(sha256, version, variant)
+        if entry.exists():
+            return
+        staging = Path(tempfile.mkdtemp(dir=self.tmp_dir))
+        try:
+            summary = {key: value for key, value in parsed.items() if key != "batches"}
+            (staging / _SUMMARY_FILE).write_text(json.dumps(summary), encoding="utf-8")
+            for name, batch in (parsed.get("batches") or {}).items():
+                with pa.OSFile(str(staging / f"{name}{_BATCH_SUFFIX}"), "wb") as sink:
+                    with pa.ipc.new_file(sink, batch.schema) as writer:
+                        writer.write(batch)
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.rename(staging, entry)
+            except OSError:
+                if not entry.exists():
+                    raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def prune(self, version: int) -> List[Path]:
+        """Deletes entries written by any parser version other than `version`."""
+        removed = []
+        for entry in self.root.glob("??/*/v*"):
+            if entry.name.split("-", 1)[0] != f"v{version}":
+                shutil.rmtree(entry, ignore_errors=True)
+                removed.append(entry)
+        return removed
+
+
+def _read_mapped(path: Path) -> pa.RecordBatch:
+    with pa.memory_map(str(path), "r") as source:
+        # Buffers reference the mapping, which stays alive as long as the batch does.
+        reader = pa.ipc.open_file(source)
+        if reader.num_record_batches == 1:
+            return reader.get_batch(0)
+        # Hits must look like a fresh parse, which always yields one batch per table.
+        batches = reader.read_all().combine_chunks().to_batches()
+        return batches[0] if batches else pa.RecordBatch.from_pylist([], schema=reader.schema)
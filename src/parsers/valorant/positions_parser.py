@@ -0,0 +1,191 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+import pyarrow as pa
+
+from src.parsers.valorant.utils import RecordBatchBuilder
+
+POSITION_COLUMNS = [
+    ("match_id", "category"),
+    ("round_number", "int16"),
+    ("tick", "int32"),
+    ("player_id", "category"),
+    ("x", "float32"),
+    ("y", "float32"),
+    ("z", "float32"),
+]
+
+
+class PositionBatchBuilder:
+    """Collects `position` events into a columnar Arrow batch."""
+
+    def __init__(self, match_id: Optional[str]) -> None:
+        self.match_id = match_id
+        self._batch = RecordBatchBuilder(POSITION_COLUMNS)
+
+    def __len__(self) -> int:
+        return len(self._batch)
+
+    def add(self, event: Dict[str, Any]) -> None:
+        self._batch.append(
+            self.match_id,
+            event.get("round"),
+            event.get("tick"),
+            event.get("playerId"),
+            event.get("x"),
+            event.get("y"),
+            event.get("z"),
+        )
+
+    def finish(self) -> pa.RecordBatch:
+        return self._batch.finish()
+
+
+TrajectoryKey = Tuple[int, str]
+
+_TRAJECTORY_ARRAYS = (("ticks", np.int32), ("x", np.float32), ("y", np.float32), ("z", np.float32))
+_INDEX_FILE = "index.json"
+
+
+class Trajectory:
+    """
+    One player's path through one round, as contiguous int32 ticks and float32 x/y/z arrays.
+    The arrays may be views into a memory-mapped `TrajectoryStore`.
+    """
+
+    def __init__(
+        self, ticks: np.ndarray, x: np.ndarray, y: np.ndarray, z: Optional[np.ndarray] = None
+    ) -> None:
+        self.ticks = np.asarray(ticks, dtype=np.int32)
+        self.x = np.asarray(x, dtype=np.float32)
+        self.y = np.asarray(y, dtype=np.float32)
+        self.z = np.zeros_like(self.x) if z is None else np.asarray(z, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.ticks)
+
+    def points(self) -> np.ndarray:
+        """(n, 3) array of x, y, z."""
+        return np.column_stack((self.x, self.y, self.z))
+
+    def take(self, indices: np.ndarray) -> "Trajectory":
+        return Trajectory(self.ticks[indices], self.x[indices], self.y[indices], self.z[indices])
+
+    def simplify(self, tolerance: float) -> "Trajectory":
+        """
+        Drops samples within `tolerance` map units of the line through their neighbours
+        (Douglas-Peucker), keeping the endpoints and every real change of direction.
+        """
+        if len(self) < 3 or tolerance <= 0:
+            return self
+        return self.take(np.flatnonzero(_douglas_peucker(self.points(), tolerance)))
+
+    def resample(self, interval: int) -> "Trajectory":
+        """Linearly interpolates the path onto ticks spaced `interval` apart."""
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if len(self) == 0:
+            return self
+        ticks = np.arange(self.ticks[0], self.ticks[-1] + 1, interval, dtype=np.int32)
+        return Trajectory(
+            ticks,
+            np.interp(ticks, self.ticks, self.x),
+            np.interp(ticks, self.ticks, self.y),
+            np.interp(ticks, self.ticks, self.z),
+        )
+
+
+def _douglas_peucker(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """Returns a mask of the points kept by Douglas-Peucker simplification."""
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        segment = points[end] - points[start]
+        offsets = points[start + 1 : end] - points[start]
+        length = np.linalg.norm(segment)
+        if length == 0:
+            distances = np.linalg.norm(offsets, axis=1)
+        else:
+            distances = np.linalg.norm(np.cross(offsets, segment), axis=1) / length
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            split = start + 1 + farthest
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    return keep
+
+
+def trajectories_from_batch(batch: pa.RecordBatch) -> Dict[TrajectoryKey, Trajectory]:
+    """Splits a positions batch into per-(round, player) trajectories ordered by tick."""
+    if batch.num_rows == 0:
+        return {}
+    players = batch.column("player_id")
+    if pa.types.is_dictionary(players.type):
+        names = players.dictionary.to_pylist()
+        codes = players.indices.to_numpy(zero_copy_only=False)
+    else:
+        names, codes = np.unique(players.to_numpy(zero_copy_only=False), return_inverse=True)
+        names = list(names)
+    rounds = batch.column("round_number").to_numpy(zero_copy_only=False)
+    ticks = batch.column("tick").to_numpy(zero_copy_only=False)
+    order = np.lexsort((ticks, codes, rounds))
+    columns = {name: batch.column(name).to_numpy(zero_copy_only=False)[order] for name in "xyz"}
+    rounds, codes, ticks = rounds[order], codes[order], ticks[order]
+
+    boundaries = np.flatnonzero((np.diff(rounds) != 0) | (np.diff(codes) != 0)) + 1
+    starts = np.concatenate(([0], boundaries))
+    stops = np.concatenate((boundaries, [len(order)]))
+    return {
+        (int(rounds[start]), names[codes[start]]): Trajectory(
+            ticks[start:stop],
+            columns["x"][start:stop],
+            columns["y"][start:stop],
+            columns["z"][start:stop],
+        )
+        for start, stop in zip(starts, stops)
+    }
+
+
+class TrajectoryStore:
+    """
+    On-disk trajectories: every path concatenated into one .npy file per array plus a JSON
+    index of (round, player, start, stop). `load` memory-maps the arrays, so opening a
+    match's positions costs almost nothing until samples are actually read.
+    """
+
+    def __init__(self, root: Union[str, os.PathLike]) -> None:
+        self.root = Path(root)
+
+    def save(self, trajectories: Dict[TrajectoryKey, Trajectory]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        index = []
+        offset = 0
+        for (round_number, player_id), trajectory in trajectories.items():
+            index.append([round_number, player_id, offset, offset + len(trajectory)])
+            offset += len(trajectory)
+        for name, dtype in _TRAJECTORY_ARRAYS:
+            parts = [getattr(t, name) for t in trajectories.values()]
+            data = np.concatenate(parts) if parts else np.empty(0)
+            np.save(self.root / f"{name}.npy", data.astype(dtype, copy=False))
+        (self.root / _INDEX_FILE).write_text(json.dumps(index), encoding="utf-8")
+
+    def load(self, mmap: bool = True) -> Dict[TrajectoryKey, Trajectory]:
+        arrays = {
+            name: np.load(self.root / f"{name}.npy", mmap_mode="r" if mmap else None)
+            for name, _ in _TRAJECTORY_ARRAYS
+        }
+        index = json.loads((self.root / _INDEX_FILE).read_text(encoding="utf-8"))
+        return {
+            (round_number, player_id): Trajectory(
+                *(arrays[name][start:stop] for name, _ in _TRAJECTORY_ARRAYS)
+            )
+            for round_number, player_id, start, stop in index
+        }
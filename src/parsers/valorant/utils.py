@@ -0,0 +1,267 @@
+import json
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pyarrow as pa
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - fast decoding is optional
+    msgspec = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fast decoding is optional
+    orjson = None  # type: ignore[assignment]
+
+# (array typecode, numpy dtype, arrow type) for each fixed-width column kind.
+_NUMERIC_KINDS: Dict[str, Tuple[str, str, pa.DataType]] = {
+    "int16": ("h", "int16", pa.int16()),
+    "int32": ("i", "int32", pa.int32()),
+    "float32": ("f", "float32", pa.float32()),
+}
+
+
+class ColumnBuilder:
+    """
+    Append-only typed column.
+
+    Numeric values go straight into a compact `array.array` (no per-value Python objects are
+    retained) and are handed to Arrow without copying. `category` columns are dictionary
+    encoded as they are filled: each distinct string is stored once and rows hold int32 codes.
+    """
+
+    def __init__(self, kind: str) -> None:
+        if kind not in _NUMERIC_KINDS and kind not in ("bool", "category"):
+            raise ValueError(f"Unknown column kind: {kind}")
+        self.kind = kind
+        typecode = "b" if kind == "bool" else "i" if kind == "category" else None
+        self._values = array(typecode or _NUMERIC_KINDS[kind][0])
+        self._valid = bytearray()
+        self._null_count = 0
+        self._codes: Dict[Any, int] = {}
+        self._dictionary: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def append(self, value: Any) -> None:
+        if value is None:
+            self._values.append(0)
+            self._valid.append(0)
+            self._null_count += 1
+            return
+        if self.kind == "category":
+            code = self._codes.get(value)
+            if code is None:
+                code = self._codes[value] = len(self._dictionary)
+                self._dictionary.append(value)
+            value = code
+        self._values.append(value)
+        self._valid.append(1)
+
+    def _mask(self) -> Optional[np.ndarray]:
+        if not self._null_count:
+            return None
+        mask: np.ndarray = np.frombuffer(self._valid, dtype=np.uint8) == 0
+        return mask
+
+    def finish(self) -> pa.Array:
+        mask = self._mask()
+        if self.kind == "category":
+            codes = pa.array(np.frombuffer(self._values, dtype=np.int32), mask=mask)
+            return pa.DictionaryArray.from_arrays(codes, pa.array(self._dictionary, pa.string()))
+        if self.kind == "bool":
+            return pa.array(np.frombuffer(self._values, dtype=np.int8) != 0, mask=mask)
+        _, dtype, arrow_type = _NUMERIC_KINDS[self.kind]
+        return pa.array(np.frombuffer(self._values, dtype=dtype), type=arrow_type, mask=mask)
+
+
+def arrow_type(kind: str) -> pa.DataType:
+    """Arrow type produced by a `ColumnBuilder` of the given kind."""
+    if kind == "category":
+        return pa.dictionary(pa.int32(), pa.string())
+    if kind == "bool":
+        return pa.bool_()
+    return _NUMERIC_KINDS[kind][2]
+
+
+class RecordBatchBuilder:
+    """Builds one Arrow record batch from rows appended field by field."""
+
+    def __init__(self, columns: Sequence[Tuple[str, str]]) -> None:
+        self.columns = list(columns)
+        self.schema = pa.schema([(name, arrow_type(kind)) for name, kind in self.columns])
+        self._builders = {name: ColumnBuilder(kind) for name, kind in self.columns}
+
+    def __len__(self) -> int:
+        return len(next(iter(self._builders.values())))
+
+    def append(self, *values: Any) -> None:
+        """Appends one row; values are given in column order."""
+        for builder, value in zip(self._builders.values(), values):
+            builder.append(value)
+
+    def finish(self) -> pa.RecordBatch:
+        return pa.RecordBatch.from_arrays(
+            [builder.finish() for builder in self._builders.values()], schema=self.schema
+        )
+
+
+# Telemetry event fields as (attribute, default); JSON keys are the camelCase form. The
+# msgspec `TelemetryEvent` below declares the same fields with their types.
+_EVENT_FIELDS: List[Tuple[str, Any]] = [
+    ("type", ""),
+    ("round", None),
+    ("tick", None),
+    ("player_id", None),
+    ("x", None),
+    ("y", None),
+    ("z", None),
+    ("killer_id", None),
+    ("victim_id", None),
+    ("attacker_id", None),
+    ("assistant_ids", None),
+    ("weapon", None),
+    ("headshot", None),
+    ("amount", None),
+    ("site", None),
+    ("ability", None),
+    ("winning_team_id", None),
+    ("winning_side", None),
+    ("win_type", None),
+    ("team_a_econ", None),
+    ("team_b_econ", None),
+]
+
+
+def _camel(name: str) -> str:
+    head, *rest = name.split("_")
+    return head + "".join(part.capitalize() for part in rest)
+
+
+_ATTR_BY_KEY = {_camel(name): name for name, _ in _EVENT_FIELDS}
+
+
+class _EventAccess:
+    """Dict-style read access by JSON key, so extractors work on decoded dicts or structs."""
+
+    __slots__ = ()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        attr = _ATTR_BY_KEY.get(key)
+        return default if attr is None else getattr(self, attr)
+
+    def __getitem__(self, key: str) -> Any:
+        attr = _ATTR_BY_KEY.get(key)
+        if attr is None:
+            raise KeyError(key)
+        return getattr(self, attr)
+
+
+if msgspec is not None:
+    DECODER_BACKEND = "msgspec"
+
+    class TelemetryEvent(_EventAccess, msgspec.Struct, rename="camel", gc=False):
+        """One telemetry event. Fields not declared here are skipped by the decoder."""
+
+        type: str = ""
+        round: Optional[int] = None
+        tick: Optional[int] = None
+        player_id: Optional[str] = None
+        x: Optional[float] = None
+        y: Optional[float] = None
+        z: Optional[float] = None
+        killer_id: Optional[str] = None
+        victim_id: Optional[str] = None
+        attacker_id: Optional[str] = None
+        assistant_ids: Optional[List[str]] = None
+        weapon: Optional[str] = None
+        headshot: Optional[bool] = None
+        amount: Optional[float] = None
+        site: Optional[str] = None
+        ability: Optional[str] = None
+        winning_team_id: Optional[str] = None
+        winning_side: Optional[str] = None
+        win_type: Optional[str] = None
+        team_a_econ: Optional[str] = None
+        team_b_econ: Optional[str] = None
+
+    class Telemetry(msgspec.Struct, rename="camel", gc=False):
+        """A decoded telemetry document."""
+
+        match_id: Optional[str] = None
+        map_name: Optional[str] = None
+        teams: List[Dict[str, Any]] = []
+        players: List[Dict[str, Any]] = []
+        events: List[TelemetryEvent] = []
+
+    _telemetry_decoder = msgspec.json.Decoder(Telemetry)
+    _events_decoder = msgspec.json.Decoder(List[TelemetryEvent])
+
+else:
+    DECODER_BACKEND = "orjson" if orjson is not None else "json"
+
+    class TelemetryEvent(_EventAccess):  # type: ignore[no-redef]
+        """One telemetry event; keys not listed in `_EVENT_FIELDS` are dropped."""
+
+        __slots__ = tuple(name for name, _ in _EVENT_FIELDS)
+
+        def __init__(self, **fields: Any) -> None:
+            for name, default in _EVENT_FIELDS:
+                setattr(self, name, fields.get(name, default))
+
+    class Telemetry:  # type: ignore[no-redef]
+        """A decoded telemetry document."""
+
+        __slots__ = ("match_id", "map_name", "teams", "players", "events")
+
+        def __init__(
+            self,
+            match_id: Optional[str] = None,
+            map_name: Optional[str] = None,
+            teams: Optional[List[Dict[str, Any]]] = None,
+            players: Optional[List[Dict[str, Any]]] = None,
+            events: Optional[List[TelemetryEvent]] = None,
+        ) -> None:
+            self.match_id = match_id
+            self.map_name = map_name
+            self.teams = teams or []
+            self.players = players or []
+            self.events = events or []
+
+
+def decode_telemetry(data: bytes) -> "Telemetry":
+    """
+    Decodes a whole telemetry document into typed structs with the fastest available
+    backend (see `DECODER_BACKEND`). A bare JSON array is read as the event list.
+    """
+    if msgspec is not None:
+        if data.lstrip()[:1] == b"[":
+            return Telemetry(events=_events_decoder.decode(data))
+        return _telemetry_decoder.decode(data)
+
+    document = orjson.loads(data) if orjson is not None else json.loads(data)
+    if isinstance(document, list):
+        document = {"events": document}
+    return Telemetry(
+        match_id=document.get("matchId"),
+        map_name=document.get("mapName"),
+        teams=document.get("teams"),
+        players=document.get("players"),
+        events=[
+            TelemetryEvent(**{_ATTR_BY_KEY[k]: v for k, v in event.items() if k in _ATTR_BY_KEY})
+            for event in document.get("events") or []
+        ],
+    )
+
+
+def telemetry_metadata(telemetry: "Telemetry") -> Dict[str, Any]:
+    """Top-level fields of a decoded document, keyed as in the JSON."""
+    return {
+        "matchId": telemetry.match_id,
+        "mapName": telemetry.map_name,
+        "teams": telemetry.teams,
+        "players": telemetry.players,
+    }
@@ -0,0 +1,48 @@
+import io
+import json
+from typing import Any, Dict, Optional, Sequence
+
+import pytest
+
+from src.ingest.replay import synthetic_telemetry
+from src.parsers.valorant.match_parser import MatchParser
+
+
+class SyntheticMatch:
+    """
+    A `synthetic_telemetry` document, encoded and parsed the way a downloaded artifact is.
+    `data` and `parse` read `telemetry` as it is when called, so tests may edit it first.
+    """
+
+    def __init__(self, telemetry: Dict[str, Any]) -> None:
+        self.telemetry = telemetry
+
+    @property
+    def data(self) -> bytes:
+        return json.dumps(self.telemetry).encode()
+
+    def stream(self) -> io.BytesIO:
+        return io.BytesIO(self.data)
+
+    def parse(self, parser: Optional[MatchParser] = None, columnar: bool = True) -> Dict[str, Any]:
+        """Parses the document with `parse_match_batches`, or `parse_match_stream`."""
+        parser = parser or MatchParser()
+        if columnar:
+            return parser.parse_match_batches(self.stream())
+        return parser.parse_match_stream(self.stream())
+
+
+@pytest.fixture
+def synthetic_match():
+    """Factory for `SyntheticMatch`es; arguments are those of `synthetic_telemetry`."""
+
+    def make(
+        match_id: str = "m1",
+        map_name: str = "Ascent",
+        team_ids: Sequence[str] = ("a", "b"),
+        rounds: int = 3,
+        seed: int = 0,
+    ) -> SyntheticMatch:
+        return SyntheticMatch(synthetic_telemetry(match_id, map_name, team_ids, rounds, seed))
+
+    return make
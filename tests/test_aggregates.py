@@ -0,0 +1,59 @@
+from datetime import datetime
+
+import pytest
+
+from src.db.duckdb_client import DuckDBClient
+from src.db.repositories.reports_repo import ReportsRepository
+
+
+@pytest.fixture
+def match(synthetic_match):
+    def make(i, map_name="Bind", month=1, seed=None):
+        synthetic = synthetic_match(f"m{i}", map_name, ["sen", "fnc"], rounds=6, seed=seed or i)
+        return {
+            **synthetic.parse(columnar=False),
+            "team_id": "sen",
+            "opponent_id": "fnc",
+            "start_time": datetime(2026, month, 1 + i),
+        }
+
+    return make
+
+
+def _snapshot(db):
+    return (
+        db.query("SELECT * FROM team_metrics ORDER BY ALL").to_dict("records"),
+        db.query("SELECT * FROM player_metrics ORDER BY ALL").to_dict("records"),
+    )
+
+
+def test_incremental_refresh_matches_full_rebuild(tmp_path, match):
+    db = DuckDBClient(str(tmp_path / "scouting.db"))
+
+    db.insert_matches([match(0), match(1, "Haven")])
+    db.insert_matches([match(2, month=2), match(3)])
+    # Re-ingesting a match with different data and month moves it between groups.
+    db.insert_matches([match(0, month=3, seed=42)])
+    incremental = _snapshot(db)
+    db.rebuild_aggregates()
+
+    assert incremental == _snapshot(db)
+    assert {row["side"] for row in incremental[0]} == {"attack", "defense"}
+    months = db.query("SELECT DISTINCT month FROM team_metrics WHERE map_name = 'Bind'")
+    assert sorted(m.month for m in months["month"]) == [1, 2, 3]
+
+
+def test_reports_read_aggregates(tmp_path, match):
+    db = DuckDBClient(str(tmp_path / "scouting.db"))
+    matches = [match(0), match(1)]
+    db.insert_matches(matches)
+    reports = ReportsRepository(db)
+
+    team = reports.team_metrics("sen", "Bind")
+    assert list(team["side"]) == ["attack", "defense"]
+    assert team["rounds_played"].sum() == 12
+    won = sum(r["winning_team_id"] == "sen" for m in matches for r in m["rounds"])
+    assert team["rounds_won"].sum() == won
+
+    players = reports.player_metrics("sen")
+    assert players["player_id"].n_unique() == 5 and players["matches"].sum() == 10
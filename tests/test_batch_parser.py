@@ -0,0 +1,100 @@
+import json
+import os
+import threading
+
+import pyarrow as pa
+
+from src.ingest.replay import synthetic_telemetry
+from src.parsers.valorant.batch_parser import parse_many
+
+
+def crashing_opener(path):
+    """Kills the worker outright for `crash` files, like the OOM killer would."""
+    if path.endswith("crash.json"):
+        os._exit(1)
+    if path.endswith("huge.json"):
+        bytearray(2 * 1024**3)
+    return open(path, "rb")
+
+
+def _write_matches(tmp_path, count):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"m{i}.json"
+        telemetry = synthetic_telemetry(f"m{i}", "Bind", ["a", "b"], rounds=2, seed=i)
+        path.write_text(json.dumps(telemetry))
+        paths.append(path)
+    return paths
+
+
+def test_parse_many_keeps_order_and_isolates_bad_artifacts(tmp_path):
+    paths = _write_matches(tmp_path, 4)
+    corrupt = tmp_path / "corrupt.json"
+    corrupt.write_text('{"matchId": "x", "events": [{"type": ')
+    paths.insert(2, corrupt)
+
+    outcomes = list(parse_many(paths, max_workers=2))
+
+    assert [o.index for o in outcomes] == [0, 1, 2, 3, 4]
+    assert [o.ok for o in outcomes] == [True, True, False, True, True]
+    assert outcomes[3].parsed["match_id"] == "m2"
+    assert "JSONDecodeError" in outcomes[2].error
+
+
+def test_parse_many_survives_worker_death_and_memory_cap(tmp_path):
+    paths = _write_matches(tmp_path, 3)
+    for name in ("crash.json", "huge.json"):
+        (tmp_path / name).write_text("{}")
+    paths[1:1] = [tmp_path / "crash.json", tmp_path / "huge.json"]
+
+    outcomes = list(
+        parse_many(
+            paths, max_workers=2, ordered=False, opener=crashing_opener, memory_limit_mb=1024
+        )
+    )
+
+    by_name = {os.path.basename(o.path): o for o in outcomes}
+    assert len(outcomes) == 5
+    assert by_name["crash.json"].error == "worker process died while parsing"
+    assert "MemoryError" in by_name["huge.json"].error
+    assert all(by_name[f"m{i}.json"].ok for i in range(3))
+
+
+def test_parse_many_columnar_returns_batches(tmp_path):
+    (outcome,) = parse_many(_write_matches(tmp_path, 1), max_workers=1, columnar=True)
+
+    assert outcome.parsed["batches"]["kills"].num_rows > 0
+    assert outcome.peak_rss_mb > 0
+
+
+def test_parse_many_serves_cache_hits_without_a_worker(tmp_path):
+    paths = _write_matches(tmp_path, 3)
+    cache_dir = str(tmp_path / "parsed")
+
+    first = list(parse_many(paths, max_workers=2, columnar=True, cache_dir=cache_dir))
+    second = list(parse_many(paths, max_workers=2, columnar=True, cache_dir=cache_dir))
+
+    assert [o.cached for o in first] == [False] * 3
+    assert [o.cached for o in second] == [True] * 3
+    assert [o.parsed["rounds"] for o in second] == [o.parsed["rounds"] for o in first]
+    assert isinstance(second[0].parsed["batches"]["kills"], pa.RecordBatch)
+
+
+def test_parse_many_yields_while_waiting_for_input(tmp_path):
+    paths = _write_matches(tmp_path, 2)
+    first_yielded = threading.Event()
+    waited = []
+
+    def slow_producer():
+        yield paths[0]
+        # The next download is still running; the finished parse must not wait for it.
+        waited.append(first_yielded.wait(timeout=10))
+        yield paths[1]
+
+    outcomes = []
+    for outcome in parse_many(slow_producer(), max_workers=1, ordered=False):
+        outcomes.append(outcome)
+        first_yielded.set()
+
+    assert waited == [True]
+    assert [o.parsed["match_id"] for o in outcomes] == ["m0", "m1"]
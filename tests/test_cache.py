@@ -0,0 +1,96 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.ingest.cache import ArtifactCache, open_artifact
+from src.ingest.downloader import ArtifactDownloader
+from src.ingest.replay import synthetic_telemetry
+
+BODY = b'{"matchId": "m1", "events": []}'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        _Handler.requests_seen.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+
+@pytest.fixture
+def server():
+    _Handler.requests_seen = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+
+
+def test_repeat_fetch_is_conditional_hit(server, tmp_path):
+    cache = ArtifactCache(tmp_path)
+    downloader = ArtifactDownloader()
+
+    first = cache.fetch("artifact-1", f"{server}/a", downloader)
+    second = cache.fetch("artifact-1", f"{server}/a", downloader)
+
+    assert first == second
+    with open_artifact(first) as fh:
+        assert fh.read() == BODY
+    assert _Handler.requests_seen[1]["If-None-Match"] == '"v1"'
+    assert (cache.stats.misses, cache.stats.revalidated) == (1, 1)
+
+
+def test_identical_content_is_stored_once(server, tmp_path):
+    cache = ArtifactCache(tmp_path)
+    downloader = ArtifactDownloader()
+
+    a = cache.fetch("artifact-a", f"{server}/a", downloader)
+    b = cache.fetch("artifact-b", f"{server}/b", downloader)
+
+    assert a == b
+    assert len(list(cache.objects_dir.glob("*/*"))) == 1
+
+
+def test_evicts_least_recently_used_blobs(tmp_path):
+    cache = ArtifactCache(tmp_path / "cache", max_bytes=25, compress=False)
+    for i, name in enumerate(["old", "mid", "new"]):
+        src = tmp_path / name
+        src.write_bytes(name.encode() * 4)
+        entry = cache.put(name, src, sha256=f"{i:02d}{name}")
+        blob = cache.blob_path(entry.sha256)
+        os.utime(blob, (1000 + i, 1000 + i))
+    cache.evict()
+
+    assert cache.get("old") is None
+    assert cache.get("mid") is not None and cache.get("new") is not None
+
+
+def test_compressed_blobs_round_trip_through_trained_dictionary(tmp_path):
+    cache = ArtifactCache(tmp_path / "cache", train_after=4)
+    documents = []
+    for i in range(6):
+        document = json.dumps(synthetic_telemetry(f"m{i}", "Bind", ("a", "b"), rounds=4, seed=i))
+        documents.append(document.encode())
+        src = tmp_path / f"m{i}.json"
+        src.write_bytes(documents[-1])
+        cache.put(f"m{i}", src, sha256=f"{i:064d}")
+
+    assert cache._current_dict_id() is not None
+    assert cache.total_size() < sum(len(d) for d in documents) / 4
+    for i, document in enumerate(documents):
+        with open_artifact(cache.blob_path(cache.get(f"m{i}").sha256)) as fh:
+            assert fh.read() == document
@@ -0,0 +1,109 @@
+import pyarrow as pa
+import pytest
+
+from src.db.duckdb_client import DuckDBClient
+from src.features.player.kda import player_kda
+from src.features.player.opening_duels import opening_duels
+from src.features.utils.columnar import concat_batches
+from src.parsers.valorant.utils import ColumnBuilder
+
+
+@pytest.fixture
+def parse(synthetic_match):
+    def make(match_id="m1", seed=1):
+        synthetic = synthetic_match(match_id, rounds=4, seed=seed)
+        return synthetic.telemetry, synthetic.parse()
+
+    return make
+
+
+def test_column_builder_dictionary_encodes_and_tracks_nulls():
+    column = ColumnBuilder("category")
+    for value in ["Vandal", "Vandal", None, "Sheriff", "Vandal"]:
+        column.append(value)
+    array = column.finish()
+
+    assert pa.types.is_dictionary(array.type)
+    assert array.dictionary.to_pylist() == ["Vandal", "Sheriff"]
+    assert array.to_pylist() == ["Vandal", "Vandal", None, "Sheriff", "Vandal"]
+
+    numbers = ColumnBuilder("float32")
+    for value in [1.5, None, 3.0]:
+        numbers.append(value)
+    assert numbers.finish().to_pylist() == [1.5, None, 3.0]
+
+
+def test_parse_match_batches_builds_typed_tables(parse):
+    telemetry, parsed = parse()
+    batches = parsed["batches"]
+
+    def count(kind):
+        return sum(1 for e in telemetry["events"] if e["type"] == kind)
+
+    assert batches["kills"].num_rows == count("kill")
+    assert batches["damage"].num_rows == count("damage")
+    assert batches["positions"].num_rows == count("position")
+    assert batches["plants"].num_rows == count("plant")
+    assert batches["ability_casts"].num_rows == count("ability_cast")
+    assert pa.types.is_dictionary(batches["kills"].schema.field("weapon").type)
+    assert batches["positions"].schema.field("x").type == pa.float32()
+    assert batches["kills"].column("match_id").unique().to_pylist() == ["m1"]
+
+
+def test_batches_are_queryable_from_duckdb_and_polars(tmp_path, parse):
+    telemetry, parsed = parse()
+    db = DuckDBClient(str(tmp_path / "scouting.db"))
+
+    with db.arrow_views(parsed["batches"]):
+        kills = db.query("SELECT killer_id, count(*) AS n FROM kills GROUP BY killer_id")
+    assert kills["n"].sum() == parsed["batches"]["kills"].num_rows
+
+    stats = player_kda(parsed["batches"]["kills"], parsed["batches"]["damage"])
+    expected = {p["player_id"]: p["kills"] for p in parsed["players"] if p["kills"]}
+    assert dict(zip(stats["player_id"], stats["kills"])) == {
+        **{p: 0 for p in stats["player_id"]},
+        **expected,
+    }
+    openers = opening_duels(parsed["batches"]["kills"])
+    assert openers["first_kills"].sum() == openers["first_deaths"].sum() == 4
+
+
+def test_concat_batches_unifies_dictionaries(parse):
+    _, first = parse("m1", seed=1)
+    _, second = parse("m2", seed=2)
+
+    kills = concat_batches([first["batches"], second["batches"]], "kills")
+
+    assert (
+        kills.num_rows == first["batches"]["kills"].num_rows + second["batches"]["kills"].num_rows
+    )
+    assert sorted(kills.column("match_id").unique().to_pylist()) == ["m1", "m2"]
+
+
+def test_player_kda_adr_counts_only_the_players_matches(parse, synthetic_match):
+    _, first = parse("m1", seed=1)
+    second = synthetic_match("m2", "Bind", ["c", "d"], rounds=6, seed=2).parse()
+    batches = [first["batches"], second["batches"]]
+
+    alone = player_kda(first["batches"]["kills"], first["batches"]["damage"])
+    combined = player_kda(concat_batches(batches, "kills"), concat_batches(batches, "damage"))
+
+    adr = dict(zip(combined["player_id"], combined["adr"]))
+    assert {p: adr[p] for p in alone["player_id"]} == dict(zip(alone["player_id"], alone["adr"]))
+
+
+def test_player_kda_adr_matches_the_parsed_player_stats(synthetic_match):
+    synthetic = synthetic_match("m1", rounds=4, seed=1)
+    # A round without a kill or any damage (e.g. a timeout) doesn't count towards ADR.
+    synthetic.telemetry["events"] += [
+        {"type": "round_start", "round": 5},
+        {"type": "round_end", "round": 5},
+    ]
+    parsed = synthetic.parse()
+
+    stats = player_kda(parsed["batches"]["kills"], parsed["batches"]["damage"])
+
+    expected = {p["player_id"]: p["adr"] for p in parsed["players"]}
+    assert dict(zip(stats["player_id"], stats["adr"])) == pytest.approx(
+        {p: expected[p] for p in stats["player_id"]}
+    )
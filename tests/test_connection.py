@@ -0,0 +1,84 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import pytest
+
+from src.db import connection, duckdb_client
+from src.db.duckdb_client import DuckDBClient
+
+
+@pytest.fixture(autouse=True)
+def _close_databases():
+    yield
+    connection.close_all()
+
+
+def test_clients_share_one_instance_with_per_thread_cursors(tmp_path, monkeypatch):
+    path = str(tmp_path / "scouting.db")
+    setups = []
+    original = duckdb_client.migrate
+    monkeypatch.setattr(duckdb_client, "migrate", lambda conn: setups.append(1) or original(conn))
+
+    first, second = DuckDBClient(path), DuckDBClient(path)
+    assert first.manager is second.manager and len(setups) == 1
+    assert first.conn is second.conn
+
+    def count(_):
+        return threading.get_ident(), first.conn, int(first.query("SELECT 1 AS n")["n"][0])
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(count, range(8)))
+    cursors = {ident: cursor for ident, cursor, _ in results}
+    assert len(set(map(id, cursors.values()))) == len(cursors)
+    assert all(n == 1 for _, _, n in results)
+
+
+def test_read_only_client_shares_writer_and_refuses_writes(tmp_path):
+    path = str(tmp_path / "scouting.db")
+    writer = DuckDBClient(path)
+    reader = DuckDBClient(path, read_only=True)
+
+    writer.set_watermark("t1", datetime(2026, 1, 1, tzinfo=timezone.utc), "s1")
+    assert reader.get_watermark("t1")[1] == "s1"
+    with pytest.raises(PermissionError):
+        reader.set_watermark("t1", datetime(2026, 2, 1, tzinfo=timezone.utc), "s2")
+
+
+def test_read_only_database_cannot_be_reopened_for_writing(tmp_path):
+    path = str(tmp_path / "scouting.db")
+    DuckDBClient(path)
+    connection.close_all()
+
+    reader = DuckDBClient(path, read_only=True)
+    assert reader.manager.read_only
+    assert reader.query("SELECT count(*) AS n FROM matches")["n"][0] == 0
+    with pytest.raises(ValueError):
+        DuckDBClient(path)
+
+
+def test_read_only_client_refuses_writes_through_execute(tmp_path):
+    path = str(tmp_path / "scouting.db")
+    DuckDBClient(path)
+    reader = DuckDBClient(path, read_only=True)
+
+    assert reader.execute("SELECT count(*) FROM matches").fetchall() == [(0,)]
+    for sql in ("DELETE FROM matches", "SELECT 1; DROP TABLE matches"):
+        with pytest.raises(PermissionError):
+            reader.execute(sql)
+
+
+def test_snapshot_is_readable_while_the_writer_stays_open(tmp_path):
+    writer = DuckDBClient(str(tmp_path / "scouting.db"))
+    writer.set_watermark("t1", datetime(2026, 1, 1, tzinfo=timezone.utc), "s1")
+    snapshot = writer.snapshot(tmp_path / "snapshot.db")
+
+    reader = DuckDBClient(str(snapshot), read_only=True)
+    assert reader.manager is not writer.manager
+    assert reader.get_watermark("t1")[1] == "s1"
+    reader.close()
+
+    # Republishing replaces the file; a reader opened afterwards sees the new copy.
+    writer.set_watermark("t1", datetime(2026, 2, 1, tzinfo=timezone.utc), "s2")
+    writer.snapshot(snapshot)
+    assert DuckDBClient(str(snapshot), read_only=True).get_watermark("t1")[1] == "s2"
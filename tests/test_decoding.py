@@ -0,0 +1,66 @@
+import importlib
+import io
+import json
+import sys
+
+import pytest
+
+from src.parsers.valorant import utils
+from src.parsers.valorant.match_parser import MatchParser
+
+
+@pytest.fixture
+def document(synthetic_match):
+    def make(**extra):
+        synthetic = synthetic_match("m1", "Icebox", rounds=3, seed=5)
+        synthetic.telemetry["events"][0].update(extra)
+        return synthetic.telemetry, synthetic.data
+
+    return make
+
+
+@pytest.fixture
+def stdlib_utils(monkeypatch):
+    """`utils` re-imported as if no fast decoder were installed."""
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    module = importlib.reload(utils)
+    yield module
+    monkeypatch.undo()
+    importlib.reload(utils)
+
+
+def _check_decoded(module, document):
+    telemetry, data = document(debug={"frames": list(range(100))})
+
+    decoded = module.decode_telemetry(data)
+
+    assert decoded.match_id == "m1"
+    assert len(decoded.events) == len(telemetry["events"])
+    first = decoded.events[0]
+    assert first.get("round") == telemetry["events"][0]["round"]
+    assert first.get("debug") is None and not hasattr(first, "debug")
+    kill = next(e for e in decoded.events if e.type == "kill")
+    assert kill.get("killerId") == kill.killer_id and kill["victimId"]
+
+    bare = module.decode_telemetry(json.dumps(telemetry["events"]).encode())
+    assert bare.match_id is None and len(bare.events) == len(telemetry["events"])
+
+
+def test_fast_backend_decodes_typed_events_and_skips_unknown_fields(document):
+    _check_decoded(utils, document)
+    msgspec = pytest.importorskip("msgspec")
+    fields = msgspec.structs.fields(utils.TelemetryEvent)
+    assert [(f.name, f.default) for f in fields] == utils._EVENT_FIELDS
+
+
+def test_stdlib_fallback_decodes_the_same_structure(stdlib_utils, document):
+    assert stdlib_utils.DECODER_BACKEND == "json"
+    _check_decoded(stdlib_utils, document)
+
+
+def test_fast_decode_parse_matches_streaming_parse(document):
+    _, data = document()
+    parser = MatchParser()
+
+    assert parser.parse_match_bytes(data) == parser.parse_match_stream(io.BytesIO(data))
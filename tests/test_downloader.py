@@ -0,0 +1,102 @@
+import gzip
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.ingest.downloader import ArtifactDownloader, DownloadError
+
+PAYLOAD = b'{"events": [' + b",".join(b'{"type": "kill"}' for _ in range(5000)) + b"]}"
+GZIPPED = gzip.compress(PAYLOAD)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    drop_first = True
+    etag = '"v1"'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        body = GZIPPED
+        start = 0
+        if_range = self.headers.get("If-Range")
+        if self.headers.get("Range") and if_range in (None, _Handler.etag):
+            start = int(self.headers["Range"].split("=")[1].rstrip("-"))
+            if start >= len(body):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(body)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        else:
+            self.send_response(200)
+        self.send_header("ETag", _Handler.etag)
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+        if _Handler.drop_first:
+            # Simulate a dropped connection halfway through the first transfer.
+            _Handler.drop_first = False
+            self.wfile.write(body[start : start + len(body) // 2])
+            self.wfile.flush()
+            self.connection.close()
+            return
+        self.wfile.write(body[start:])
+
+
+@pytest.fixture
+def server():
+    _Handler.drop_first = True
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}/artifact"
+    httpd.shutdown()
+
+
+def test_download_resumes_and_decodes_gzip(server, tmp_path):
+    downloader = ArtifactDownloader(chunk_size=256)
+    digest = hashlib.sha256(PAYLOAD).hexdigest()
+
+    result = downloader.download(
+        server, tmp_path / "a.json", expected_size=len(PAYLOAD), expected_sha256=digest
+    )
+
+    assert result.resumed and result.attempts == 2
+    assert (tmp_path / "a.json").read_bytes() == PAYLOAD
+    assert not (tmp_path / "a.json.part").exists()
+
+
+def test_download_rejects_checksum_mismatch(server, tmp_path):
+    _Handler.drop_first = False
+    with pytest.raises(DownloadError):
+        ArtifactDownloader().download(server, tmp_path / "a.json", expected_sha256="00")
+    assert not (tmp_path / "a.json").exists()
+
+
+def test_complete_part_from_an_earlier_run_is_still_decoded(server, tmp_path):
+    _Handler.drop_first = False
+    (tmp_path / "a.json.part").write_bytes(GZIPPED)
+    (tmp_path / "a.json.part.json").write_text(json.dumps({"etag": '"v1"', "encoding": "gzip"}))
+
+    result = ArtifactDownloader().download(server, tmp_path / "a.json")
+
+    assert result.resumed and (tmp_path / "a.json").read_bytes() == PAYLOAD
+    assert not (tmp_path / "a.json.part.json").exists()
+
+
+@pytest.mark.parametrize("info", [None, {"etag": '"v0"', "encoding": "gzip"}])
+def test_part_that_cannot_be_validated_is_not_resumed(server, tmp_path, info):
+    _Handler.drop_first = False
+    (tmp_path / "a.json.part").write_bytes(b"stale bytes")
+    if info is not None:
+        (tmp_path / "a.json.part.json").write_text(json.dumps(info))
+
+    ArtifactDownloader().download(server, tmp_path / "a.json")
+
+    assert (tmp_path / "a.json").read_bytes() == PAYLOAD
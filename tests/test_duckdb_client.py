@@ -0,0 +1,93 @@
+from datetime import datetime
+
+import pytest
+
+from src.db.duckdb_client import DuckDBClient
+
+
+def _match(match_id, kills=10, rounds=3):
+    return {
+        "match_id": match_id,
+        "team_id": "t1",
+        "opponent_id": "t2",
+        "map_name": "Bind",
+        "start_time": datetime(2026, 1, 5, 18, 0),
+        "rounds": [
+            {"round_number": n, "winning_side": "attack", "win_type": "elimination"}
+            for n in range(1, rounds + 1)
+        ],
+        "players": [
+            {"player_id": "p1", "kills": kills, "deaths": 7, "assists": 2, "adr": 150.5},
+            {"player_id": "p2", "kills": 4, "deaths": 9, "assists": 6, "adr": 90.0},
+        ],
+    }
+
+
+def test_insert_matches_bulk_loads_and_upserts(tmp_path):
+    db = DuckDBClient(str(tmp_path / "scouting.db"))
+
+    db.insert_matches([_match("m1"), _match("m2"), _match("m1", kills=12)])
+    db.insert_matches([_match("m2", kills=20, rounds=2)])
+
+    counts = db.query(
+        "SELECT (SELECT count(*) FROM matches) AS matches, "
+        "(SELECT count(*) FROM rounds) AS rounds, "
+        "(SELECT count(*) FROM player_stats) AS players"
+    ).iloc[0]
+    assert (counts["matches"], counts["rounds"], counts["players"]) == (2, 5, 4)
+    kills = db.query(
+        "SELECT match_id, kills FROM player_stats WHERE player_id = 'p1' ORDER BY match_id"
+    )
+    assert kills["kills"].tolist() == [12, 20]
+    assert db.query("SELECT start_time FROM matches LIMIT 1")["start_time"][0].year == 2026
+    db.insert_matches([])
+
+
+def test_reloading_a_match_drops_rounds_and_players_it_no_longer_has(tmp_path):
+    db = DuckDBClient(str(tmp_path / "scouting.db"))
+    db.insert_matches([_match("m0"), _match("m1")])
+
+    shrunk = _match("m0", rounds=1)
+    shrunk["players"] = shrunk["players"][:1]
+    db.insert_matches([shrunk])
+
+    assert db.fetchall("SELECT match_id, count(*) FROM rounds GROUP BY 1 ORDER BY 1") == [
+        ("m0", 1),
+        ("m1", 3),
+    ]
+    assert db.fetchall("SELECT player_id FROM player_stats WHERE match_id = 'm0'") == [("p1",)]
+
+
+def test_failing_before_commit_rolls_back_the_load(tmp_path):
+    db = DuckDBClient(str(tmp_path / "scouting.db"))
+
+    def fail(matches):
+        raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        db.insert_matches([_match("m1")], before_commit=fail)
+    assert db.fetchall("SELECT count(*) FROM matches") == [(0,)]
+    assert db.fetchall("SELECT count(*) FROM team_metrics") == [(0,)]
+
+
+def test_arrow_and_polars_results_match_pandas(tmp_path):
+    db = DuckDBClient(str(tmp_path / "scouting.db"))
+    db.insert_matches([_match("m1"), _match("m2", kills=3)])
+    sql = "SELECT match_id, kills, adr FROM player_stats WHERE player_id = ? ORDER BY match_id"
+
+    arrow = db.query_arrow(sql, ["p1"])
+    frame = db.query_polars(sql, ["p1"])
+
+    assert arrow.column("kills").to_pylist() == [10, 3]
+    assert frame["kills"].to_list() == db.query(sql, ["p1"])["kills"].tolist()
+    assert frame["adr"].dtype.is_float()
+
+
+def test_parameterized_statements_are_parsed_once(tmp_path):
+    db = DuckDBClient(str(tmp_path / "scouting.db"))
+    sql = "SELECT count(*) AS n FROM matches WHERE team_id = ?"
+
+    first = db.manager.statement(sql)
+    assert db.query(sql, ["t1"])["n"][0] == 0
+    assert db.manager.statement(sql) is first
+    assert db.manager.statement("SELECT 1; SELECT 2") is None
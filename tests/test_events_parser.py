@@ -0,0 +1,59 @@
+import io
+import json
+
+import pytest
+
+from src.parsers.valorant.events_parser import TelemetryStream, iter_rounds, stream_events
+from src.parsers.valorant.match_parser import MatchParser
+
+
+@pytest.fixture
+def match(synthetic_match):
+    return synthetic_match("m1", "Ascent", rounds=3, seed=1)
+
+
+def test_stream_matches_full_decode_with_tiny_chunks(match):
+    telemetry = match.telemetry
+    stream = TelemetryStream(match.stream(), chunk_size=7)
+
+    assert list(stream.events()) == telemetry["events"]
+    assert stream.metadata["matchId"] == "m1"
+    assert stream.metadata["players"] == telemetry["players"]
+
+
+def test_stream_accepts_bare_arrays_and_json_lines():
+    events = [{"type": "kill", "round": 1, "x": 1.5e3}, {"type": "round_end", "round": 1}]
+    lines = "\n".join(json.dumps(e) for e in events) + "\n"
+
+    assert list(stream_events(io.StringIO(json.dumps(events)), chunk_size=3)) == events
+    assert list(stream_events(io.StringIO(lines), chunk_size=3)) == events
+    assert list(stream_events(io.StringIO("[]"))) == []
+
+
+def test_stream_rejects_malformed_documents():
+    with pytest.raises(ValueError):
+        list(stream_events(io.StringIO('{"events": [{"round": 1} {"round": 2}]}')))
+
+
+def test_iter_rounds_groups_consecutive_events(match):
+    rounds = list(iter_rounds(match.telemetry["events"]))
+
+    assert [number for number, _ in rounds] == [1, 2, 3]
+    assert all(e["round"] == number for number, batch in rounds for e in batch)
+
+
+def test_parse_match_stream_agrees_with_in_memory_parse(match):
+    telemetry = match.telemetry
+    parser = MatchParser()
+
+    streamed = parser.parse_match_stream(match.stream(), chunk_size=64)
+    decoded = parser.parse_match_telemetry(telemetry)
+
+    assert streamed["match_id"] == decoded["match_id"] == "m1"
+    assert streamed["rounds"] == decoded["rounds"]
+    assert len(streamed["rounds"]) == 3
+    key = lambda p: p["player_id"]  # noqa: E731
+    assert sorted(streamed["players"], key=key) == sorted(decoded["players"], key=key)
+    assert sum(p["kills"] for p in decoded["players"]) == sum(
+        1 for e in telemetry["events"] if e["type"] == "kill"
+    )
@@ -0,0 +1,80 @@
+from datetime import datetime
+
+import pyarrow as pa
+import pytest
+
+from src.db.duckdb_client import DuckDBClient
+from src.db.repositories.events_repo import EventsRepository
+
+
+@pytest.fixture
+def store(tmp_path, synthetic_match):
+    def make(count=12):
+        repo = EventsRepository(DuckDBClient(str(tmp_path / "scouting.db")), tmp_path / "events")
+        for i in range(count):
+            parsed = synthetic_match(f"m{i}", ("Bind", "Haven")[i % 2]).parse()
+            parsed.update(
+                team_id=("sen", "fnc")[i // 6], start_time=datetime(2026, 1 + i % 4, 1 + i)
+            )
+            repo.write_match(parsed)
+        return repo
+
+    return make
+
+
+def test_write_match_lays_out_hive_partitions(tmp_path, store):
+    repo = store()
+
+    files = repo.files("kills")
+    assert len(files) == 12
+    relative = files[0].relative_to(tmp_path / "events" / "kills").parts
+    assert [part.split("=")[0] for part in relative[:3]] == ["map", "team", "month"]
+
+    table = repo.query("kills", map_name="Bind", team_id="sen")
+    assert set(table.column("match_id").to_pylist()) == {"m0", "m2", "m4"}
+    assert set(table.column("map").to_pylist()) == {"Bind"}
+
+
+def test_team_events_reads_only_the_last_matches(store):
+    repo = store()
+
+    assert repo.recent_match_ids("sen", "Bind", limit=2) == [("m2", "2026-03"), ("m4", "2026-01")]
+    table = repo.team_events("kills", "sen", "Bind", last_n=2, columns="match_id, month")
+    assert set(table.column("match_id").to_pylist()) == {"m2", "m4"}
+
+    plan = repo.db.conn.execute(
+        f"EXPLAIN ANALYZE SELECT * FROM {repo.scan('kills')} "
+        "WHERE team = 'sen' AND map = 'Bind' AND month = '2026-01'"
+    ).fetchall()[0][1]
+    assert "Total Files Read: 2" in plan
+
+
+def test_rewriting_a_match_replaces_its_files(store, synthetic_match):
+    repo = store(count=2)
+    before = repo.query("kills").num_rows
+
+    parsed = synthetic_match("m0", "Bind").parse()
+    parsed.update(team_id="sen", start_time=datetime(2026, 1, 1))
+    repo.write_match(parsed)
+
+    assert repo.query("kills").num_rows == before
+    assert repo.team_events("kills", "nobody").num_rows == 0
+
+
+def test_matches_are_filed_under_both_teams(tmp_path, synthetic_match):
+    repo = EventsRepository(DuckDBClient(str(tmp_path / "scouting.db")), tmp_path / "events")
+    parsed = synthetic_match("m0", "Bind").parse()
+    kills = parsed["batches"]["kills"].num_rows
+    # Parse-cache hits hand over tables rather than record batches.
+    parsed["batches"] = {name: pa.table(batch) for name, batch in parsed["batches"].items()}
+    parsed.update(team_id="sen", opponent_id="fnc", start_time=datetime(2026, 1, 1))
+    repo.write_match(parsed)
+
+    assert len(repo.files("kills", team_id="sen")) == len(repo.files("kills", team_id="fnc")) == 1
+    assert repo.team_events("kills", "fnc").num_rows == kills
+    assert repo.query("kills", map_name="Bind").num_rows == kills
+
+    parsed.update(opponent_id="prx")
+    repo.write_match(parsed)
+    assert repo.files("kills", team_id="fnc") == []
+    assert repo.query("kills").num_rows == kills
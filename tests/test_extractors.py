@@ -0,0 +1,81 @@
+import pytest
+
+from src.parsers.valorant.extractors import EXTRACTORS, EventDispatcher, EventExtractor
+from src.parsers.valorant.match_parser import MatchParser
+
+
+class PlantSites(EventExtractor):
+    name = "plant_sites"
+    event_types = ("plant",)
+
+    def __init__(self):
+        self.seen = []
+
+    def on_event(self, event):
+        self.seen.append(event["type"])
+
+    def finish(self, metadata):
+        return {"match_id": metadata["matchId"], "count": len(self.seen), "types": set(self.seen)}
+
+
+class EventCount(EventExtractor):
+    name = "event_count"
+
+    def __init__(self):
+        self.count = 0
+
+    def on_event(self, event):
+        self.count += 1
+
+    def finish(self, metadata):
+        return self.count
+
+
+@pytest.fixture
+def match(synthetic_match):
+    return synthetic_match("m1", "Split", rounds=6, seed=4)
+
+
+@pytest.fixture
+def telemetry(match):
+    return match.telemetry
+
+
+def test_dispatcher_routes_events_by_type(telemetry):
+    plants, everything = PlantSites(), EventCount()
+    dispatcher = EventDispatcher([plants, everything])
+
+    for event in telemetry["events"]:
+        dispatcher.dispatch(event, telemetry)
+    result = dispatcher.finish(telemetry)
+
+    expected = sum(1 for e in telemetry["events"] if e["type"] == "plant")
+    assert result["plant_sites"]["count"] == expected
+    assert result["plant_sites"]["types"] <= {"plant"}
+    assert result["event_count"] == len(telemetry["events"])
+
+
+def test_parser_runs_registered_extractors_in_one_pass(match, telemetry, monkeypatch):
+    monkeypatch.setitem(EXTRACTORS, "plant_sites", PlantSites)
+    parser = MatchParser(extractors=("rounds", "plant_sites"))
+
+    streamed = match.parse(parser, columnar=False)
+    decoded = parser.parse_match_telemetry(telemetry)
+
+    assert set(streamed) == {"match_id", "map_name", "rounds", "plant_sites"}
+    assert streamed["plant_sites"]["match_id"] == "m1"
+    assert streamed["plant_sites"] == decoded["plant_sites"]
+    assert len(streamed["rounds"]) == 6
+
+
+def test_unknown_extractor_is_rejected():
+    with pytest.raises(ValueError, match="nope"):
+        MatchParser(extractors=("rounds", "nope"))
+
+
+def test_rounds_leave_unknown_winning_side_null():
+    extractor = EXTRACTORS["rounds"]()
+    extractor.on_event({"type": "round_end", "round": 1, "winningTeamId": "t1"})
+
+    (row,) = extractor.finish({})
+    assert (row["winning_side"], row["winning_team_id"]) == (None, "t1")
@@ -0,0 +1,163 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from src.ingest.grid_client import GridClient, parse_start_time
+from src.ingest.response_cache import ResponseCache
+
+
+def test_get_match_details_many_preserves_order_and_bounds_concurrency(monkeypatch):
+    client = GridClient(
+        api_key="test", max_concurrency=3, batch_size=1, response_cache=ResponseCache()
+    )
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_details(match_id):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return {"id": match_id}
+
+    monkeypatch.setattr(client, "_fetch_match_details", fake_details)
+    series = [{"matches": [{"id": f"m{i}"}, {"id": f"m{i}b"}]} for i in range(5)]
+
+    details = client.get_match_details_for_series(series)
+
+    assert [d["id"] for d in details] == [m["id"] for s in series for m in s["matches"]]
+    assert 1 < peak <= 3
+
+
+def test_batched_match_details_falls_back_for_failed_aliases(monkeypatch):
+    client = GridClient(api_key="test", batch_size=3, response_cache=ResponseCache())
+    queries = []
+
+    def fake_execute(query, variables):
+        queries.append(variables)
+        if "matchId" in variables:
+            return {"data": {"match": {"id": variables["matchId"], "retried": True}}}
+        return {
+            "data": {"m0": {"id": variables["m0"]}, "m1": None, "m2": {"id": variables["m2"]}},
+            "errors": [{"message": "not found", "path": ["m1"]}],
+        }
+
+    monkeypatch.setattr(client, "_execute_query", fake_execute)
+
+    details = client.get_match_details_many(["a", "b", "c"])
+
+    assert [d["id"] for d in details] == ["a", "b", "c"]
+    assert details[1]["retried"] is True
+    assert len(queries) == 2
+
+
+def test_concurrent_batches_share_requests_per_match(monkeypatch):
+    client = GridClient(api_key="test", batch_size=3, response_cache=ResponseCache())
+    requested = []
+
+    def fake_execute(query, variables):
+        requested.append(sorted(variables.values()))
+        time.sleep(0.05)
+        return {"data": {alias: {"id": match_id} for alias, match_id in variables.items()}}
+
+    monkeypatch.setattr(client, "_execute_query", fake_execute)
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(client.get_match_details_many(["a", "b", "c"]))
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert requested == [["a", "b", "c"]]
+    assert len(results) == 4 and all([d["id"] for d in r] == ["a", "b", "c"] for r in results)
+
+
+@pytest.mark.parametrize("status, split", [(400, True), (429, False), (503, False)])
+def test_failed_batch_is_split_only_when_the_document_is_rejected(monkeypatch, status, split):
+    client = GridClient(api_key="test", batch_size=3, response_cache=ResponseCache())
+    singles = []
+
+    def fake_execute(query, variables):
+        if "matchId" in variables:
+            singles.append(variables["matchId"])
+            return {"data": {"match": {"id": variables["matchId"]}}}
+        response = requests.Response()
+        response.status_code = status
+        raise requests.HTTPError(f"{status} error", response=response)
+
+    monkeypatch.setattr(client, "_execute_query", fake_execute)
+
+    if split:
+        assert [d["id"] for d in client.get_match_details_batch(["a", "b"])] == ["a", "b"]
+    else:
+        with pytest.raises(requests.HTTPError):
+            client.get_match_details_batch(["a", "b"])
+    assert singles == (["a", "b"] if split else [])
+
+
+def test_get_series_for_team_pages_until_watermark(monkeypatch):
+    client = GridClient(api_key="test", response_cache=ResponseCache())
+    pages = {
+        None: (["2024-05-03T00:00:00Z", "2024-05-02T00:00:00Z"], "c1"),
+        "c1": (["2024-05-01T12:00:00Z", "2024-04-30T00:00:00Z"], "c2"),
+    }
+    seen_cursors = []
+
+    def fake_execute(query, variables):
+        cursor = variables.get("after")
+        seen_cursors.append(cursor)
+        times, end_cursor = pages[cursor]
+        return {
+            "data": {
+                "series": {
+                    "pageInfo": {"hasNextPage": True, "endCursor": end_cursor},
+                    "nodes": [{"id": t, "startTime": t} for t in times],
+                }
+            }
+        }
+
+    monkeypatch.setattr(client, "_execute_query", fake_execute)
+
+    series = client.get_series_for_team(
+        "team", count=None, since=parse_start_time("2024-05-01T00:00:00Z"), page_size=2
+    )
+
+    assert [s["id"] for s in series] == [
+        "2024-05-03T00:00:00Z",
+        "2024-05-02T00:00:00Z",
+        "2024-05-01T12:00:00Z",
+    ]
+    assert seen_cursors == [None, "c1"]
+
+
+def test_get_series_for_team_breaks_watermark_ties_by_series_id(monkeypatch):
+    client = GridClient(api_key="test", response_cache=ResponseCache())
+    nodes = [
+        {"id": series_id, "startTime": start}
+        for series_id, start in [
+            ("s9", "2024-05-02T00:00:00Z"),
+            ("s3", "2024-05-01T00:00:00Z"),
+            ("s2", "2024-05-01T00:00:00Z"),
+            ("s1", "2024-05-01T00:00:00Z"),
+            ("s0", "2024-04-30T00:00:00Z"),
+        ]
+    ]
+    page = {"pageInfo": {"hasNextPage": False}, "nodes": nodes}
+    monkeypatch.setattr(client, "_execute_query", lambda q, v: {"data": {"series": page}})
+
+    series = client.get_series_for_team(
+        "team", count=None, since=parse_start_time("2024-05-01T00:00:00Z"), since_id="s2"
+    )
+
+    assert [s["id"] for s in series] == ["s9", "s3"]
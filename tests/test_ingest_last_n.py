@@ -0,0 +1,21 @@
+from scripts.ingest_last_n import watermark_before
+from src.ingest.grid_client import parse_start_time
+
+
+def _series(series_id, start, *match_ids):
+    return {"id": series_id, "startTime": start, "matches": [{"id": m} for m in match_ids]}
+
+
+def test_watermark_stops_before_the_oldest_series_to_retry():
+    series = [
+        _series("s3", "2026-01-03T00:00:00Z", "m5"),
+        _series("s1", "2026-01-01T00:00:00Z", "m1", "m2"),
+        _series("s2", "2026-01-02T00:00:00Z", "m3", "m4"),
+    ]
+
+    assert watermark_before(series, set()) == (parse_start_time("2026-01-03T00:00:00Z"), "s3")
+    assert watermark_before(series, {"m4", "m5"}) == (
+        parse_start_time("2026-01-01T00:00:00Z"),
+        "s1",
+    )
+    assert watermark_before(series, {"m2"}) is None
@@ -0,0 +1,71 @@
+import importlib
+import sys
+
+import pytest
+
+from src.parsers.valorant import match_view
+from src.parsers.valorant.match_parser import MatchParser
+
+
+@pytest.fixture
+def telemetry_bytes(synthetic_match):
+    def make(rounds=5):
+        synthetic = synthetic_match("m1", "Bind", rounds=rounds, seed=3)
+        return synthetic.telemetry, synthetic.data
+
+    return make
+
+
+@pytest.fixture(params=["msgspec", "json"])
+def view_module(request, monkeypatch):
+    if request.param == "msgspec":
+        yield match_view
+        return
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    yield importlib.reload(match_view)
+    monkeypatch.undo()
+    importlib.reload(match_view)
+
+
+def test_view_indexes_rounds_and_decodes_them_on_demand(view_module, telemetry_bytes):
+    telemetry, data = telemetry_bytes()
+    view = view_module.MatchView(data, MatchParser(), cache_size=2)
+
+    assert view.match_id == "m1" and view.map_name == "Bind"
+    assert view.round_numbers == [1, 2, 3, 4, 5]
+    assert view.decoded_rounds == 0
+
+    third = view.round(3)
+    expected = [e for e in telemetry["events"] if e.get("round") == 3]
+    assert [e.type for e in third] == [e["type"] for e in expected]
+    assert third[-1].get("winningSide") == expected[-1]["winningSide"]
+
+    view.round(3)
+    view.round(1)
+    view.round(2)  # evicts round 3
+    assert view.decoded_rounds == 3
+    view.round(3)
+    assert view.decoded_rounds == 4
+
+    with pytest.raises(KeyError):
+        view.round(99)
+
+
+def test_view_summary_matches_full_parse(telemetry_bytes):
+    _, data = telemetry_bytes()
+    parser = MatchParser()
+
+    view = parser.view_match_bytes(data)
+
+    assert view.summary() == parser.parse_match_bytes(data)
+    assert view.decoded_rounds == 0
+
+
+def test_open_match_reads_a_file(tmp_path, telemetry_bytes):
+    _, data = telemetry_bytes(rounds=2)
+    path = tmp_path / "telemetry.json"
+    path.write_bytes(data)
+
+    view = MatchParser().open_match(path)
+
+    assert len(view) == 2 and view.round(2)[0].get("round") == 2
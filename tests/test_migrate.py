@@ -0,0 +1,92 @@
+from datetime import datetime
+
+import duckdb
+import pytest
+
+from src.db import migrate
+from src.db.duckdb_client import DuckDBClient
+
+
+def _versions(conn):
+    return [v for (v,) in conn.execute("SELECT version FROM schema_version ORDER BY 1").fetchall()]
+
+
+def test_new_database_is_created_at_the_latest_version(tmp_path):
+    db = DuckDBClient(str(tmp_path / "scouting.db"))
+
+    latest = migrate.discover_migrations()[-1].version
+    assert _versions(db.conn) == list(range(1, latest + 1))
+    indexes = {
+        name for (name,) in db.conn.execute("SELECT index_name FROM duckdb_indexes()").fetchall()
+    }
+    assert {"matches_team_map_time", "player_stats_player"} <= indexes
+    assert migrate.migrate(db.conn) == []
+
+
+def test_unversioned_database_is_upgraded_in_place(tmp_path):
+    path = tmp_path / "legacy.db"
+    conn = duckdb.connect(str(path))
+    conn.execute(migrate.BASELINE.read_text())
+    conn.execute("INSERT INTO matches (match_id, team_id) VALUES ('m1', 'sen')")
+    conn.execute("INSERT INTO player_stats VALUES ('m1', 'p1', 10, 5, 2, 140.0)")
+    conn.close()
+
+    db = DuckDBClient(str(path))
+
+    assert _versions(db.conn)[-1] == migrate.discover_migrations()[-1].version
+    row = db.query("SELECT match_id, kills, agent FROM player_stats").iloc[0]
+    assert (row["match_id"], row["kills"], row["agent"]) == ("m1", 10, None)
+    # The aggregate tables added by the upgrade already cover the existing rows.
+    assert db.fetchall("SELECT player_id, matches, kills FROM player_metrics") == [("p1", 1, 10)]
+
+
+def test_migrate_stops_at_target_and_resumes(tmp_path):
+    conn = duckdb.connect(str(tmp_path / "scouting.db"))
+
+    assert migrate.migrate(conn, target=1) == [1]
+    assert conn.execute(
+        "SELECT count(*) FROM duckdb_tables() WHERE table_name = 'team_metrics'"
+    ).fetchone() == (0,)
+    assert migrate.migrate(conn)[0] == 2
+
+
+def test_discover_rejects_gaps(tmp_path):
+    (tmp_path / "003_skipped.sql").write_text("SELECT 1;")
+    with pytest.raises(ValueError):
+        migrate.discover_migrations(tmp_path)
+
+
+def test_recluster_sorts_tables_by_team_map_and_time(tmp_path):
+    db = DuckDBClient(str(tmp_path / "scouting.db"))
+    batches = [
+        [("m1", "sen", "Bind", 3), ("m3", "sen", "Ascent", 2)],
+        [("m2", "fnc", "Bind", 1)],
+    ]
+    for rows in batches:
+        db.insert_matches(
+            [
+                {
+                    "match_id": match_id,
+                    "team_id": team,
+                    "map_name": map_name,
+                    "start_time": datetime(2026, 1, day),
+                    "rounds": [{"round_number": 2}, {"round_number": 1}],
+                }
+                for match_id, team, map_name, day in rows
+            ]
+        )
+    # Each batch is loaded sorted, but appended after the earlier ones.
+    assert db.query("SELECT match_id FROM matches")["match_id"].tolist() == ["m3", "m1", "m2"]
+    assert db.fetchall("SELECT round_number FROM rounds WHERE match_id = 'm1'") == [(1,), (2,)]
+
+    db.recluster()
+
+    assert db.query("SELECT match_id FROM matches")["match_id"].tolist() == ["m2", "m3", "m1"]
+    assert db.query("SELECT match_id FROM rounds")["match_id"].tolist() == [
+        "m2",
+        "m2",
+        "m3",
+        "m3",
+        "m1",
+        "m1",
+    ]
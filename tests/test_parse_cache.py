@@ -0,0 +1,65 @@
+import hashlib
+import json
+
+import pyarrow as pa
+
+from src.ingest.replay import synthetic_telemetry
+from src.parsers.valorant.match_parser import MatchParser
+from src.parsers.valorant.parse_cache import ParseCache, content_hash
+
+
+class CountingParser(MatchParser):
+    def __init__(self, cache):
+        super().__init__(cache=cache)
+        self.parses = 0
+
+    def _parse_stream(self, *args, **kwargs):
+        self.parses += 1
+        return super()._parse_stream(*args, **kwargs)
+
+
+def _artifact(tmp_path, seed=0):
+    path = tmp_path / f"match-{seed}.json"
+    telemetry = synthetic_telemetry(f"m{seed}", "Lotus", ["a", "b"], rounds=3, seed=seed)
+    path.write_text(json.dumps(telemetry))
+    return path
+
+
+def test_content_hash_uses_content_address_names(tmp_path):
+    path = _artifact(tmp_path)
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+
+    assert content_hash(path) == digest
+    assert content_hash(tmp_path / f"{digest}.zst") == digest
+
+
+def test_hits_skip_parsing_and_are_memory_mapped(tmp_path):
+    path = _artifact(tmp_path)
+    parser = CountingParser(ParseCache(tmp_path / "parsed"))
+
+    first = parser.parse_file(path)
+    allocated = pa.total_allocated_bytes()
+    second = parser.parse_file(path)
+
+    assert parser.parses == 1
+    assert pa.total_allocated_bytes() == allocated
+    assert second["rounds"] == first["rounds"]
+    assert second["players"] == first["players"]
+    assert second["batches"]["kills"].to_pylist() == first["batches"]["kills"].to_pylist()
+    assert {type(batch) for batch in second["batches"].values()} == {pa.RecordBatch}
+    assert "batches" not in parser.parse_file(path, with_batches=False)
+
+
+def test_version_bump_invalidates_and_prune_removes_old_entries(tmp_path, monkeypatch):
+    path = _artifact(tmp_path)
+    cache = ParseCache(tmp_path / "parsed")
+    parser = CountingParser(cache)
+    parser.parse_file(path)
+
+    monkeypatch.setattr(MatchParser, "VERSION", MatchParser.VERSION + 1)
+    parser.parse_file(path)
+    parser.parse_file(path)
+
+    assert parser.parses == 2
+    assert len(cache.prune(MatchParser.VERSION)) == 1
+    assert cache.get(content_hash(path), MatchParser.VERSION) is not None
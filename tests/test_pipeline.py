@@ -0,0 +1,106 @@
+import io
+import os
+
+from src.db.duckdb_client import DuckDBClient
+from src.db.repositories.events_repo import EventsRepository
+from src.ingest import pipeline
+from src.ingest.cache import ArtifactCache, open_artifact
+from src.ingest.grid_client import GridClient
+from src.ingest.pipeline import IngestPipeline
+from src.ingest.rate_limiter import AdaptiveRateLimiter
+from src.ingest.replay import ReplayStore, StandInServer, build_synthetic_store
+
+
+def crashing_opener(path):
+    """Kills the worker parsing one match outright, like the OOM killer would."""
+    data = open_artifact(path).read()
+    if b'"team-s0-m1"' in data:
+        os._exit(1)
+    return io.BytesIO(data)
+
+
+def _run(tmp_path, series_count=3, **kwargs):
+    store = ReplayStore(tmp_path / "replay")
+    build_synthetic_store(store, "team", series_count=series_count, maps_per_series=2)
+    db = DuckDBClient(str(tmp_path / "db" / "scouting.db"))
+    with StandInServer(store) as server:
+        with GridClient(
+            api_key="replay",
+            base_url=server.graphql_url,
+            cache=ArtifactCache(tmp_path / "cache"),
+            rate_limiter=AdaptiveRateLimiter(rate=100.0, max_rate=100.0),
+        ) as client:
+            matches = client.get_match_details_for_series(client.get_series_for_team("team"))
+            return IngestPipeline(client, db, **kwargs).run("team", matches)
+
+
+def test_pipeline_loads_matches_and_isolates_failures(tmp_path):
+    store = ReplayStore(tmp_path / "replay")
+    build_synthetic_store(store, "team", series_count=3, maps_per_series=2)
+    store.artifact_path("team-s1-m0-telemetry").unlink()
+    db = DuckDBClient(str(tmp_path / "db" / "scouting.db"))
+
+    with StandInServer(store) as server:
+        with GridClient(
+            api_key="replay",
+            base_url=server.graphql_url,
+            cache=ArtifactCache(tmp_path / "cache"),
+            rate_limiter=AdaptiveRateLimiter(rate=100.0, max_rate=100.0),
+        ) as client:
+            matches = client.get_match_details_for_series(client.get_series_for_team("team"))
+            events = EventsRepository(db, tmp_path / "events")
+            result = IngestPipeline(
+                client, db, parse_workers=2, load_batch_size=2, events=events
+            ).run("team", matches)
+
+    assert result.loaded == 5
+    assert [match_id for match_id, _ in result.failed] == ["team-s1-m0"]
+    assert result.stages["parse"].items == 5
+    assert db.query("SELECT count(*) AS n FROM matches")["n"][0] == 5
+    assert len(events.files("kills", team_id="team")) == 5
+    # Each match is also filed under its opponent.
+    assert len(events.files("kills")) == 10
+
+
+def test_rerun_from_parse_cache_writes_events(tmp_path):
+    store = ReplayStore(tmp_path / "replay")
+    build_synthetic_store(store, "team", series_count=2, maps_per_series=1)
+    db = DuckDBClient(str(tmp_path / "db" / "scouting.db"))
+    events = EventsRepository(db, tmp_path / "events")
+
+    with StandInServer(store) as server:
+        with GridClient(
+            api_key="replay",
+            base_url=server.graphql_url,
+            cache=ArtifactCache(tmp_path / "cache"),
+            rate_limiter=AdaptiveRateLimiter(rate=100.0, max_rate=100.0),
+        ) as client:
+            matches = client.get_match_details_for_series(client.get_series_for_team("team"))
+            pipeline = IngestPipeline(
+                client, db, parse_workers=1, parse_cache_dir=str(tmp_path / "parsed"), events=events
+            )
+            results = [pipeline.run("team", matches) for _ in range(2)]
+
+    # The second run's parses are cache hits (Arrow tables read back from disk).
+    assert [(r.loaded, r.failed) for r in results] == [(2, []), (2, [])]
+    assert events.query("kills").num_rows > 0
+
+
+def test_worker_death_fails_only_its_match(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline, "open_artifact", crashing_opener)
+
+    result = _run(tmp_path, series_count=6, parse_workers=1)
+
+    assert result.failed == [("team-s0-m1", "parse: worker process died while parsing")]
+    assert result.loaded == 11
+
+
+def test_matches_without_telemetry_are_reported_as_skipped(tmp_path):
+    db = DuckDBClient(str(tmp_path / "db" / "scouting.db"))
+    with GridClient(api_key="test") as client:
+        result = IngestPipeline(client, db, parse_workers=1).run(
+            "team", [{"id": "m1", "artifacts": [{"id": "a1", "type": "replay"}]}]
+        )
+
+    assert (result.loaded, result.failed) == (0, [])
+    assert result.skipped == [("m1", "no telemetry artifact")]
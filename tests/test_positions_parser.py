@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from src.features.player.positioning import position_heatmap
+from src.parsers.valorant.positions_parser import (
+    Trajectory,
+    TrajectoryStore,
+    trajectories_from_batch,
+)
+
+
+@pytest.fixture
+def positions(synthetic_match):
+    synthetic = synthetic_match("m1", "Haven", rounds=2, seed=3)
+    return synthetic.telemetry, synthetic.parse()["batches"]["positions"]
+
+
+def test_trajectories_are_split_per_round_and_player(positions):
+    telemetry, batch = positions
+
+    trajectories = trajectories_from_batch(batch)
+
+    assert len(trajectories) == 2 * 10
+    path = trajectories[(2, "a-p0")]
+    samples = [e for e in telemetry["events"] if e.get("playerId") == "a-p0" and e["round"] == 2]
+    samples = [e for e in samples if e["type"] == "position"]
+    assert path.ticks.dtype == np.int32 and path.x.dtype == np.float32
+    assert path.ticks.tolist() == [e["tick"] for e in samples]
+    assert np.allclose(path.x, [e["x"] for e in samples])
+
+
+def test_simplify_keeps_corners_and_resample_is_fixed_rate():
+    # An L-shaped walk sampled every 10 ticks: 11 points east, then 10 points north.
+    x = [float(i) for i in range(11)] + [10.0] * 10
+    y = [0.0] * 11 + [float(i) for i in range(1, 11)]
+    path = Trajectory(np.arange(0, 210, 10), x, y)
+
+    simplified = path.simplify(tolerance=0.5)
+    assert list(zip(simplified.x, simplified.y)) == [(0, 0), (10, 0), (10, 10)]
+
+    resampled = simplified.resample(25)
+    assert np.all(np.diff(resampled.ticks) == 25)
+    assert resampled.x[2] == 5.0 and resampled.y[2] == 0.0
+
+
+def test_store_round_trips_through_memory_map(tmp_path, positions):
+    _, batch = positions
+    trajectories = trajectories_from_batch(batch)
+    store = TrajectoryStore(tmp_path / "m1")
+
+    store.save(trajectories)
+    loaded = store.load()
+
+    assert loaded.keys() == trajectories.keys()
+    assert isinstance(loaded[(1, "b-p4")].x.base, np.memmap)
+    for key, path in trajectories.items():
+        assert np.array_equal(loaded[key].ticks, path.ticks)
+        assert np.array_equal(loaded[key].y, path.y)
+
+    counts, _, _ = position_heatmap(loaded.values(), bins=8, extent=((-5000, 5000),) * 2)
+    assert counts.sum() == batch.num_rows
@@ -0,0 +1,51 @@
+from datetime import datetime
+
+from scripts import slow_queries
+from src.db.duckdb_client import DuckDBClient
+from src.db.query_log import QueryLog
+from src.db.repositories.reports_repo import ReportsRepository
+
+
+def test_query_log_records_caller_rows_and_slow_profiles(tmp_path, capsys):
+    log = QueryLog(tmp_path / "log", slow_ms=0.0)
+    db = DuckDBClient(str(tmp_path / "scouting.db"), query_log=log)
+    db.insert_matches(
+        [{"match_id": "m1", "team_id": "sen", "start_time": datetime(2026, 1, 1), "rounds": []}]
+    )
+
+    ReportsRepository(db).team_metrics("sen")
+    ReportsRepository(db).team_metrics("sen")
+    assert db.fetchall("SELECT match_id FROM matches") == [("m1",)]
+    db.execute("UPDATE matches SET score = '13-7'")
+
+    entries = log.entries()
+    assert [e["caller"] for e in entries[:2]] == ["reports_repo:ReportsRepository.team_metrics"] * 2
+    assert entries[2]["rows"] == 1 and entries[2]["caller"].endswith(
+        "test_query_log_records_caller_rows_and_slow_profiles"
+    )
+    assert entries[0]["params"] == ["'sen'"]
+    profile = entries[0]["profile"]
+    assert profile and "team_metrics" in open(profile).read()
+    # Statements with side effects are never re-run to profile them.
+    assert entries[3]["rows"] is None and entries[3]["profile"] is None
+
+    grouped = {g["sql"]: g for g in log.top(10, by_query=True)}
+    assert grouped[entries[0]["sql"]]["count"] == 2
+
+    slow_queries.main(["--log-dir", str(tmp_path / "log"), "--top", "2"])
+    assert "rows" in capsys.readouterr().out
+
+
+def test_profiling_leaves_the_callers_result_intact(tmp_path):
+    log = QueryLog(tmp_path / "log", slow_ms=0.0)
+    db = DuckDBClient(str(tmp_path / "scouting.db"), query_log=log)
+    db.set_watermark("sen", datetime(2026, 1, 1), "s1")
+
+    assert db.execute("SELECT ? AS answer", [42]).fetchall() == [(42,)]
+    assert db.get_watermark("sen")[1] == "s1"
+    assert log.entries()[-1]["profile"]
+
+
+def test_query_log_is_off_by_default(tmp_path):
+    db = DuckDBClient(str(tmp_path / "scouting.db"))
+    assert db.query_log is None and db.fetchall("SELECT 1") == [(1,)]
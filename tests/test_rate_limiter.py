@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+from src.ingest.rate_limiter import AdaptiveRateLimiter, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _response(status, headers=None):
+    return SimpleNamespace(status_code=status, headers=headers or {}, close=lambda: None)
+
+
+def test_acquire_paces_requests_to_rate():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(rate=2.0, burst=1.0, clock=clock, sleep=clock.sleep)
+
+    for _ in range(5):
+        limiter.acquire()
+
+    assert clock.now == 2.0
+    assert limiter.stats.requests == 5
+
+
+def test_call_honours_retry_after_and_backs_off_rate():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(rate=4.0, clock=clock, sleep=clock.sleep)
+    responses = iter([_response(429, {"Retry-After": "3"}), _response(200)])
+
+    response = limiter.call(lambda: next(responses))
+
+    stats = limiter.stats
+    assert response.status_code == 200
+    assert 3 in clock.sleeps
+    assert (stats.throttled, stats.retries) == (1, 1)
+    assert stats.current_rate < 4.0
+
+
+def test_parse_retry_after_accepts_seconds_and_dates():
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
@@ -0,0 +1,27 @@
+from src.ingest.cache import ArtifactCache
+from src.ingest.grid_client import GridClient
+from src.ingest.rate_limiter import AdaptiveRateLimiter
+from src.ingest.replay import ReplayStore, StandInServer, build_synthetic_store
+
+
+def test_stand_in_serves_recorded_store_through_grid_client(tmp_path):
+    store = ReplayStore(tmp_path / "replay")
+    build_synthetic_store(store, "team", series_count=3, maps_per_series=2)
+    limiter = AdaptiveRateLimiter(rate=100.0, max_rate=100.0, min_rate=50.0, base_backoff=0.01)
+
+    with StandInServer(store, error_rate=0.3, retry_after=0.01, seed=1) as server:
+        with GridClient(
+            api_key="replay",
+            base_url=server.graphql_url,
+            batch_size=4,
+            cache=ArtifactCache(tmp_path / "cache"),
+            rate_limiter=limiter,
+        ) as client:
+            series = client.get_series_for_team("team", count=3, page_size=2)
+            matches = client.get_match_details_for_series(series)
+            paths = client.download_artifacts([m["artifacts"][0] for m in matches])
+
+    assert len(series) == 3 and len(matches) == 6
+    assert all(path.stat().st_size > 0 for path in paths)
+    assert server.errors_injected > 0
+    assert limiter.stats.retries == server.errors_injected
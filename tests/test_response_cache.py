@@ -0,0 +1,71 @@
+import threading
+import time
+
+from src.ingest.grid_client import GridClient
+from src.ingest.response_cache import ResponseCache, SingleFlight, TTLCache
+
+
+def test_ttl_cache_expires_entries():
+    now = [0.0]
+    cache = TTLCache(ttl=10, clock=lambda: now[0])
+    cache.set("k", 1)
+
+    now[0] = 9.9
+    assert cache.get("k") == 1
+    now[0] = 10.0
+    assert cache.get("k") is None
+
+
+def test_concurrent_identical_requests_share_one_call(monkeypatch):
+    client = GridClient(api_key="test", response_cache=ResponseCache())
+    calls = []
+
+    def fake_execute(query, variables):
+        calls.append(variables)
+        time.sleep(0.05)
+        return {"data": {"series": {"nodes": [{"id": "s1", "startTime": None}]}}}
+
+    monkeypatch.setattr(client, "_execute_query", fake_execute)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(client.get_series_for_team("team")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 8 and all(r == [{"id": "s1", "startTime": None}] for r in results)
+    results[0][0]["id"] = "mutated"
+    assert client.get_series_for_team("team")[0]["id"] == "s1"
+    assert len(calls) == 1
+
+
+def test_single_flight_many_waits_on_keys_already_in_flight():
+    flights = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow(keys):
+        calls.append(keys)
+        started.set()
+        release.wait()
+        return [k.upper() for k in keys]
+
+    first = threading.Thread(target=lambda: flights.do_many(["a", "b"], slow))
+    first.start()
+    started.wait()
+    results = []
+    second = threading.Thread(
+        target=lambda: results.append(flights.do_many(["b", "c"], lambda ks: [k * 2 for k in ks]))
+    )
+    second.start()
+    time.sleep(0.05)
+    release.set()
+    first.join()
+    second.join()
+
+    assert calls == [["a", "b"]]
+    assert results == [["B", "cc"]]